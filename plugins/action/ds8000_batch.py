@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible.errors import AnsibleActionFail
+from ansible.module_utils.six import string_types
+from ansible.plugins.action import ActionBase
+
+COLLECTION_PREFIX = 'ibm.ds8000.'
+NO_ACTION = 'none'
+# For each module that can be batched: the list parameter that the items are merged into, the returned list that holds
+# the outcome of each element of that parameter, the key of the element in that list, and when the items can be merged.
+BATCH_PARAMETERS = {
+    'ds8000_volume': dict(
+        parameter='id',
+        result_key=None,
+        result_id=None,
+        can_merge=lambda args: args.get('state') == 'absent',
+    ),
+    'ds8000_volume_mapping': dict(
+        parameter='volume_id',
+        result_key='volume_mappings',
+        result_id='volume_id',
+        can_merge=lambda args: not args.get('volume_name'),
+    ),
+    'ds8000_host_port': dict(
+        parameter='host_port',
+        result_key='host_ports',
+        result_id='wwpn',
+        can_merge=lambda args: not args.get('exclusive'),
+    ),
+}
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = False
+    _supports_async = False
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        common_args = dict(self._task.args)
+        module_name = common_args.pop('module', None)
+        items = common_args.pop('items', None)
+        if not isinstance(module_name, string_types) or module_name.replace(COLLECTION_PREFIX, '', 1) not in BATCH_PARAMETERS:
+            raise AnsibleActionFail("module must be one of {modules}.".format(modules=', '.join(sorted(BATCH_PARAMETERS))))
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise AnsibleActionFail("items must be a list of dictionaries of module arguments.")
+
+        module_name = module_name.replace(COLLECTION_PREFIX, '', 1)
+        batch = BATCH_PARAMETERS[module_name]
+        item_args = []
+        for item in items:
+            args = dict(common_args)
+            args.update(item)
+            item_args.append(args)
+
+        results = [None] * len(items)
+        for indexes, module_args in self._merge_items(item_args, batch):
+            module_result = self._execute_module(module_name=COLLECTION_PREFIX + module_name, module_args=module_args, task_vars=task_vars)
+            for index in indexes:
+                item_result = self._split_result(module_result, item_args[index], batch) if len(indexes) > 1 else dict(module_result)
+                item_result.update(item=items[index], ansible_loop_var='item')
+                results[index] = item_result
+
+        # The same shape as the result of a task with a loop.
+        result['results'] = results
+        result['changed'] = any(item_result.get('changed') for item_result in results)
+        if any(item_result.get('failed') for item_result in results):
+            result['failed'] = True
+            result['msg'] = 'One or more items failed'
+        else:
+            result['msg'] = 'All items completed'
+        return result
+
+    def _merge_items(self, item_args, batch):
+        # Items that differ only by the batched parameter are merged into one module call, in the order of their first item.
+        # Returns a list of (item indexes, module arguments).
+        merged = []
+        merged_by_key = {}
+        for index, args in enumerate(item_args):
+            if batch['parameter'] not in args or not batch['can_merge'](args):
+                merged.append(([index], args))
+                continue
+            other_args = dict((key, value) for key, value in args.items() if key != batch['parameter'])
+            key = json.dumps(other_args, sort_keys=True, default=str)
+            if key not in merged_by_key:
+                merged_by_key[key] = ([], dict(other_args, **{batch['parameter']: []}))
+                merged.append(merged_by_key[key])
+            indexes, module_args = merged_by_key[key]
+            indexes.append(index)
+            module_args[batch['parameter']].extend(to_list(args[batch['parameter']]))
+        return merged
+
+    def _split_result(self, module_result, args, batch):
+        item_result = dict(module_result)
+        if batch['result_key'] and batch['result_key'] in module_result:
+            element_ids = set(normalize_element_id(element_id) for element_id in to_list(args[batch['parameter']]))
+            outcomes = [outcome for outcome in module_result[batch['result_key']] if outcome[batch['result_id']] in element_ids]
+            item_result[batch['result_key']] = outcomes
+            if not module_result.get('failed'):
+                item_result['changed'] = any(outcome['action'] != NO_ACTION for outcome in outcomes)
+        return item_result
+
+
+def to_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def normalize_element_id(element_id):
+    # Host port WWPNs are returned normalized, volume IDs are left as they are.
+    return element_id.replace(':', '').upper()
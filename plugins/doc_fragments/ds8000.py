@@ -42,3 +42,42 @@ requirements:
   - pyds8k >= 1.5.0
   - python >= 3.6
 '''
+
+    # Parameters for IBM DS8000 modules that fan out REST calls
+    CONCURRENCY = r'''
+options:
+  max_workers:
+    description:
+    - The maximum number of REST calls that are run concurrently against the DS8000 storage system HMC.
+    - Set to C(1) to run all the REST calls one after the other.
+    type: int
+    default: 8
+'''
+
+    # Parameters for IBM DS8000 modules that can cache REST listings
+    CACHE = r'''
+options:
+  cache_ttl:
+    description:
+    - The number of seconds a cached REST listing stays valid.
+    - Set to C(0) to disable the cache.
+    type: int
+    default: 0
+  cache_dir:
+    description:
+    - The directory where the cached REST listings are stored.
+    - The cache files are keyed by the I(hostname) of the DS8000 storage system HMC.
+    - The modules that change objects invalidate the cached listings in this directory, so they must use the same I(cache_dir)
+      as the modules that read the listings, for example through the C(group/ibm.ds8000.ds8000) module defaults.
+    type: path
+    default: ~/.ansible/tmp/ds8000_cache
+  static_cache_ttl:
+    description:
+    - The number of seconds the cached pool and managed array listings stay valid.
+    - These listings rarely change, so they are cached separately from the other listings, typically for a day or more.
+    - They are keyed by the serial number of the DS8000 storage system, so that all its HMCs share them.
+    - The cached pool listing is invalidated when M(ibm.ds8000.ds8000_volume) creates or deletes volumes.
+    - Set to C(0) to disable the cache.
+    type: int
+    default: 0
+'''
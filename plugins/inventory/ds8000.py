@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+name: ds8000
+short_description: DS8000 hosts and volumes inventory source
+description:
+  - Build an inventory from the hosts and volumes of a DS8000 storage system.
+  - The DS8000 hosts are added to the C(ds8000_hosts) group and to a C(host_type_<hosttype>) group.
+  - The volumes are added, as C(volume_<id>), to the C(ds8000_volumes) group and to a C(pool_<pool>) group that holds the pool details as group variables.
+  - Both are added to a C(resource_group_<resource group>) group, when the DS8000 storage system reports their resource group.
+  - The fields of each DS8000 object are set as host variables prefixed with C(ds8000_).
+  - Uses a YAML configuration file that ends with C(ds8000.yml) or C(ds8000.yaml).
+version_added: "1.2.0"
+author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
+options:
+  plugin:
+    description: The name of this plugin, it should always be set to C(ibm.ds8000.ds8000) for this plugin to recognize it as its own.
+    required: true
+    type: str
+    choices: [ ibm.ds8000.ds8000 ]
+  objects:
+    description:
+      - The DS8000 objects to add to the inventory.
+    type: list
+    elements: str
+    choices: [ hosts, volumes ]
+    default: [ hosts, volumes ]
+  incremental_refresh:
+    description:
+      - When the inventory is read from the cache, refresh it incrementally instead of using it as is.
+      - The hosts and pools are listed again, but the volumes are listed again only for the pools whose capacity changed
+        since the inventory was cached.
+      - Volume changes that do not change the pool capacity, such as a rename, are picked up by the next full refresh.
+    type: bool
+    default: true
+  full_refresh_interval:
+    description:
+      - The number of seconds after which an incremental refresh lists the volumes of all the pools again.
+    type: int
+    default: 86400
+extends_documentation_fragment:
+  - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - constructed
+  - inventory_cache
+notes:
+  - I(hostname), I(username) and I(password) can be templates, such as an C(ansible.builtin.env) lookup of the password.
+  - Use C(--flush-cache) to rebuild the inventory from a full scan of the DS8000 storage system.
+'''
+
+EXAMPLES = r'''
+# ds8000.yml
+plugin: ibm.ds8000.ds8000
+hostname: ds8000.example.com
+username: admin
+password: "{{ lookup('ansible.builtin.env', 'DS8000_PASSWORD') }}"
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/tmp/ds8000_inventory
+cache_timeout: 86400
+keyed_groups:
+  - key: ds8000_stgtype
+    prefix: stgtype
+    separator: "_"
+groups:
+  large_volumes: ds8000_cap is defined and ds8000_cap | int > 1099511627776
+'''
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import DEFAULT_MAX_WORKERS, get_member_resource_group
+
+try:
+    from pyds8k.client.ds8k.v1.client import Client
+
+    HAS_PYDS8K = True
+except ImportError:
+    HAS_PYDS8K = False
+
+HOSTS = 'hosts'
+VOLUMES = 'volumes'
+VOLUME_HOSTNAME_PREFIX = 'volume_'
+# The pool fields that change when volumes are created, deleted or resized in the pool.
+POOL_CHANGE_KEYS = ['capalloc', 'capavail', 'real_capacity_allocated_on_ese', 'virtual_capacity_allocated_on_ese']
+REPR_KEYS_TO_DELETE = ['link', 'eserep', 'tserep', 'volumes', 'hosts', 'flashcopy', 'pprc', 'ioports', 'host_ports', 'mappings']
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'ibm.ds8000.ds8000'
+
+    def verify_file(self, path):
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(('ds8000.yml', 'ds8000.yaml'))
+        return False
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+
+        if not HAS_PYDS8K:
+            raise AnsibleError('The ibm.ds8000.ds8000 inventory plugin requires the pyds8k python library.')
+
+        cache_key = self.get_cache_key(path)
+        snapshot = None
+        if self.get_option('cache') and cache:
+            try:
+                snapshot = self._cache[cache_key]
+            except KeyError:
+                pass
+
+        if snapshot is None or self.get_option('incremental_refresh'):
+            snapshot = self._refresh(snapshot)
+            if self.get_option('cache'):
+                self._cache[cache_key] = snapshot
+
+        self._populate(snapshot)
+
+    def _connect(self):
+        # The connection options may be templates, such as an env lookup of the password.
+        return Client(
+            service_address=self.templar.template(self.get_option('hostname')),
+            user=self.templar.template(self.get_option('username')),
+            password=self.templar.template(self.get_option('password')),
+            port=self.get_option('port'),
+            verify=self.get_option('validate_certs'),
+        )
+
+    def _refresh(self, snapshot):
+        # The hosts and the pools are listed on every refresh, the volumes of a pool only when the pool changed
+        # or when the last full refresh is too old.
+        client = self._connect()
+        now = int(time.time())
+        full_refresh = not snapshot or now - snapshot['full_refresh_time'] > self.get_option('full_refresh_interval')
+        refreshed = dict(full_refresh_time=now if full_refresh else snapshot['full_refresh_time'], hosts=[], pools={}, volumes_by_pool={})
+
+        try:
+            if HOSTS in self.get_option('objects'):
+                refreshed['hosts'] = [self._get_representation(host) for host in client.get_hosts()]
+            if VOLUMES in self.get_option('objects'):
+                refreshed['pools'] = dict((pool.id, self._get_representation(pool)) for pool in client.get_pools())
+        except Exception as generic_exc:
+            raise AnsibleError("Failed to list the DS8000 objects. ERR: {error}".format(error=to_native(generic_exc)))
+
+        stale_pool_ids = []
+        for pool_id, pool in refreshed['pools'].items():
+            if full_refresh or pool_id not in snapshot['volumes_by_pool'] or self._has_pool_changed(snapshot['pools'].get(pool_id), pool):
+                stale_pool_ids.append(pool_id)
+            else:
+                refreshed['volumes_by_pool'][pool_id] = snapshot['volumes_by_pool'][pool_id]
+
+        def get_volumes_by_pool(pool_id):
+            try:
+                return pool_id, [self._get_representation(volume) for volume in client.get_volumes_by_pool(pool_id=pool_id)], None
+            except Exception as generic_exc:
+                return pool_id, None, generic_exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.get_option('max_workers') or DEFAULT_MAX_WORKERS, len(stale_pool_ids) or 1))) as executor:
+            for pool_id, volumes, error in executor.map(get_volumes_by_pool, stale_pool_ids):
+                if error:
+                    raise AnsibleError("Failed to get the volumes of pool {pool_id}. ERR: {error}".format(pool_id=pool_id, error=to_native(error)))
+                refreshed['volumes_by_pool'][pool_id] = volumes
+
+        self.display.vvv("ds8000 inventory: listed the volumes of {count} of {total} pools".format(count=len(stale_pool_ids), total=len(refreshed['pools'])))
+        return refreshed
+
+    def _has_pool_changed(self, cached_pool, pool):
+        return not cached_pool or any(cached_pool.get(key) != pool.get(key) for key in POOL_CHANGE_KEYS)
+
+    def _get_representation(self, ds8000_object):
+        representation = dict(ds8000_object.representation)
+        for key in REPR_KEYS_TO_DELETE:
+            representation.pop(key, None)
+        return representation
+
+    def _populate(self, snapshot):
+        strict = self.get_option('strict')
+
+        if HOSTS in self.get_option('objects'):
+            self.inventory.add_group('ds8000_hosts')
+            for host in snapshot['hosts']:
+                inventory_hostname = self.inventory.add_host(host['name'], group='ds8000_hosts')
+                self._add_to_group('host_type', host.get('hosttype'), inventory_hostname)
+                self._add_to_group('resource_group', get_member_resource_group(host), inventory_hostname)
+                self._set_host_vars(inventory_hostname, host, strict)
+
+        if VOLUMES in self.get_option('objects'):
+            self.inventory.add_group('ds8000_volumes')
+            self.inventory.add_group('ds8000_pools')
+            for pool_id, pool in snapshot['pools'].items():
+                group = self.inventory.add_group(self._sanitize_group_name('pool_' + pool_id))
+                self.inventory.add_child('ds8000_pools', group)
+                for key, value in pool.items():
+                    self.inventory.set_variable(group, 'ds8000_pool_' + key, value)
+                for volume in snapshot['volumes_by_pool'].get(pool_id, []):
+                    inventory_hostname = self.inventory.add_host(VOLUME_HOSTNAME_PREFIX + volume['id'], group='ds8000_volumes')
+                    self.inventory.add_child(group, inventory_hostname)
+                    self._add_to_group('resource_group', get_member_resource_group(volume), inventory_hostname)
+                    self._set_host_vars(inventory_hostname, volume, strict)
+
+    def _add_to_group(self, prefix, value, inventory_hostname):
+        if value:
+            group = self.inventory.add_group(self._sanitize_group_name('{prefix}_{value}'.format(prefix=prefix, value=value)))
+            self.inventory.add_child(group, inventory_hostname)
+
+    def _set_host_vars(self, inventory_hostname, representation, strict):
+        for key, value in representation.items():
+            self.inventory.set_variable(inventory_hostname, 'ds8000_' + key, value)
+        hostvars = self.inventory.get_host(inventory_hostname).get_vars()
+        self._set_composite_vars(self.get_option('compose'), hostvars, inventory_hostname, strict=strict)
+        self._add_host_to_composed_groups(self.get_option('groups'), hostvars, inventory_hostname, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option('keyed_groups'), hostvars, inventory_hostname, strict=strict)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+name: ds8000
+short_description: Resolve DS8000 volume IDs and LUN IDs
+description:
+  - Resolve the IDs of the volumes with a given name, or the LUN ID of a volume mapped to a host.
+  - The volume listing and the volume mappings of each host are fetched once per HMC and reused by the following lookups,
+    so repeated lookups, such as inside a loop, do not make extra REST calls.
+version_added: "1.2.0"
+author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
+options:
+  _terms:
+    description:
+      - The volume names when I(query=volume_ids), or the volume IDs when I(query=lunid).
+    type: list
+    elements: str
+    required: true
+  query:
+    description:
+      - C(volume_ids) returns the list of the IDs of the volumes named after each term.
+      - C(lunid) returns the LUN ID of each volume ID term on I(host).
+    type: str
+    choices: [ volume_ids, lunid ]
+    default: volume_ids
+  host:
+    description:
+      - The DS8000 host that the volumes are mapped to.
+      - Required when I(query=lunid).
+    type: str
+extends_documentation_fragment:
+  - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
+notes:
+  - The results are reused within the Ansible process that templates the task, which covers all the items of a loop.
+    Set I(cache_ttl) to also reuse them across tasks. The cached volume listing and volume mappings are the ones of the modules,
+    so they are invalidated when M(ibm.ds8000.ds8000_volume) or M(ibm.ds8000.ds8000_volume_mapping) change them.
+'''
+
+EXAMPLES = r'''
+- name: map every volume named data_vol to a host
+  ibm.ds8000.ds8000_volume_mapping:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    name: host_name_test
+    volume_id: "{{ lookup('ibm.ds8000.ds8000', 'data_vol', hostname=ds8000_host, username=ds8000_username, password=ds8000_password) }}"
+
+- name: print the LUN ID of some volumes on a host
+  ansible.builtin.debug:
+    msg: "{{ item }} is LUN {{ lookup('ibm.ds8000.ds8000', item, query='lunid', host='host_name_test',
+                                      hostname=ds8000_host, username=ds8000_username, password=ds8000_password) }}"
+  loop:
+    - "1000"
+    - "1001"
+'''
+
+RETURN = r'''
+_raw:
+  description:
+    - With I(query=volume_ids), a list of volume IDs for each term.
+    - With I(query=lunid), the LUN ID of each term.
+  type: list
+  elements: raw
+'''
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.lookup import LookupBase
+from ansible.utils.display import Display
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ALL_VOLUMES_CACHE_KEY, VOLUME_MAPPING_MATRIX_CACHE_KEY
+
+try:
+    import pyds8k.exceptions
+except ImportError:
+    pass
+
+display = Display()
+
+VOLUME_IDS = 'volume_ids'
+LUNID = 'lunid'
+# The resolvers of this process, keyed by HMC, with the results they have memoized.
+_RESOLVERS = {}
+
+
+class LookupModuleAdapter(object):
+    '''The part of AnsibleModule that Ds8000ManagerBase uses, raising AnsibleError instead of exiting.'''
+
+    check_mode = False
+
+    def __init__(self, params):
+        self.params = params
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleError(to_native(msg))
+
+    def log(self, msg, **kwargs):
+        display.vvvv(msg)
+
+    def warn(self, warning):
+        display.warning(warning)
+
+
+class Ds8000Resolver(Ds8000ManagerBase):
+    def __init__(self, module):
+        super(Ds8000Resolver, self).__init__(module)
+        self.memo = {}
+
+    def get_volume_ids(self, volume_name):
+        volumes = self._get_memoized(ALL_VOLUMES_CACHE_KEY, self.get_all_volumes)
+        volume_ids = self._filter_volume_ids_by_name(volumes, volume_name)
+        if not volume_ids:
+            raise AnsibleError("Unable to find volume name {volume_name} on the DS8000 storage system.".format(volume_name=volume_name))
+        return volume_ids
+
+    def get_lunid(self, host_name, volume_id):
+        volume_mappings = self._get_memoized((VOLUME_MAPPING_MATRIX_CACHE_KEY, host_name), self._get_mappings_by_host, host_name)
+        for volume_map in volume_mappings:
+            if volume_map['volume_id'] == volume_id:
+                return volume_map['lunid']
+        raise AnsibleError(
+            "Volume {volume_id} is not mapped to host {host_name} on the DS8000 storage system.".format(volume_id=volume_id, host_name=host_name)
+        )
+
+    def _get_mappings_by_host(self, host_name):
+        # The mapping matrix cached by ds8000_volume_mapping_info holds every host.
+        mapping_matrix = self.cache.get(VOLUME_MAPPING_MATRIX_CACHE_KEY)
+        if mapping_matrix is not None and host_name in mapping_matrix:
+            return mapping_matrix[host_name]
+        try:
+            return [dict(volume_id=volume_map.volume, lunid=volume_map.lunid) for volume_map in self.client.get_mappings_by_host(host_name=host_name)]
+        except pyds8k.exceptions.NotFound:
+            raise AnsibleError("Unable to find host {host_name} on the DS8000 storage system.".format(host_name=host_name))
+        except Exception as generic_exc:
+            raise AnsibleError(
+                "Failed to get the volume mappings of host {host_name} on the DS8000 storage system. ERR: {error}".format(
+                    host_name=host_name, error=to_native(generic_exc)
+                )
+            )
+
+    def _get_memoized(self, key, function, *args):
+        if key not in self.memo:
+            self.memo[key] = function(*args)
+        return self.memo[key]
+
+
+class LookupModule(LookupBase):
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        query = self.get_option('query')
+        if query == LUNID and not self.get_option('host'):
+            raise AnsibleError("host is required when query is lunid.")
+
+        resolver = self._get_resolver()
+        if query == LUNID:
+            return [resolver.get_lunid(self.get_option('host'), term) for term in terms]
+        return [resolver.get_volume_ids(term) for term in terms]
+
+    def _get_resolver(self):
+        params = dict(
+            (option, self.get_option(option))
+            for option in ('hostname', 'username', 'password', 'port', 'validate_certs', 'max_workers', 'cache_ttl', 'cache_dir', 'static_cache_ttl')
+        )
+        resolver_key = (params['hostname'], params['port'], params['username'])
+        resolver = _RESOLVERS.get(resolver_key)
+        if resolver is None or resolver.params != params:
+            resolver = Ds8000Resolver(LookupModuleAdapter(params))
+            _RESOLVERS[resolver_key] = resolver
+        return resolver
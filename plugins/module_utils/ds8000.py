@@ -9,7 +9,12 @@ __metaclass__ = type
 
 import abc
 import json
+import os
+import re
+import tempfile
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils import six
 from ansible.module_utils.basic import missing_required_lib
@@ -32,6 +37,65 @@ except ImportError:
 DEFAULT_BASE_URL = '/api/v1'
 PRESENT = 'present'
 ABSENT = 'absent'
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_CACHE_DIR = '~/.ansible/tmp/ds8000_cache'
+VOLUME_MAPPING_MATRIX_CACHE_KEY = 'volume_mapping_matrix'
+ALL_VOLUMES_CACHE_KEY = 'all_volumes'
+HOST_PORTS_BY_HOST_CACHE_KEY = 'host_ports_by_host'
+# Pools and marrays rarely change, they are cached per storage system serial number with their own, longer, ttl.
+POOLS_CACHE_KEY = 'pools'
+MARRAYS_CACHE_KEY = 'marrays'
+SYSTEM_SERIAL_CACHE_KEY = 'system_serial'
+SYSTEM_SERIAL_CACHE_TTL = 30 * 86400
+STATIC_CACHE_NAMESPACE_PREFIX = 'serial_'
+DEFAULT_RESOURCE_GROUP_ID = 'RG0'
+# The key holding the resource group of a volume, host or lss, depending on the DS8000 code level.
+MEMBER_RESOURCE_GROUP_KEYS = ['resource_group', 'resgrp']
+AUTH_TOKEN_HEADER = 'X-Auth-Token'
+
+
+class Ds8000ResultCache(object):
+    '''File backed cache of REST listings, shared by the modules that run against the same DS8000 storage system.'''
+
+    def __init__(self, cache_dir, namespace, ttl=0):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.namespace = re.sub(r'[^A-Za-z0-9_.-]', '_', namespace)
+        self.ttl = ttl
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, '{namespace}__{key}.json'.format(namespace=self.namespace, key=re.sub(r'[^A-Za-z0-9_.-]', '_', key)))
+
+    def get(self, key):
+        if not self.ttl:
+            return None
+        try:
+            with open(self._path(key)) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if time.time() - entry.get('timestamp', 0) > self.ttl:
+            return None
+        return entry.get('data')
+
+    def set(self, key, data):
+        if not self.ttl:
+            return
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump({'timestamp': time.time(), 'data': data}, cache_file)
+            os.rename(tmp_path, self._path(key))
+        except (IOError, OSError):
+            # The cache is an optimization only, a failure to write it must not fail the module.
+            pass
+
+    def invalidate(self, key):
+        try:
+            os.remove(self._path(key))
+        except (IOError, OSError):
+            pass
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -48,18 +112,105 @@ class Ds8000ManagerBase(object):
         self.password = module.params['password']
         self.port = module.params['port']
         self.validate_certs = module.params['validate_certs']
+        self.max_workers = module.params.get('max_workers') or DEFAULT_MAX_WORKERS
+        self.cache_dir = module.params.get('cache_dir') or DEFAULT_CACHE_DIR
+        self.cache = Ds8000ResultCache(self.cache_dir, self.hostname, ttl=module.params.get('cache_ttl') or 0)
+        self.static_cache_ttl = module.params.get('static_cache_ttl') or 0
+        self.static_cache = None
         self.client = self.connect_to_api()
         self.changed = False
         self.failed = False
+        self.rest_call_count = 0
+        self.resource_group_index = None
 
     def get_all_volumes(self):
+        return self.get_cached(ALL_VOLUMES_CACHE_KEY, self._collect_all_volumes)
+
+    def _collect_all_volumes(self):
         volumes = []
-        pools = self.client.get_pools()
-        for pool in pools:
-            volumes_by_pool = self.get_ds8000_objects_from_command_output(self.client.get_volumes_by_pool(pool_id=pool.id))
-            volumes.extend(volumes_by_pool)
+        pools = self.get_pools()
+        self.rest_call_count += len(pools)
+        for pool, volumes_by_pool, error in self.run_concurrently(lambda pool: self.client.get_volumes_by_pool(pool_id=pool['id']), pools):
+            if error:
+                self.failed = True
+                self.module.fail_json(
+                    msg="Failed to get the volumes of pool {pool_id} on the DS8000 storage system. ERR: {error}".format(
+                        pool_id=pool['id'], error=to_native(error)
+                    )
+                )
+            volumes.extend(self.get_ds8000_objects_from_command_output(volumes_by_pool))
         return volumes
 
+    def get_pools(self):
+        return self.get_static_cached(POOLS_CACHE_KEY, lambda: self.get_ds8000_objects_from_command_output(self.client.get_pools()))
+
+    def get_marrays(self):
+        return self.get_static_cached(MARRAYS_CACHE_KEY, lambda: self.get_ds8000_objects_from_command_output(self.client.get_marrays()))
+
+    def get_static_cached(self, key, function):
+        if self.static_cache_ttl:
+            data = self._get_static_cache().get(key)
+            if data is not None:
+                return data
+        data = function()
+        self.rest_call_count += 1
+        if self.static_cache_ttl:
+            self._get_static_cache().set(key, data)
+        return data
+
+    def invalidate_static_cache(self, *keys):
+        # Called by the modules that change pools or marrays, whether or not they use the cache themselves.
+        if self.static_cache is None:
+            serial = Ds8000ResultCache(self.cache_dir, self.hostname, ttl=SYSTEM_SERIAL_CACHE_TTL).get(SYSTEM_SERIAL_CACHE_KEY)
+            if serial is None and not self._has_static_cache_files():
+                return
+        try:
+            static_cache = self._get_static_cache()
+        except Exception as generic_exc:
+            self.module.warn("Unable to invalidate the cached {keys} listings. ERR: {error}".format(keys=', '.join(keys), error=to_native(generic_exc)))
+            return
+        for key in keys:
+            static_cache.invalidate(key)
+
+    def _has_static_cache_files(self):
+        try:
+            return any(file_name.startswith(STATIC_CACHE_NAMESPACE_PREFIX) for file_name in os.listdir(os.path.expanduser(self.cache_dir)))
+        except (IOError, OSError):
+            return False
+
+    def _get_static_cache(self):
+        # The cache is keyed by the serial number, so that all the HMCs of a storage system share it.
+        # The serial number of the HMC hostname is cached too, so that it is looked up only once.
+        if self.static_cache is None:
+            serial_cache = Ds8000ResultCache(self.cache_dir, self.hostname, ttl=SYSTEM_SERIAL_CACHE_TTL)
+            serial = serial_cache.get(SYSTEM_SERIAL_CACHE_KEY)
+            if serial is None:
+                serial = self.client.get_systems()[0].sn
+                self.rest_call_count += 1
+                serial_cache.set(SYSTEM_SERIAL_CACHE_KEY, serial)
+            self.static_cache = Ds8000ResultCache(self.cache_dir, STATIC_CACHE_NAMESPACE_PREFIX + serial, ttl=self.static_cache_ttl)
+        return self.static_cache
+
+    def get_volumes_by_lss_ids(self, lss_ids):
+        # A listing per lss is cheaper while all of them fit in one concurrent round trip,
+        # beyond that the listing of every volume, which get_all_volumes caches, bucketed by lss costs less.
+        volumes_by_lss = {}
+        if len(lss_ids) <= self.max_workers:
+            for lss_id, volumes, error in self.run_concurrently(lambda lss_id: self.client.get_volumes_by_lss(lss_id=lss_id), lss_ids):
+                if isinstance(error, pyds8k.exceptions.NotFound):
+                    # An lss that does not exist yet holds no volumes.
+                    volumes = []
+                elif error:
+                    self.failed = True
+                    self.module.fail_json(
+                        msg="Failed to get the volumes of lss {lss_id} on the DS8000 storage system. ERR: {error}".format(lss_id=lss_id, error=to_native(error))
+                    )
+                volumes_by_lss[lss_id] = self.get_ds8000_objects_from_command_output(volumes)
+        else:
+            for volume in self.get_all_volumes():
+                volumes_by_lss.setdefault(volume.get('lss'), []).append(volume)
+        return volumes_by_lss
+
     def verify_ds8000_object_exist(self, function, *args, **kwargs):
         obj = self.does_ds8000_object_exist(function, *args, **kwargs)
         if obj:
@@ -81,23 +232,55 @@ class Ds8000ManagerBase(object):
             self.failed = True
             self.module.fail_json(msg="Function {function} exception." "ERR: {error}".format(function=function.__name__, error=to_native(generic_exc)))
 
-    def get_volume_ids_from_name(self, volume_name):
-        volume_ids = []
-        volumes = self.get_all_volumes()
-        for volume in volumes:
-            if volume['name'] == volume_name:
-                volume_ids.append(volume['id'])
+    def get_volume_ids_from_name(self, volume_name, pool=None, lss=None):
+        # Scope the listing to a single lss or pool when possible instead of walking every pool on the storage system.
+        rest_call_count = self.rest_call_count
+        if lss:
+            volumes = self.get_ds8000_objects_from_command_output(self.verify_ds8000_object_exist(self.client.get_volumes_by_lss, lss_id=lss))
+            self.rest_call_count += 1
+        elif pool:
+            volumes = self.get_ds8000_objects_from_command_output(self.verify_ds8000_object_exist(self.client.get_volumes_by_pool, pool_id=pool))
+            self.rest_call_count += 1
+        else:
+            volumes = self.get_all_volumes()
+
+        volume_ids = self._filter_volume_ids_by_name(volumes, volume_name, pool=pool)
+        if not volume_ids and not lss and not pool and self.cache.ttl:
+            # The cached listing may predate the volume, so look again before failing.
+            self.cache.invalidate(ALL_VOLUMES_CACHE_KEY)
+            volume_ids = self._filter_volume_ids_by_name(self.get_all_volumes(), volume_name)
+
+        self.module.log(
+            msg="Resolved volume name {volume_name} with {count} REST calls.".format(volume_name=volume_name, count=self.rest_call_count - rest_call_count)
+        )
         if not volume_ids:
             self.failed = True
             self.module.fail_json(msg="Unable to find volume name {volume_name} on the DS8000 storage system.".format(volume_name=volume_name))
         return volume_ids
 
+    def _filter_volume_ids_by_name(self, volumes, volume_name, pool=None):
+        volume_ids = []
+        for volume in volumes:
+            if volume['name'] == volume_name and (not pool or volume.get('pool') == pool):
+                volume_ids.append(volume['id'])
+        return volume_ids
+
+    def get_resource_group_index(self):
+        # Built once per run, so that label and id lookups don't list the resource groups again.
+        # Reset resource_group_index to None after creating or deleting a resource group.
+        if self.resource_group_index is None:
+            resource_groups = self.client.get_resource_groups()
+            self.resource_group_index = {
+                'label': dict((resource_group.label, resource_group) for resource_group in resource_groups),
+                'id': dict((resource_group.id, resource_group) for resource_group in resource_groups),
+            }
+        return self.resource_group_index
+
     def get_resource_group_from_label(self, label):
-        resource_groups = self.client.get_resource_groups()
-        for resource_group in resource_groups:
-            if resource_group.label == label:
-                return resource_group
-        return None
+        return self.get_resource_group_index()['label'].get(label)
+
+    def get_resource_group_from_id(self, resource_group_id):
+        return self.get_resource_group_index()['id'].get(resource_group_id)
 
     def delete_representation_keys(self, representation, key_list=None):
         if key_list:
@@ -118,6 +301,41 @@ class Ds8000ManagerBase(object):
 
         return ds8000_objects
 
+    def run_concurrently(self, function, items):
+        # Worker threads must not call fail_json, so exceptions are returned to the caller together with the item.
+        # Returns a list of (item, result, exception) in the order of items.
+        def call(item):
+            try:
+                return item, function(item), None
+            except Exception as generic_exc:
+                return item, None, generic_exc
+
+        items = list(items)
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [call(item) for item in items]
+        self.login()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(call, items))
+
+    def login(self):
+        # pyds8k only logs in after a 401. The worker threads share the client, so without a token they would each get a 401
+        # and log in at the same time, so the token is requested once before they start.
+        http_client = self.client.client
+        if http_client.defaultHeaders.get(AUTH_TOKEN_HEADER):
+            return
+        try:
+            http_client.authenticate.authenticate(http_client)
+        except Exception:
+            # The calls of the workers fail with the same error, which is reported with their items.
+            pass
+
+    def get_cached(self, key, function, *args, **kwargs):
+        data = self.cache.get(key)
+        if data is None:
+            data = function(*args, **kwargs)
+            self.cache.set(key, data)
+        return data
+
     def connect_to_api(self):
         rest_client = Client(service_address=self.hostname, user=self.username, password=self.password, port=self.port, verify=self.validate_certs)
         return rest_client
@@ -143,6 +361,33 @@ class Ds8000ManagerBase(object):
             self.module.fail_json(msg=msg)
 
 
+def get_member_resource_group(representation):
+    # Returns the resource group id or label of a volume, host or lss, an empty resource group is RG0.
+    # Returns None when the code level does not report the resource group of the object at all.
+    for key in MEMBER_RESOURCE_GROUP_KEYS:
+        if representation.get(key):
+            return representation[key]
+    if any(key in representation for key in MEMBER_RESOURCE_GROUP_KEYS):
+        return DEFAULT_RESOURCE_GROUP_ID
+    return None
+
+
+def expand_hex_id_ranges(values, width=2):
+    # Expand entries such as '10-1F' into ['10', '11', ..., '1F'], keeping the order and dropping duplicates.
+    ids = []
+    for value in values:
+        start, dummy, end = value.strip().partition('-')
+        first = int(start, 16)
+        last = int(end, 16) if end else first
+        if last < first:
+            raise ValueError("The range {value} ends before it starts.".format(value=value))
+        for number in range(first, last + 1):
+            hex_id = '{number:0{width}X}'.format(number=number, width=width)
+            if hex_id not in ids:
+                ids.append(hex_id)
+    return ids
+
+
 def ds8000_argument_spec():
     return dict(
         hostname=dict(type='str', required=True),
@@ -151,3 +396,17 @@ def ds8000_argument_spec():
         port=dict(type='int', required=False, default=8452),
         validate_certs=dict(type='bool', required=False, default=True),
     )
+
+
+def ds8000_concurrency_argument_spec():
+    return dict(
+        max_workers=dict(type='int', required=False, default=DEFAULT_MAX_WORKERS),
+    )
+
+
+def ds8000_cache_argument_spec():
+    return dict(
+        cache_ttl=dict(type='int', required=False, default=0),
+        cache_dir=dict(type='path', required=False, default=DEFAULT_CACHE_DIR),
+        static_cache_ttl=dict(type='int', required=False, default=0),
+    )
@@ -0,0 +1,159 @@
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+'''Python versions supported: >= 3.6'''
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import math
+import os
+import sqlite3
+import time
+from itertools import groupby
+
+SECONDS_PER_DAY = 86400
+SAMPLES = 'samples'
+DAILY_MAX = 'daily_max'
+GROWTH_RATE = 'growth_rate'
+ROLLUPS = [SAMPLES, DAILY_MAX, GROWTH_RATE]
+LINEAR = 'linear'
+EXPONENTIAL = 'exponential'
+FORECAST_MODELS = [LINEAR, EXPONENTIAL]
+CAPACITY_FIELDS = ['total', 'used', 'allocated', 'virtual']
+
+
+class PoolCapacityHistory(object):
+    '''Pool capacity samples stored in a local SQLite file, one compact row per pool and sample.'''
+
+    def __init__(self, path):
+        path = os.path.expanduser(path)
+        if os.path.dirname(path) and not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path), 0o700)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS pool_capacity ('
+                'hmc TEXT NOT NULL, pool TEXT NOT NULL, ts INTEGER NOT NULL, '
+                'total INTEGER, used INTEGER, allocated INTEGER, virtual INTEGER)'
+            )
+            # The pool ids are only unique per storage system, so the HMC leads the (pool, ts) index.
+            self.connection.execute('CREATE INDEX IF NOT EXISTS pool_capacity_pool_ts ON pool_capacity (hmc, pool, ts)')
+
+    def close(self):
+        self.connection.close()
+
+    def record(self, hmc, pools, timestamp=None):
+        timestamp = int(timestamp or time.time())
+        rows = []
+        for pool in pools:
+            capacity = get_pool_capacity(pool)
+            rows.append(tuple([hmc, pool['id'], timestamp] + [capacity[field] for field in CAPACITY_FIELDS]))
+        with self.connection:
+            self.connection.executemany('INSERT INTO pool_capacity VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        return len(rows)
+
+    def query(self, hmc, rollup, pool_ids=None, days=None):
+        if rollup == DAILY_MAX:
+            return self.daily_max(hmc, pool_ids, days)
+        if rollup == GROWTH_RATE:
+            return self.growth_rate(hmc, pool_ids, days)
+        return self.samples(hmc, pool_ids, days)
+
+    def samples(self, hmc, pool_ids=None, days=None):
+        where, args = self._where(hmc, pool_ids, days)
+        rows = self.connection.execute(
+            'SELECT pool, ts, total, used, allocated, virtual FROM pool_capacity WHERE {where} ORDER BY pool, ts'.format(where=where), args
+        )
+        return [dict(row) for row in rows]
+
+    def daily_max(self, hmc, pool_ids=None, days=None):
+        where, args = self._where(hmc, pool_ids, days)
+        rows = self.connection.execute(
+            "SELECT pool, date(ts, 'unixepoch') AS day, MAX(total) AS total, MAX(used) AS used, MAX(allocated) AS allocated, MAX(virtual) AS virtual "
+            'FROM pool_capacity WHERE {where} GROUP BY pool, day ORDER BY pool, day'.format(where=where),
+            args,
+        )
+        return [dict(row) for row in rows]
+
+    def growth_rate(self, hmc, pool_ids=None, days=None):
+        # The growth per day between the first and the last sample of each pool in the window.
+        rollup = []
+        for pool_id, pool_samples in groupby(self.samples(hmc, pool_ids, days), key=lambda sample: sample['pool']):
+            pool_samples = list(pool_samples)
+            first, last = pool_samples[0], pool_samples[-1]
+            elapsed_days = float(last['ts'] - first['ts']) / SECONDS_PER_DAY
+            growth = dict(pool=pool_id, first_ts=first['ts'], last_ts=last['ts'], days=round(elapsed_days, 2))
+            for field in CAPACITY_FIELDS:
+                growth[field] = last[field]
+                growth[field + '_per_day'] = int((last[field] - first[field]) / elapsed_days) if elapsed_days else 0
+            rollup.append(growth)
+        return rollup
+
+    def _where(self, hmc, pool_ids=None, days=None):
+        conditions = ['hmc = ?']
+        args = [hmc]
+        if pool_ids:
+            conditions.append('pool IN ({placeholders})'.format(placeholders=', '.join('?' * len(pool_ids))))
+            args.extend(pool_ids)
+        if days:
+            conditions.append('ts >= ?')
+            args.append(int(time.time()) - days * SECONDS_PER_DAY)
+        return ' AND '.join(conditions), args
+
+
+def get_pool_capacity(pool):
+    # The capacity fields of a pool representation, in GiB. The used capacity is what is no longer available, which includes the
+    # extents reserved by the storage system, the allocated capacity is only the extents allocated to volumes.
+    total = int(pool.get('cap') or 0)
+    return dict(
+        total=total,
+        used=total - int(pool.get('capavail') or 0),
+        allocated=int(pool.get('capalloc') or 0),
+        virtual=int(pool.get('virtual_capacity_allocated_on_ese') or 0),
+    )
+
+
+def fit_line(xs, ys):
+    # Least squares fit of y = intercept + slope * x, the sums are accumulated in one pass over the samples.
+    count = len(xs)
+    sum_x = sum(xs)
+    sum_y = sum(ys)
+    sum_xx = sum(x * x for x in xs)
+    sum_xy = sum(x * y for x, y in zip(xs, ys))
+    denominator = count * sum_xx - sum_x * sum_x
+    if count < 2 or not denominator:
+        return None
+    slope = (count * sum_xy - sum_x * sum_y) / denominator
+    return (sum_y - slope * sum_x) / count, slope
+
+
+def forecast_days_to_full(samples, model=LINEAR):
+    # Project the used capacity of a pool, from its samples ordered by ts, until it reaches the total capacity of the last sample.
+    # Returns None when the used capacity does not grow.
+    last = samples[-1]
+    if last['total'] and last['used'] >= last['total']:
+        return dict(days_to_full=0.0, used_per_day=0)
+    if model == EXPONENTIAL:
+        samples = [sample for sample in samples if sample['used'] > 0]
+    if len(samples) < 2 or not last['total']:
+        return None
+
+    xs = [float(sample['ts'] - samples[0]['ts']) / SECONDS_PER_DAY for sample in samples]
+    now = xs[-1]
+    if model == EXPONENTIAL:
+        fit = fit_line(xs, [math.log(sample['used']) for sample in samples])
+        if not fit or fit[1] <= 0:
+            return None
+        intercept, rate = fit
+        full_at = (math.log(last['total']) - intercept) / rate
+        used_per_day = math.exp(intercept + rate * now) * rate
+    else:
+        fit = fit_line(xs, [float(sample['used']) for sample in samples])
+        if not fit or fit[1] <= 0:
+            return None
+        intercept, used_per_day = fit
+        full_at = (last['total'] - intercept) / used_per_day
+    return dict(days_to_full=round(max(full_at - now, 0.0), 1), used_per_day=int(used_per_day))
@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: ds8000_batch
+short_description: Run a list of DS8000 module calls as batched module calls
+description:
+  - Run M(ibm.ds8000.ds8000_volume), M(ibm.ds8000.ds8000_volume_mapping) or M(ibm.ds8000.ds8000_host_port) once per list of items,
+    instead of once per item of a task loop.
+  - The items that differ only by the volume IDs, or by the host port WWPNs, are merged into a single module call
+    that logs in to the DS8000 storage system once. The other items are run one by one.
+  - M(ibm.ds8000.ds8000_volume) items are merged only when I(state=absent), M(ibm.ds8000.ds8000_volume_mapping) items only when they
+    set I(volume_id), and M(ibm.ds8000.ds8000_host_port) items only when I(exclusive) is not set.
+  - The result has the same shape as the result of a task loop, with one entry per item.
+version_added: "1.2.0"
+author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
+options:
+  module:
+    description:
+      - The module to run.
+    type: str
+    required: true
+    choices:
+      - ds8000_volume
+      - ds8000_volume_mapping
+      - ds8000_host_port
+      - ibm.ds8000.ds8000_volume
+      - ibm.ds8000.ds8000_volume_mapping
+      - ibm.ds8000.ds8000_host_port
+  items:
+    description:
+      - The arguments of each module call.
+      - Any other option of this module is passed to every module call, unless the item sets it.
+    type: list
+    elements: dict
+    required: true
+notes:
+  - Supports C(check_mode) when the batched module does.
+  - This module is implemented as an action plugin, the modules it runs use the I(module_defaults) of the C(group/ibm.ds8000.ds8000) group.
+  - When a merged module call fails, all its items are reported as failed.
+'''
+
+EXAMPLES = r'''
+- name: Delete some volumes with a single module call
+  ibm.ds8000.ds8000_batch:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    module: ds8000_volume
+    state: absent
+    items:
+      - id: "1000"
+      - id: "1001"
+      - id: "1002"
+
+- name: Map volumes to several hosts
+  ibm.ds8000.ds8000_batch:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    module: ds8000_volume_mapping
+    items:
+      - name: host_name_test
+        volume_id: "1000"
+      - name: host_name_test
+        volume_id: "1001"
+      - name: host_name_test_2
+        volume_id: "1000"
+'''
+
+RETURN = r'''
+results:
+  description:
+    - The result of the module call of each item, as in the result of a task loop.
+    - The result of a merged module call is split by item, for the returned lists that describe the action taken on each volume or host port.
+  returned: always
+  type: list
+  elements: dict
+  sample: |
+    [
+      {
+        "changed": true,
+        "failed": false,
+        "item": {
+          "name": "host_name_test",
+          "volume_id": "1000"
+        },
+        "ansible_loop_var": "item",
+        "volume_mappings": [
+          {
+            "volume_id": "1000",
+            "action": "map"
+          }
+        ]
+      }
+    ]
+'''
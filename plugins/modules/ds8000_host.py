@@ -20,11 +20,12 @@ options:
   name:
     description:
       - The name of the DS8000 host to work with.
-    required: true
+      - Required unless I(hosts) is set.
     type: str
   state:
     description:
     - Specify the state the DS8000 host should be in.
+    - When I(hosts) is set, this is the state of the entries that do not specify their own.
     type: str
     default: present
     choices:
@@ -33,12 +34,44 @@ options:
   host_type:
     description:
     - The host type of the host that will be created on the DS8000 storage system.
+    - When I(hosts) is set, this is the host type of the entries that do not specify their own.
     type: str
     default: Linux
+  hosts:
+    description:
+      - List of DS8000 hosts to work with in a single run.
+      - The existing hosts are read with a single listing, and the resulting creates and deletes run concurrently.
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    suboptions:
+      name:
+        description:
+          - The name of the DS8000 host.
+        type: str
+        required: true
+      state:
+        description:
+          - Specify the state the DS8000 host should be in.
+          - Defaults to I(state).
+        type: str
+        choices:
+          - present
+          - absent
+      host_type:
+        description:
+          - The host type of the host that will be created on the DS8000 storage system.
+          - Defaults to I(host_type).
+        type: str
 notes:
   - Supports C(check_mode).
+  - Creating or deleting hosts invalidates the host port index and the volume mapping matrix cached in I(cache_dir)
+    by M(ibm.ds8000.ds8000_host_port_info) and M(ibm.ds8000.ds8000_volume_mapping_info),
+    so I(cache_dir) must be the same as in those modules. This module does not read cached listings.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -57,13 +90,63 @@ EXAMPLES = r'''
     password: "{{ ds8000_password }}"
     name: host_name_test
     state: absent
+
+- name: Ensure the state of many hosts in the storage
+  ibm.ds8000.ds8000_host:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    hosts:
+      - name: host_name_test_1
+        host_type: pSeries
+      - name: host_name_test_2
+      - name: host_name_test_3
+        state: absent
 '''
 
-RETURN = r''' # '''
+RETURN = r'''
+hosts:
+    description: A list of dictionaries describing the action taken on each host in I(hosts).
+    returned: I(hosts) is set
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    contains:
+      name:
+        description: The host name.
+        type: str
+        sample: "host_name_test_1"
+      action:
+        description:
+          - The action taken on the host.
+          - C(create) creates the host, C(delete) deletes the host and C(none) means the host is already in the requested state.
+        type: str
+        sample: "create"
+    sample: |
+      [
+        {
+          "name": "host_name_test_1",
+          "action": "create"
+        }
+      ]
+'''
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ABSENT, PRESENT
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+    ABSENT,
+    PRESENT,
+    HOST_PORTS_BY_HOST_CACHE_KEY,
+    VOLUME_MAPPING_MATRIX_CACHE_KEY,
+)
+
+NO_ACTION = 'none'
+CREATE = 'create'
+DELETE = 'delete'
 
 
 class HostManager(Ds8000ManagerBase):
@@ -82,6 +165,8 @@ class HostManager(Ds8000ManagerBase):
             try:
                 if not self.module.check_mode:
                     self.client.create_host(host_name=name, hosttype=host_type)
+                    self.cache.invalidate(HOST_PORTS_BY_HOST_CACHE_KEY)
+                    self.cache.invalidate(VOLUME_MAPPING_MATRIX_CACHE_KEY)
                 self.changed = True
             except Exception as generic_exc:
                 self.failed = True
@@ -95,6 +180,8 @@ class HostManager(Ds8000ManagerBase):
             try:
                 if not self.module.check_mode:
                     self.client.delete_host(host_name=name)
+                    self.cache.invalidate(HOST_PORTS_BY_HOST_CACHE_KEY)
+                    self.cache.invalidate(VOLUME_MAPPING_MATRIX_CACHE_KEY)
                 self.changed = True
             except Exception as generic_exc:
                 self.failed = True
@@ -102,24 +189,82 @@ class HostManager(Ds8000ManagerBase):
                     msg="Failed to delete the host {host_name} from the DS8000 storage. ERR: {error}".format(host_name=name, error=to_native(generic_exc))
                 )
 
+    def hosts_state(self):
+        # One listing answers the existence of every host, instead of a get_host per host.
+        existing_host_names = set(host.name for host in self.client.get_hosts())
+        plan = []
+        for host in self.params['hosts']:
+            state = host['state'] or self.params['state']
+            if state == PRESENT and host['name'] not in existing_host_names:
+                action = CREATE
+            elif state == ABSENT and host['name'] in existing_host_names:
+                action = DELETE
+            else:
+                action = NO_ACTION
+            plan.append((host['name'], action, host['host_type'] or self.params['host_type']))
+
+        hosts_info = [{'name': name, 'action': action} for name, action, dummy in plan]
+        actions = [item for item in plan if item[1] != NO_ACTION]
+        if actions:
+            self.changed = True
+            if not self.module.check_mode:
+                errors = []
+                for item, dummy, error in self.run_concurrently(self._apply_host_action, actions):
+                    if error:
+                        errors.append(self._format_host_error(item[0], item[1], error))
+                self.cache.invalidate(HOST_PORTS_BY_HOST_CACHE_KEY)
+                self.cache.invalidate(VOLUME_MAPPING_MATRIX_CACHE_KEY)
+                if errors:
+                    self.failed = True
+                    self.module.fail_json(msg=' '.join(errors), changed=self.changed, hosts=hosts_info)
+        return {'changed': self.changed, 'failed': self.failed, 'hosts': hosts_info}
+
+    def _apply_host_action(self, item):
+        name, action, host_type = item
+        if action == CREATE:
+            return self.client.create_host(host_name=name, hosttype=host_type)
+        return self.client.delete_host(host_name=name)
+
+    def _format_host_error(self, name, action, error):
+        if action == CREATE:
+            return "Failed to create the host {host_name} on the DS8000 storage. ERR: {error}".format(host_name=name, error=to_native(error))
+        return "Failed to delete the host {host_name} from the DS8000 storage. ERR: {error}".format(host_name=name, error=to_native(error))
+
     def _does_host_exist(self):
         return self.does_ds8000_object_exist(self.client.get_host, host_name=self.params['name'])
 
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
     argument_spec.update(
-        name=dict(type='str', required=True), state=dict(type='str', default=PRESENT, choices=[ABSENT, PRESENT]), host_type=dict(type='str', default='Linux')
+        name=dict(type='str'),
+        state=dict(type='str', default=PRESENT, choices=[ABSENT, PRESENT]),
+        host_type=dict(type='str', default='Linux'),
+        hosts=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                name=dict(type='str', required=True),
+                state=dict(type='str', choices=[ABSENT, PRESENT]),
+                host_type=dict(type='str'),
+            ),
+        ),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        required_one_of=[['name', 'hosts']],
+        mutually_exclusive=[['name', 'hosts']],
         supports_check_mode=True,
     )
 
     host_manager = HostManager(module)
 
-    if module.params['state'] == PRESENT:
+    if module.params['hosts'] is not None:
+        result = host_manager.hosts_state()
+    elif module.params['state'] == PRESENT:
         result = host_manager.host_present()
     elif module.params['state'] == ABSENT:
         result = host_manager.host_absent()
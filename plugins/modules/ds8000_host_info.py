@@ -21,10 +21,47 @@ options:
   name:
     description: The host name.
     type: str
+  host_type:
+    description:
+      - Only return the hosts of this host type, for example C(pSeries) or C(Linux).
+      - The comparison is case insensitive.
+    type: str
+    version_added: "1.2.0"
+  name_pattern:
+    description:
+      - Only return the hosts whose name matches this pattern.
+      - The pattern syntax is set by I(name_pattern_type).
+    type: str
+    version_added: "1.2.0"
+  name_pattern_type:
+    description:
+      - The syntax of I(name_pattern).
+      - C(glob) matches shell style wildcards against the whole name, for example C(prd-*).
+      - C(regex) searches the name with a Python regular expression.
+    type: str
+    default: glob
+    choices:
+      - glob
+      - regex
+    version_added: "1.2.0"
+  expand:
+    description:
+      - List of related objects to embed in each returned host.
+      - C(ports) embeds the host ports, joined from a single listing of all the host ports.
+      - C(mappings) embeds the volume mappings and C(volumes) embeds the mapped volumes.
+        They are fetched concurrently for all the returned hosts.
+    type: list
+    elements: str
+    choices:
+      - ports
+      - mappings
+      - volumes
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
 '''
 
 EXAMPLES = r'''
@@ -40,6 +77,24 @@ EXAMPLES = r'''
     hostname: "{{ ds8000_host }}"
     username: "{{ ds8000_username }}"
     password: "{{ ds8000_password }}"
+
+- name: get all the AIX hosts whose name starts with prd-
+  ibm.ds8000.ds8000_host_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    host_type: pSeries
+    name_pattern: prd-*
+
+- name: get all the hosts with their host ports, volume mappings and volumes
+  ibm.ds8000.ds8000_host_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    expand:
+      - ports
+      - mappings
+      - volumes
 '''
 
 RETURN = r'''
@@ -119,6 +174,37 @@ hosts:
           description: The IO port WWPN.
           type: str
           sample: '500507630801054F'
+    host_ports:
+      description:
+        - A list of dictionaries describing the host ports assigned to the host.
+        - See M(ibm.ds8000.ds8000_host_port_info) for the keys.
+      returned: I(expand) contains C(ports)
+      type: list
+      elements: dict
+      version_added: "1.2.0"
+    mappings:
+      description: A list of dictionaries describing the volume mappings of the host.
+      returned: I(expand) contains C(mappings)
+      type: list
+      elements: dict
+      version_added: "1.2.0"
+      contains:
+        lunid:
+          description: The LUN ID.
+          type: str
+          sample: '40B04000'
+        volume_id:
+          description: The volume ID.
+          type: str
+          sample: 'B000'
+    volumes:
+      description:
+        - A list of dictionaries describing the volumes mapped to the host.
+        - See M(ibm.ds8000.ds8000_volume_info) for the keys.
+      returned: I(expand) contains C(volumes)
+      type: list
+      elements: dict
+      version_added: "1.2.0"
   sample: |
     [
         {
@@ -177,11 +263,17 @@ hosts:
     ]
 '''
 
+import fnmatch
+import re
+
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ds8000_concurrency_argument_spec
 
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 KEYS_TO_DELETE = ['link', 'ioports', 'host_ports', 'volumes', 'mappings']
+HOST_PORT_KEYS_TO_DELETE = ['link']
+VOLUME_KEYS_TO_DELETE = ['link', 'hosts', 'flashcopy', 'pprc']
 
 
 class hostsInformer(Ds8000ManagerBase):
@@ -190,20 +282,82 @@ class hostsInformer(Ds8000ManagerBase):
 
         if self.params['name']:
             host_by_name = self.verify_ds8000_object_exist(self.client.get_host, host_name=self.params['name'])
-            return self.get_ds8000_objects_from_command_output(host_by_name)
+            return self.get_ds8000_objects_from_command_output(self._filter_hosts([host_by_name]))
         else:
-            return self.get_ds8000_objects_from_command_output(self.client.get_hosts())
+            return self.get_ds8000_objects_from_command_output(self._filter_hosts(self.client.get_hosts()))
+
+    def _filter_hosts(self, hosts):
+        # The filters are compiled once and evaluated on the host objects, so only the matching hosts are converted to dicts.
+        host_type = self.params['host_type'].lower() if self.params['host_type'] else None
+        name_regex = None
+        if self.params['name_pattern']:
+            pattern = self.params['name_pattern']
+            if self.params['name_pattern_type'] == 'glob':
+                pattern = fnmatch.translate(pattern)
+            try:
+                name_regex = re.compile(pattern)
+            except re.error as regex_exc:
+                self.module.fail_json(
+                    msg="Invalid name_pattern {pattern}. ERR: {error}".format(pattern=self.params['name_pattern'], error=to_native(regex_exc))
+                )
+
+        return [
+            host for host in hosts if (host_type is None or (host.hosttype or '').lower() == host_type) and (name_regex is None or name_regex.search(host.name))
+        ]
 
     def host_info(self):
-        return self.delete_representation_keys(self.host_info_collector(), key_list=KEYS_TO_DELETE)
+        hosts = self.delete_representation_keys(self.host_info_collector(), key_list=KEYS_TO_DELETE)
+        if self.params['expand']:
+            self.expand_hosts(hosts)
+        return hosts
+
+    def expand_hosts(self, hosts):
+        expand = self.params['expand']
+        if 'ports' in expand:
+            # A single listing of all the host ports is cheaper than a query per host.
+            host_ports_by_host = {}
+            for host_port in self.delete_representation_keys(
+                self.get_ds8000_objects_from_command_output(self.client.get_host_ports()), key_list=HOST_PORT_KEYS_TO_DELETE
+            ):
+                host_ports_by_host.setdefault(host_port.get('host'), []).append(host_port)
+            for host in hosts:
+                host['host_ports'] = host_ports_by_host.get(host['name'], [])
+
+        sub_fetches = [(host, related) for host in hosts for related in ('mappings', 'volumes') if related in expand]
+        errors = []
+        for item, related_objects, error in self.run_concurrently(self._fetch_related_objects, sub_fetches):
+            host, related = item
+            if error:
+                errors.append("{related} of {host_name}: {error}".format(related=related, host_name=host['name'], error=to_native(error)))
+                continue
+            host[related] = related_objects
+        if errors:
+            self.failed = True
+            self.module.fail_json(msg="Failed to expand the hosts on the DS8000 storage system. ERR: {errors}".format(errors='; '.join(errors)))
+
+    def _fetch_related_objects(self, item):
+        host, related = item
+        if related == 'mappings':
+            return [dict(lunid=volume_map.lunid, volume_id=volume_map.volume) for volume_map in self.client.get_mappings_by_host(host_name=host['name'])]
+        return self.delete_representation_keys(
+            self.get_ds8000_objects_from_command_output(self.client.get_volumes_by_host(host_name=host['name'])), key_list=VOLUME_KEYS_TO_DELETE
+        )
 
 
 def main():
     argument_spec = ds8000_argument_spec()
-    argument_spec.update(name=dict(type='str'))
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(
+        name=dict(type='str'),
+        host_type=dict(type='str'),
+        name_pattern=dict(type='str'),
+        name_pattern_type=dict(type='str', default='glob', choices=['glob', 'regex']),
+        expand=dict(type='list', elements='str', choices=['ports', 'mappings', 'volumes']),
+    )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[('name', 'name_pattern')],
         supports_check_mode=True,
     )
 
@@ -43,10 +43,25 @@ options:
       - If C(no), if a host port is assigned to another host, it will not transfer it to the host specified.
     default: no
     type: bool
+  exclusive:
+    description:
+      - Optional when I(state=present).
+      - If C(yes), the host ends up with exactly the host ports in I(host_port).
+        Host ports assigned to the host that are not in I(host_port) are deleted.
+      - If C(no), host ports assigned to the host that are not in I(host_port) are left as they are.
+    default: no
+    type: bool
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
+  - Supports C(diff_mode).
+  - The existing host ports are read with a single listing, and the resulting creates, assignments and deletes run concurrently.
+  - Adding, reassigning or deleting host ports invalidates the host port index cached by M(ibm.ds8000.ds8000_host_port_info) in I(cache_dir),
+    so I(cache_dir) must be the same as in M(ibm.ds8000.ds8000_host_port_info). This module does not read cached listings.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -72,6 +87,19 @@ EXAMPLES = r'''
     force: yes
     host_port: 10000000C9A1BAB2
 
+- name: Ensure that the host has exactly these host ports
+  ibm.ds8000.ds8000_host_port:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    name: host_name_test
+    state: present
+    exclusive: yes
+    force: yes
+    host_port:
+      - 10000000C9A1BAB2
+      - 10000000C9A1BAB3
+
 - name: Delete some host ports from the DS8000 storage
   ibm.ds8000.ds8000_host_port:
     hostname: "{{ ds8000_host }}"
@@ -81,7 +109,33 @@ EXAMPLES = r'''
     host_port: 10000000C9A1BAB2
 '''
 
-RETURN = r''' # '''
+RETURN = r'''
+host_ports:
+    description: A list of dictionaries describing the action taken on each requested host port.
+    returned: always
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    contains:
+      wwpn:
+        description: The normalized host port WWPN.
+        type: str
+        sample: "10000000C9A1BAB2"
+      action:
+        description:
+          - The action taken on the host port.
+          - C(create) creates the host port, C(assign) assigns an unconfigured host port, C(reassign) transfers a host port from another host.
+          - C(delete) deletes the host port and C(none) means the host port is already in the requested state.
+        type: str
+        sample: "create"
+    sample: |
+      [
+        {
+          "wwpn": "10000000C9A1BAB2",
+          "action": "create"
+        }
+      ]
+'''
 
 try:
     import pyds8k.exceptions
@@ -90,82 +144,134 @@ except ImportError:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ABSENT, PRESENT
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+    ABSENT,
+    PRESENT,
+    HOST_PORTS_BY_HOST_CACHE_KEY,
+)
+
+NO_ACTION = 'none'
+CREATE = 'create'
+ASSIGN = 'assign'
+REASSIGN = 'reassign'
+DELETE = 'delete'
 
 
 class HostPortManager(Ds8000ManagerBase):
     def host_port_present(self):
+        self.host_port_info = []
+        self.diff = None
         if self.verify_ds8000_object_exist(self.client.get_host, host_name=self.params['name']):
-            for host_port in self.params['host_port']:
-                host_port = host_port.replace(':', '')
-                self.verify_assign_host_port(host_port)
-        return {'changed': self.changed, 'failed': self.failed}
+            existing_host_ports = self._get_host_ports_by_wwpn()
+            requested_host_ports = self._get_requested_host_ports()
+            plan = [(host_port, self._plan_assign_host_port(host_port, existing_host_ports.get(host_port))) for host_port in requested_host_ports]
+            if self.params['exclusive']:
+                plan.extend(self._plan_delete_unrequested_host_ports(requested_host_ports, existing_host_ports))
+            self.set_host_port_diff(requested_host_ports, existing_host_ports)
+            self.apply_host_port_plan(plan)
+        return {'changed': self.changed, 'failed': self.failed, 'host_ports': self.host_port_info}
 
     def host_port_absent(self):
+        self.host_port_info = []
+        self.diff = None
+        existing_host_ports = self._get_host_ports_by_wwpn()
+        plan = [(host_port, DELETE if host_port in existing_host_ports else NO_ACTION) for host_port in self._get_requested_host_ports()]
+        self.apply_host_port_plan(plan)
+        return {'changed': self.changed, 'failed': self.failed, 'host_ports': self.host_port_info}
+
+    def _get_requested_host_ports(self):
+        host_ports = []
         for host_port in self.params['host_port']:
-            host_port = host_port.replace(':', '')
-            self.verify_delete_host_port(host_port)
-        return {'changed': self.changed, 'failed': self.failed}
-
-    def verify_assign_host_port(self, host_port):
-        existing_host_port_object = self._does_host_port_exist(port_id=host_port)
-        if existing_host_port_object:
-            if not self._does_host_port_bound_to_host(existing_host_port_object):
-                if not self._does_host_port_bound_to_other_hosts(existing_host_port_object) and self._is_host_port_unconfigured(existing_host_port_object):
-                    self._assign_host_port_to_host(host_port)
-                else:
-                    if not self.params['force']:
-                        self.failed = True
-                        self.module.fail_json(
-                            msg="The WWPN {host_port} is assigned to another host ({host}) on the DS8000 storage. "
-                            "To assign it to its desired host, use the force: true parameter.".format(host_port=host_port, host=existing_host_port_object.host)
-                        )
-                    else:
-                        self._assign_host_port_to_host(host_port)
-        else:
-            self._create_host_port(host_port)
-        return {'changed': self.changed, 'failed': self.failed}
-
-    def _assign_host_port_to_host(self, host_port):
-        name = self.params['name']
-        try:
-            if not self.module.check_mode:
-                self.client.update_host_port_change_host(port_id=host_port, host_name=name)
-            self.changed = True
-        except pyds8k.exceptions.BadRequest as bad_wwpn:
-            self.failed = True
-            self.module.fail_json(msg="This WWPN {host_port} not found. " "ERR: {error}".format(host_port=host_port, error=to_native(bad_wwpn)))
-        except Exception as generic_exc:
+            host_port = normalize_wwpn(host_port)
+            if host_port not in host_ports:
+                host_ports.append(host_port)
+        return host_ports
+
+    def _get_host_ports_by_wwpn(self):
+        # One listing answers the existence and assignment of every requested WWPN.
+        return dict((normalize_wwpn(host_port.wwpn), host_port) for host_port in self.client.get_host_ports())
+
+    def _plan_assign_host_port(self, host_port, existing_host_port_object):
+        if not existing_host_port_object:
+            return CREATE
+        if self._does_host_port_bound_to_host(existing_host_port_object):
+            return NO_ACTION
+        if not self._does_host_port_bound_to_other_hosts(existing_host_port_object) and self._is_host_port_unconfigured(existing_host_port_object):
+            return ASSIGN
+        if not self.params['force']:
             self.failed = True
             self.module.fail_json(
-                msg="Failed to assign this {host_port} WWPN to the host {host_name}. "
-                "ERR: {error}".format(host_port=host_port, host_name=name, error=to_native(generic_exc))
+                msg="The WWPN {host_port} is assigned to another host ({host}) on the DS8000 storage. "
+                "To assign it to its desired host, use the force: true parameter.".format(host_port=host_port, host=existing_host_port_object.host)
             )
+        return REASSIGN
 
-    def _create_host_port(self, host_port):
-        name = self.params['name']
-        try:
-            if not self.module.check_mode:
-                self.client.create_host_port(port_id=host_port, host_name=name)
-            self.changed = True
-        except Exception as generic_exc:
+    def _plan_delete_unrequested_host_ports(self, requested_host_ports, existing_host_ports):
+        plan = []
+        for host_port in sorted(existing_host_ports):
+            if host_port not in requested_host_ports and self._does_host_port_bound_to_host(existing_host_ports[host_port]):
+                plan.append((host_port, DELETE))
+        return plan
+
+    def set_host_port_diff(self, requested_host_ports, existing_host_ports):
+        before = sorted(host_port for host_port, host_port_object in existing_host_ports.items() if self._does_host_port_bound_to_host(host_port_object))
+        after = set(requested_host_ports)
+        if not self.params['exclusive']:
+            after.update(before)
+        self.diff = {'before': {'host_port': before}, 'after': {'host_port': sorted(after)}}
+
+    def apply_host_port_plan(self, plan):
+        self.host_port_info = [{'wwpn': host_port, 'action': action} for host_port, action in plan]
+        actions = [(host_port, action) for host_port, action in plan if action != NO_ACTION]
+        if not actions:
+            return
+        self.changed = True
+        if self.module.check_mode:
+            return
+
+        errors = []
+        for item, dummy, error in self.run_concurrently(self._apply_host_port_action, actions):
+            if error:
+                errors.append(self._format_host_port_error(item[0], item[1], error))
+        self.cache.invalidate(HOST_PORTS_BY_HOST_CACHE_KEY)
+        if errors:
             self.failed = True
-            self.module.fail_json(
-                msg="Failed to create the host port {host_port} on the DS8000 storage system. "
-                "ERR: {error}".format(host_port=host_port, error=to_native(generic_exc))
-            )
+            self.module.fail_json(msg=' '.join(errors), host_ports=self.host_port_info)
 
-    def _does_host_port_bound_to_other_hosts(self, host_port_object):
+    def _apply_host_port_action(self, item):
+        host_port, action = item
+        if action == CREATE:
+            return self.client.create_host_port(port_id=host_port, host_name=self.params['name'])
+        if action in (ASSIGN, REASSIGN):
+            return self.client.update_host_port_change_host(port_id=host_port, host_name=self.params['name'])
+        if action == DELETE:
+            return self.client.delete_host_port(port_id=host_port)
+
+    def _format_host_port_error(self, host_port, action, error):
         name = self.params['name']
+        if action == CREATE:
+            return "Failed to create the host port {host_port} on the DS8000 storage system. ERR: {error}".format(host_port=host_port, error=to_native(error))
+        if action == DELETE:
+            return "Failed to delete the host port {host_port} from the DS8000 storage system. ERR: {error}".format(host_port=host_port, error=to_native(error))
+        if isinstance(error, pyds8k.exceptions.BadRequest):
+            return "This WWPN {host_port} not found. ERR: {error}".format(host_port=host_port, error=to_native(error))
+        return "Failed to assign this {host_port} WWPN to the host {host_name}. ERR: {error}".format(
+            host_port=host_port, host_name=name, error=to_native(error)
+        )
+
+    def _does_host_port_bound_to_other_hosts(self, host_port_object):
         if host_port_object.host:
-            if name not in host_port_object.host:
+            if host_port_object.host != self.params['name']:
                 return True
         return False
 
     def _does_host_port_bound_to_host(self, host_port_object):
-        name = self.params['name']
         if host_port_object.host:
-            if name in host_port_object.host:
+            if host_port_object.host == self.params['name']:
                 return True
         return False
 
@@ -174,34 +280,21 @@ class HostPortManager(Ds8000ManagerBase):
             return True
         return False
 
-    def verify_delete_host_port(self, host_port):
-        if self._does_host_port_exist(host_port):
-            self._delete_host_port(host_port)
-        return {'changed': self.changed, 'failed': self.failed}
-
-    def _delete_host_port(self, host_port):
-        try:
-            if not self.module.check_mode:
-                self.client.delete_host_port(port_id=host_port)
-            self.changed = True
-        except Exception as generic_exc:
-            self.failed = True
-            self.module.fail_json(
-                msg="Failed to delete the host port {host_port} from the DS8000 storage system. "
-                "ERR: {error}".format(host_port=host_port, error=to_native(generic_exc))
-            )
 
-    def _does_host_port_exist(self, port_id):
-        return self.does_ds8000_object_exist(self.client.get_host_port, port_id=port_id)
+def normalize_wwpn(host_port):
+    return host_port.replace(':', '').upper()
 
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
     argument_spec.update(
         name=dict(type='str'),
         state=dict(type='str', default=PRESENT, choices=[ABSENT, PRESENT]),
         host_port=dict(type='list', elements='str', required=True),
         force=dict(type='bool', default=False),
+        exclusive=dict(type='bool', default=False),
     )
 
     module = AnsibleModule(
@@ -216,6 +309,9 @@ def main():
     elif module.params['state'] == ABSENT:
         result = host_port_manager.host_port_absent()
 
+    if module._diff and host_port_manager.diff:
+        result['diff'] = host_port_manager.diff
+
     if result['failed']:
         module.fail_json(**result)
     else:
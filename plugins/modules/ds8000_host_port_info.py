@@ -27,10 +27,20 @@ options:
     description:
       - The name of the DS8000 host to query.
     type: str
+  hosts:
+    description:
+      - List of DS8000 host names to query.
+      - All the hosts are answered from a single listing of the host ports.
+    type: list
+    elements: str
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
+  - When I(cache_ttl) is set, the index of host ports by host is cached and reused by the following runs.
+    The cache is invalidated when M(ibm.ds8000.ds8000_host_port) changes a host port.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -41,6 +51,15 @@ EXAMPLES = r'''
     password: "{{ ds8000_password }}"
     wwpn: ansible
 
+- name: get the host ports of some hosts
+  ibm.ds8000.ds8000_host_port_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    hosts:
+      - ansible
+      - ansible_2
+
 - name: get all the hosts
   ibm.ds8000.ds8000_host_info:
     hostname: "{{ ds8000_host }}"
@@ -123,10 +142,31 @@ host_ports:
             "wwpn": "10000090FA8E52DE"
         }
     ]
+host_ports_by_host:
+  description:
+    - A dictionary of the host ports, keyed by host name.
+    - Every requested host is a key, hosts without host ports have an empty list.
+  returned: I(host) or I(hosts) is set
+  type: dict
+  version_added: "1.2.0"
+  sample: |
+    {
+        "janus": [
+            {
+                "host": "janus",
+                "wwpn": "10000090FA8E52DE"
+            }
+        ]
+    }
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    HOST_PORTS_BY_HOST_CACHE_KEY,
+)
 
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 KEYS_TO_DELETE = ['link']
@@ -135,46 +175,51 @@ KEYS_TO_DELETE = ['link']
 class hostPortInformer(Ds8000ManagerBase):
     def host_port_info_collector(self):
         host_port_by_id = []
-        host_port_by_host = []
 
         if self.params['host_port']:
             host_port_by_id = []
             for host_port in self.params['host_port']:
                 host_port_by_id.append(self.verify_ds8000_object_exist(self.client.get_host_port, port_id=host_port))
             return self.get_ds8000_objects_from_command_output(host_port_by_id)
-        elif self.params['host']:
-            host = self.verify_ds8000_object_exist(self.client.get_host, host_name=self.params['host'])
-            if host:
-                # TODO this doesn't work because of the invalid url bug in the REST api
-                #     for host_port in host.host_ports:
-                #         host_port_by_host.append(self.does_ds8000_object_exist(self.client.get_host_port, port_id=host_port))
-                # This results in fewer REST calls, though may not be faster
-                host_ports = self.client.get_host_ports()
-                for host_port in host_ports:
-                    if self._does_host_port_bound_to_host(host_port):
-                        host_port_by_host.append(host_port)
-                return self.get_ds8000_objects_from_command_output(host_port_by_host)
+        elif self.params['host'] or self.params['hosts']:
+            host_ports_by_host = self.get_host_ports_by_host(self.params['hosts'] or [self.params['host']])
+            host_ports = []
+            for host_ports_of_host in host_ports_by_host.values():
+                host_ports.extend(host_ports_of_host)
+            return host_ports
         else:
             return self.get_ds8000_objects_from_command_output(self.client.get_host_ports())
 
     def host_port_info(self):
         return self.delete_representation_keys(self.host_port_info_collector(), key_list=KEYS_TO_DELETE)
 
-    def _does_host_port_bound_to_host(self, host_port_object):
-        name = self.params['host']
-        if host_port_object.host:
-            if name in host_port_object.host:
-                return True
-        return False
+    def get_host_ports_by_host(self, host_names):
+        # TODO querying host.host_ports doesn't work because of the invalid url bug in the REST api,
+        # so one listing of all the host ports is indexed by the exact host name instead.
+        host_port_index = self.get_cached(HOST_PORTS_BY_HOST_CACHE_KEY, self._build_host_port_index)
+        missing_host_names = [name for name in host_names if name not in host_port_index['hosts']]
+        if missing_host_names:
+            self.failed = True
+            self.module.fail_json(msg="Hosts {host_names} returned no objects on the DS8000 storage system.".format(host_names=', '.join(missing_host_names)))
+        self.host_ports_by_host = dict((name, host_port_index['host_ports'].get(name, [])) for name in host_names)
+        return self.host_ports_by_host
+
+    def _build_host_port_index(self):
+        host_port_index = {'hosts': [host.name for host in self.client.get_hosts()], 'host_ports': {}}
+        for host_port in self.get_ds8000_objects_from_command_output(self.client.get_host_ports()):
+            if host_port.get('host'):
+                host_port_index['host_ports'].setdefault(host_port['host'], []).append(host_port)
+        return host_port_index
 
 
 def main():
     argument_spec = ds8000_argument_spec()
-    argument_spec.update(host_port=dict(type='list', elements='str'), host=dict(type='str'))
+    argument_spec.update(ds8000_cache_argument_spec())
+    argument_spec.update(host_port=dict(type='list', elements='str'), host=dict(type='str'), hosts=dict(type='list', elements='str'))
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        mutually_exclusive=[('host_port', 'host')],
+        mutually_exclusive=[('host_port', 'host', 'hosts')],
         supports_check_mode=True,
     )
 
@@ -182,7 +227,10 @@ def main():
 
     host_ports = host_port_informer.host_port_info()
 
-    module.exit_json(changed=host_port_informer.changed, host_ports=host_ports)
+    result = dict(changed=host_port_informer.changed, host_ports=host_ports)
+    if module.params['host'] or module.params['hosts']:
+        result['host_ports_by_host'] = host_port_informer.host_ports_by_host
+    module.exit_json(**result)
 
 
 if __name__ == '__main__':
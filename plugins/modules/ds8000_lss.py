@@ -19,6 +19,8 @@ description:
     where each lss contains 256 logical volume numbers. The 255 lss units are assigned to one of 16 address groups,
     where each address group contains 16 lsses, or 4 KB volume addresses.
   - lcus are typically created in groups of 16, beginning at lss address 00.
+  - Use I(ids) to manage a range of lsses in one task. The existing lsses are resolved with one listing
+    and the missing lsses are created concurrently.
 version_added: "1.1.0"
 author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
 options:
@@ -26,9 +28,17 @@ options:
     description:
       - The lss ID to be created.
       - An lss ID is two hexadecimal characters 00 - FE.
-    required: true
+      - Mutually exclusive with I(ids).
     type: str
     aliases: [ lss ]
+  ids:
+    description:
+      - A list of lss IDs or lss ID ranges to be managed, for example C(10-1F).
+      - The bounds of a range are inclusive.
+      - Mutually exclusive with I(id).
+    type: list
+    elements: str
+    version_added: "1.2.0"
   state:
     description:
     - Specify the state the DS8000 lss should be in.
@@ -41,13 +51,23 @@ options:
     description:
       - The subsystem ID that you assign.
       - A subsystem ID is four hexadecimal characters 0000-FFFF.
-      - Required when I(state=present)
+      - The subsystem ID of an existing lss is changed in place when it differs.
+      - Required when I(state=present) and I(id) is set.
+      - Mutually exclusive with I(ssid_start).
+    type: str
+  ssid_start:
+    description:
+      - The subsystem ID of the first lss in I(ids).
+      - The subsystem IDs of the following lsses are incremented by one for each lss, in the order of I(ids).
+      - Required when I(state=present) and I(ids) is set.
     type: str
+    version_added: "1.2.0"
   ckd_type:
     description:
-      - The type of lss to create.
+      - The type of lss.
+      - An lss is created with the type C(3990-6) when I(ckd_type) is not set.
+      - The type of an existing lss is only changed when I(ckd_type) is set.
     type: str
-    default: 3990-6
     choices:
       - 3990-3
       - 3990-tpf
@@ -55,8 +75,11 @@ options:
       - bs2000
 notes:
   - Supports C(check_mode).
+  - Supports C(diff_mode).
+  - Only the attributes of an existing lss that differ from the requested ones are changed.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
 '''
 
 EXAMPLES = r'''
@@ -76,12 +99,43 @@ EXAMPLES = r'''
     password: "{{ ds8000_password }}"
     lss_id: "80"
     state: absent
+
+- name: Ensure that the lsses 10 - 1F exist with the subsystem IDs 2310 - 231F
+  ibm.ds8000.ds8000_lss:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    ids:
+      - 10-1F
+    ssid_start: "2310"
+    state: present
+
+- name: Ensure that the lsses 10 - 1F do not exist
+  ibm.ds8000.ds8000_lss:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    ids:
+      - 10-1F
+    state: absent
+
+- name: Change the subsystem ID of a lss in place
+  ibm.ds8000.ds8000_lss:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    id: "80"
+    state: present
+    ssid: 2301
+  diff: true
 '''
 
 RETURN = r'''
 lss:
-    description: A list of dictionaries describing the lsses.
-    returned: I(state=present) changed
+    description:
+      - A list of dictionaries describing the lsses.
+      - When I(ids) is set, the list describes every requested lss and the action taken on it.
+    returned: I(state=present) changed, or I(ids) is set
     type: list
     elements: dict
     contains:
@@ -89,6 +143,24 @@ lss:
         description: The lss ID.
         type: str
         sample: "1F"
+      ssid:
+        description: The subsystem ID of the lss.
+        type: str
+        returned: I(ids) is set and I(state=present)
+        sample: "231F"
+        version_added: "1.2.0"
+      action:
+        description: The action taken on the lss, one of C(create), C(update), C(delete) or C(none).
+        type: str
+        returned: I(ids) is set
+        sample: "create"
+        version_added: "1.2.0"
+      changes:
+        description: The lss attributes that are changed, with their new values.
+        type: dict
+        returned: I(ids) is set and the lss is changed in place
+        sample: {"sub_system_identifier": "2311"}
+        version_added: "1.2.0"
     sample: |
       [
         {
@@ -99,15 +171,34 @@ lss:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ABSENT, PRESENT
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_concurrency_argument_spec,
+    expand_hex_id_ranges,
+    ABSENT,
+    PRESENT,
+)
 
 LSS_TYPE = 'ckd'
 CKD_BASE_CU_TYPES = ['3990-3', '3990-tpf', '3990-6', 'bs2000']
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 REPR_KEYS_TO_DELETE = ['link', 'volumes', 'sub_system_identifier']
+DEFAULT_CKD_TYPE = '3990-6'
+LSS_RESOURCE_TYPE = 'lss'
+MAX_LSS_ID = 0xFE
+MAX_SSID = 0xFFFF
+NO_ACTION = 'none'
+CREATE = 'create'
+UPDATE = 'update'
+DELETE = 'delete'
 
 
 class LssManager(Ds8000ManagerBase):
+    def __init__(self, module):
+        super(LssManager, self).__init__(module)
+        self.diff = None
+
     def lss_present(self):
         self.lss_info = []
         self.verify_lss()
@@ -129,23 +220,13 @@ class LssManager(Ds8000ManagerBase):
                 generic_exc = "lss exists but is not the type {r_type} ({type}).".format(r_type=LSS_TYPE, type=existing_lss_object.type)
                 self.module.fail_json(msg="Failed to create lss on DS8000 storage. " "ERR: {error}".format(error=to_native(generic_exc)))
 
-            if existing_lss_object.sub_system_identifier != self.params['ssid'] or existing_lss_object.ckd_base_cu_type != self.params['ckd_type']:
-                # If change gets supported
-                # if not self.module.check_mode:
-                #     self.change_lss()
-
-                self.failed = True
-                generic_exc = "lss exists but is not the requested ssid {r_ssid} ({ssid}) or cu_type {r_type} ({type}).".format(
-                    r_ssid=self.params['ssid'],
-                    ssid=existing_lss_object.sub_system_identifier,
-                    r_type=self.params['ckd_type'],
-                    type=existing_lss_object.ckd_base_cu_type,
-                )
-                self.module.fail_json(msg="Failed to create lss on DS8000 storage. " "ERR: {error}".format(error=to_native(generic_exc)))
+            changes = self._get_lss_changes(existing_lss_object, self.params['ssid'])
+            if changes:
+                self._change_lss(existing_lss_object, changes)
 
     def _create_lss(self):
         try:
-            kwargs = dict(lss_id=self.params['id'], lcu_type=self.params['ckd_type'], ss_id=self.params['ssid'])
+            kwargs = dict(lss_id=self.params['id'], lcu_type=self.params['ckd_type'] or DEFAULT_CKD_TYPE, ss_id=self.params['ssid'])
             lss = []
             if not self.module.check_mode:
                 lss = self.client.create_lss_ckd(**kwargs)
@@ -155,18 +236,39 @@ class LssManager(Ds8000ManagerBase):
             self.failed = True
             self.module.fail_json(msg="Failed to create lss on DS8000 storage. " "ERR: {error}".format(error=to_native(generic_exc)))
 
-    # def _change_lss(self):
-    #     try:
-    #         kwargs = dict(
-    #             lss_id=self.params['id'],
-    #             ssid=self.params['ssid'],
-    #             ckd_type=self.params['ckd_type'],
-    #         )
-    #         self.client.update_lss_ckd(**kwargs)
-    #         self.changed = True
-    #     except Exception as generic_exc:
-    #         self.failed = True
-    #         self.module.fail_json(msg="Failed to change lss on DS8000 storage. " "ERR: {error}".format(error=to_native(generic_exc)))
+    def _change_lss(self, existing_lss_object, changes):
+        try:
+            if not self.module.check_mode:
+                self._update_lss(existing_lss_object.id, changes)
+            self.lss_info = [{'id': existing_lss_object.id}]
+            self.diff = self._get_lss_diff([(existing_lss_object, changes)])
+            self.changed = True
+        except Exception as generic_exc:
+            self.failed = True
+            self.module.fail_json(
+                msg="Failed to change the lss {id} on DS8000 storage. " "ERR: {error}".format(id=existing_lss_object.id, error=to_native(generic_exc))
+            )
+
+    def _update_lss(self, lss_id, changes):
+        # pyds8k has no update call for lsses and its lss manager only allows PUT, so only the changed attributes are put to the lss resource.
+        return self.client.one(LSS_RESOURCE_TYPE, lss_id, rebuild_url=True).manager.put(body=changes)
+
+    def _get_lss_changes(self, existing_lss_object, ssid):
+        # Only the attributes that are requested and differ from the lss are sent, unset parameters are ignored.
+        requested = {'sub_system_identifier': ssid, 'ckd_base_cu_type': self.params['ckd_type']}
+        return dict(
+            (field, value)
+            for field, value in requested.items()
+            if value is not None and to_native(getattr(existing_lss_object, field, '')).upper() != value.upper()
+        )
+
+    def _get_lss_diff(self, updates):
+        before = {}
+        after = {}
+        for existing_lss_object, changes in updates:
+            before[existing_lss_object.id] = dict((field, getattr(existing_lss_object, field, '')) for field in changes)
+            after[existing_lss_object.id] = changes
+        return {'before': {'lss': before}, 'after': {'lss': after}}
 
     def _delete_lss(self):
         try:
@@ -179,34 +281,142 @@ class LssManager(Ds8000ManagerBase):
                 msg="Failed to delete the lss {id} from DS8000 storage. " "ERR: {error}".format(id=self.params['id'], error=to_native(generic_exc))
             )
 
+    def lss_range_state(self):
+        lss_ids = self._get_requested_lss_ids()
+        ssids = self._get_requested_ssids(lss_ids)
+        # One listing answers the existence and the attributes of every lss, instead of a get_lss_by_id per lss.
+        existing_lss_objects = dict((lss.id, lss) for lss in self.client.get_lss())
+
+        plan = []
+        updates = []
+        errors = []
+        for lss_id, ssid in zip(lss_ids, ssids):
+            existing_lss_object = existing_lss_objects.get(lss_id)
+            if self.params['state'] == ABSENT:
+                plan.append((lss_id, DELETE if existing_lss_object else NO_ACTION, None, None))
+            elif not existing_lss_object:
+                plan.append((lss_id, CREATE, ssid, None))
+            elif existing_lss_object.type != LSS_TYPE:
+                errors.append("lss {id} exists but is not the type {r_type} ({type}).".format(id=lss_id, r_type=LSS_TYPE, type=existing_lss_object.type))
+            else:
+                changes = self._get_lss_changes(existing_lss_object, ssid)
+                if changes:
+                    plan.append((lss_id, UPDATE, ssid, changes))
+                    updates.append((existing_lss_object, changes))
+                else:
+                    plan.append((lss_id, NO_ACTION, ssid, None))
+        if errors:
+            # Nothing is changed until every requested lss is known to be reachable.
+            self.failed = True
+            self.module.fail_json(msg="Failed to create lss on DS8000 storage. ERR: {error}".format(error=' '.join(errors)))
+
+        self.lss_info = [self._format_lss_outcome(*item) for item in plan]
+        if updates:
+            self.diff = self._get_lss_diff(updates)
+        actions = [item for item in plan if item[1] != NO_ACTION]
+        if actions:
+            self.changed = True
+            if not self.module.check_mode:
+                errors = []
+                for item, dummy, error in self.run_concurrently(self._apply_lss_action, actions):
+                    if error:
+                        errors.append(self._format_lss_error(item[0], item[1], error))
+                if errors:
+                    self.failed = True
+                    self.module.fail_json(msg=' '.join(errors), changed=self.changed, lss=self.lss_info)
+        return {'changed': self.changed, 'failed': self.failed, 'lss': self.lss_info}
+
+    def _get_requested_lss_ids(self):
+        try:
+            lss_ids = expand_hex_id_ranges(self.params['ids'])
+        except ValueError as generic_exc:
+            self.failed = True
+            self.module.fail_json(msg="Invalid lss ID range in ids. ERR: {error}".format(error=to_native(generic_exc)))
+        invalid_lss_ids = [lss_id for lss_id in lss_ids if int(lss_id, 16) > MAX_LSS_ID]
+        if invalid_lss_ids:
+            self.failed = True
+            self.module.fail_json(msg="Invalid lss IDs {ids}. An lss ID is two hexadecimal characters 00 - FE.".format(ids=', '.join(invalid_lss_ids)))
+        return lss_ids
+
+    def _get_requested_ssids(self, lss_ids):
+        if self.params['state'] == ABSENT:
+            return [None] * len(lss_ids)
+        try:
+            ssid_start = int(self.params['ssid_start'], 16)
+        except ValueError:
+            self.failed = True
+            self.module.fail_json(
+                msg="Invalid ssid_start {ssid}. A subsystem ID is four hexadecimal characters 0000-FFFF.".format(ssid=self.params['ssid_start'])
+            )
+        if ssid_start + len(lss_ids) - 1 > MAX_SSID:
+            self.failed = True
+            self.module.fail_json(
+                msg="The subsystem IDs starting at {ssid} run out of the range 0000-FFFF for {count} lsses.".format(
+                    ssid=self.params['ssid_start'], count=len(lss_ids)
+                )
+            )
+        return ['{ssid:04X}'.format(ssid=ssid_start + index) for index in range(len(lss_ids))]
+
+    def _apply_lss_action(self, item):
+        lss_id, action, ssid, changes = item
+        if action == CREATE:
+            return self.client.create_lss_ckd(lss_id=lss_id, lcu_type=self.params['ckd_type'] or DEFAULT_CKD_TYPE, ss_id=ssid)
+        if action == UPDATE:
+            return self._update_lss(lss_id, changes)
+        return self.client.delete_lss_by_id(lss_id)
+
+    def _format_lss_outcome(self, lss_id, action, ssid, changes):
+        if self.params['state'] == ABSENT:
+            return {'id': lss_id, 'action': action}
+        if action == UPDATE:
+            return {'id': lss_id, 'ssid': ssid, 'action': action, 'changes': changes}
+        return {'id': lss_id, 'ssid': ssid, 'action': action}
+
+    def _format_lss_error(self, lss_id, action, error):
+        if action == CREATE:
+            return "Failed to create the lss {id} on DS8000 storage. ERR: {error}".format(id=lss_id, error=to_native(error))
+        if action == UPDATE:
+            return "Failed to change the lss {id} on DS8000 storage. ERR: {error}".format(id=lss_id, error=to_native(error))
+        return "Failed to delete the lss {id} from DS8000 storage. ERR: {error}".format(id=lss_id, error=to_native(error))
+
     def _does_lss_exist(self):
         return self.does_ds8000_object_exist(self.client.get_lss_by_id, lss_id=self.params['id'])
 
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
     argument_spec.update(
-        id=dict(type='str', aliases=['lss'], required=True),
+        id=dict(type='str', aliases=['lss']),
+        ids=dict(type='list', elements='str'),
         state=dict(type='str', default=PRESENT, choices=[ABSENT, PRESENT]),
         ssid=dict(type='str'),
-        ckd_type=dict(type='str', default='3990-6', choices=CKD_BASE_CU_TYPES),
+        ssid_start=dict(type='str'),
+        ckd_type=dict(type='str', choices=CKD_BASE_CU_TYPES),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         required_if=[
-            ['state', PRESENT, ('ssid',)],
+            ['state', PRESENT, ('ssid', 'ssid_start'), True],
         ],
+        required_one_of=[['id', 'ids']],
+        mutually_exclusive=[['id', 'ids'], ['ssid', 'ssid_start'], ['id', 'ssid_start'], ['ids', 'ssid']],
         supports_check_mode=True,
     )
 
     lss_manager = LssManager(module)
 
-    if module.params['state'] == PRESENT:
+    if module.params['ids']:
+        result = lss_manager.lss_range_state()
+    elif module.params['state'] == PRESENT:
         result = lss_manager.lss_present()
     elif module.params['state'] == ABSENT:
         result = lss_manager.lss_absent()
 
+    if module._diff and lss_manager.diff:
+        result['diff'] = lss_manager.diff
+
     if result['failed']:
         module.fail_json(**result)
     else:
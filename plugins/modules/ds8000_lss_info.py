@@ -14,28 +14,46 @@ module: ds8000_lss_info
 short_description: Return info on DS8000 lsses
 description:
   - Return information pertaining to DS8000 lsses.
-  - If the optional parameters are not set, information on all lsses on the DS8000 storage system will be returned.
+  - If the optional parameters are not set, information on all the ckd lsses on the DS8000 storage system will be returned.
+  - I(id) and I(lss_type) can be combined to return the requested lsses that are of the requested types.
+  - Use I(with_occupancy) to return how many of the 256 volume slots of each lss are in use.
 version_added: "1.1.0"
 author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
 options:
   id:
     description:
-      - The logical subsystem (lss) ID to be queried.
+      - The logical subsystem (lss) IDs to be queried.
       - An lss ID is two hexadecimal characters 00 - FE.
-    type: str
+      - Ranges of lss IDs such as C(10-1F) are accepted, the bounds of a range are inclusive.
+      - When a few lsses are queried, they are fetched concurrently.
+        Otherwise all the lsses are listed once and filtered.
+    type: list
+    elements: str
     aliases: [ lss ]
   lss_type:
     description:
-      - The lss type to query
+      - The lss types to query.
+      - Defaults to C(ckd) when I(id) is not set.
     choices:
       - fb
       - ckd
-    type: str
-    default: ckd
+    type: list
+    elements: str
+  with_occupancy:
+    description:
+      - Return the volume slot occupancy and the capacity of each lss.
+      - When a few lsses are queried, their volumes are listed concurrently, one listing per lss.
+        Otherwise all the volumes of the DS8000 storage system are listed once and bucketed by lss.
+      - When I(cache_ttl) is set, the listing of all the volumes is cached and reused by the following runs.
+    type: bool
+    default: false
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -58,6 +76,31 @@ EXAMPLES = r'''
     username: "{{ ds8000_username }}"
     password: "{{ ds8000_password }}"
     id: '00'
+
+- name: get all the fb and ckd lsses
+  ibm.ds8000.ds8000_lss_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    lss_type:
+      - fb
+      - ckd
+
+- name: get the ckd lsses among lss 00 - 3F
+  ibm.ds8000.ds8000_lss_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    id: 00-3F
+    lss_type: ckd
+
+- name: get how full the ckd lsses are
+  ibm.ds8000.ds8000_lss_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    lss_type: ckd
+    with_occupancy: true
 '''
 
 RETURN = r'''
@@ -125,6 +168,32 @@ lss:
       description: The assigned XRC session timeout value.
       type: int
       sample: 300
+    occupancy:
+      description: The volume slot occupancy and the capacity of the lss.
+      returned: I(with_occupancy=true)
+      type: dict
+      version_added: "1.2.0"
+      contains:
+        used:
+          description: The number of volume slots in use.
+          type: int
+          sample: 40
+        free:
+          description: The number of free volume slots, out of 256.
+          type: int
+          sample: 216
+        base:
+          description: The number of base volumes.
+          type: int
+          sample: 32
+        alias:
+          description: The number of alias volumes.
+          type: int
+          sample: 8
+        capacity:
+          description: The total capacity of the base volumes in bytes.
+          type: int
+          sample: 6825295872
   sample: |
     [
         {
@@ -144,38 +213,111 @@ lss:
     ]
 '''
 
+try:
+    import pyds8k.exceptions
+except ImportError:
+    pass
+
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+    expand_hex_id_ranges,
+)
 
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 KEYS_TO_DELETE = ['link', 'volumes']
+LSS_VOLUME_SLOTS = 256
+DEFAULT_LSS_TYPE = 'ckd'
 
 
 class lssInformer(Ds8000ManagerBase):
     def lss_info_collector(self):
-        lss_by_id = []
-        lss_by_type = []
-
+        lss_types = self.params['lss_type']
         if self.params['id']:
-            lss_by_id = self.verify_ds8000_object_exist(self.client.get_lss, lss_id=self.params['id'])
-            return self.get_ds8000_objects_from_command_output(lss_by_id)
-        elif self.params['lss_type']:
-            lss_by_type = self.verify_ds8000_object_exist(self.client.get_lss, lss_type=self.params['lss_type'])
-            return self.get_ds8000_objects_from_command_output(lss_by_type)
+            lss = self._get_lss_by_ids(self._get_requested_lss_ids())
+        elif len(set(lss_types or [DEFAULT_LSS_TYPE])) == 1:
+            lss_type = (lss_types or [DEFAULT_LSS_TYPE])[0]
+            return self.get_ds8000_objects_from_command_output(self.verify_ds8000_object_exist(self.client.get_lss, lss_type=lss_type))
         else:
-            return self.get_ds8000_objects_from_command_output(self.client.get_lss())
+            lss = self.get_ds8000_objects_from_command_output(self.client.get_lss())
+
+        if lss_types:
+            lss = [entry for entry in lss if entry['type'] in lss_types]
+        return lss
+
+    def _get_requested_lss_ids(self):
+        try:
+            return expand_hex_id_ranges(self.params['id'])
+        except ValueError as generic_exc:
+            self.failed = True
+            self.module.fail_json(msg="Invalid lss ID in id. ERR: {error}".format(error=to_native(generic_exc)))
+
+    def _get_lss_by_ids(self, lss_ids):
+        # Few ids are fetched with one concurrent round of GETs, many ids with a single listing filtered locally.
+        lss_by_id = {}
+        if len(lss_ids) <= self.max_workers:
+            for lss_id, lss, error in self.run_concurrently(lambda lss_id: self.client.get_lss_by_id(lss_id), lss_ids):
+                if isinstance(error, pyds8k.exceptions.NotFound):
+                    continue
+                if error:
+                    self.failed = True
+                    self.module.fail_json(
+                        msg="Failed to get the lss {lss_id} on the DS8000 storage system. ERR: {error}".format(lss_id=lss_id, error=to_native(error))
+                    )
+                lss_by_id[lss_id] = self.get_ds8000_objects_from_command_output(lss)[0]
+        else:
+            requested_lss_ids = set(lss_ids)
+            for lss in self.get_ds8000_objects_from_command_output(self.client.get_lss()):
+                if lss['id'] in requested_lss_ids:
+                    lss_by_id[lss['id']] = lss
+
+        missing_lss_ids = [lss_id for lss_id in lss_ids if lss_id not in lss_by_id]
+        if missing_lss_ids:
+            self.failed = True
+            self.module.fail_json(msg="Lsses {ids} returned no objects on the DS8000 storage system.".format(ids=', '.join(missing_lss_ids)))
+        return [lss_by_id[lss_id] for lss_id in lss_ids]
 
     def lss_info(self):
-        return self.delete_representation_keys(self.lss_info_collector(), key_list=KEYS_TO_DELETE)
+        lss = self.delete_representation_keys(self.lss_info_collector(), key_list=KEYS_TO_DELETE)
+        if self.params['with_occupancy']:
+            self._add_occupancy(lss)
+        return lss
+
+    def _add_occupancy(self, lss):
+        volumes_by_lss = self.get_volumes_by_lss_ids([entry['id'] for entry in lss])
+        for entry in lss:
+            volumes = volumes_by_lss.get(entry['id'], [])
+            alias_volumes = [volume for volume in volumes if self._is_alias_volume(volume)]
+            base_volumes = [volume for volume in volumes if not self._is_alias_volume(volume)]
+            entry['occupancy'] = {
+                'used': len(volumes),
+                'free': LSS_VOLUME_SLOTS - len(volumes),
+                'base': len(base_volumes),
+                'alias': len(alias_volumes),
+                'capacity': sum(int(volume.get('cap') or 0) for volume in base_volumes),
+            }
+
+    def _is_alias_volume(self, volume):
+        # An alias volume refers to the base volume it is an alias of.
+        return bool(volume.get('basevolume')) and volume.get('basevolume') != volume.get('id')
 
 
 def main():
     argument_spec = ds8000_argument_spec()
-    argument_spec.update(id=dict(type='str', aliases=['lss']), lss_type=dict(type='str', default='ckd', choices=['fb', 'ckd']))
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
+    argument_spec.update(
+        id=dict(type='list', elements='str', aliases=['lss']),
+        lss_type=dict(type='list', elements='str', choices=['fb', 'ckd']),
+        with_occupancy=dict(type='bool', default=False),
+    )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        mutually_exclusive=[('id', 'lss_type')],  # TODO change to stg_type?
         supports_check_mode=True,
     )
 
@@ -15,6 +15,7 @@ short_description: Return info on DS8000 managed arrays
 description:
   - Return information pertaining to DS8000 managed arrays.
   - If the optional parameters are not set, information on all managed arrays on the DS8000 storage system will be returned.
+  - When I(expand=true), the pools that the managed arrays belong to are fetched concurrently and joined to each managed array.
 version_added: "1.1.0"
 author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
 options:
@@ -23,10 +24,20 @@ options:
         - The marray id.
     type: str
     aliases: [ marray ]
+  expand:
+    description:
+      - Join the pool that each managed array belongs to, including its rank group and capacity, to the managed array.
+      - Up to I(max_workers) pools are fetched concurrently, more pools are fetched with a single listing of all the pools.
+    type: bool
+    default: false
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
+  - When I(static_cache_ttl) is set, the managed array and pool listings are cached and reused by the following runs.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -42,6 +53,13 @@ EXAMPLES = r'''
     hostname: "{{ ds8000_host }}"
     username: "{{ ds8000_username }}"
     password: "{{ ds8000_password }}"
+
+- name: get all the marrays with their pools
+  ibm.ds8000.ds8000_marray_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    expand: true
 '''
 
 RETURN = r'''
@@ -63,6 +81,36 @@ marrays:
       description: The pool the managed array belongs to.
       type: str
       sample: 'P0'
+    pool_details:
+      description:
+        - The pool the managed array belongs to, or an empty dictionary when the managed array is not assigned to a pool.
+      returned: I(expand=true)
+      type: dict
+      contains:
+        id:
+          description: The pool ID.
+          type: str
+          sample: 'P0'
+        name:
+          description: The pool name.
+          type: str
+          sample: 'fb_pool'
+        node:
+          description: The rank group of the pool.
+          type: str
+          sample: '0'
+        stgtype:
+          description: The storage type of the pool.
+          type: str
+          sample: 'fb'
+        cap:
+          description: The total capacity of the pool in GiB.
+          type: str
+          sample: '2048'
+        capavail:
+          description: The available capacity of the pool in GiB.
+          type: str
+          sample: '1024'
   sample: |
     [
         {
@@ -74,29 +122,71 @@ marrays:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+)
 
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 KEYS_TO_DELETE = ['link']
+POOL_KEYS_TO_DELETE = ['link', 'eserep', 'tserep', 'volumes']
 
 
 class marraysInformer(Ds8000ManagerBase):
     def marray_info_collector(self):
         marray_by_id = []
 
-        if self.params['id']:
+        if self.params['id'] and self.static_cache_ttl:
+            marray_by_id = [marray for marray in self.get_marrays() if marray['id'] == self.params['id']]
+            if not marray_by_id:
+                self.failed = True
+                self.module.fail_json(msg="Unable to find marray {marray_id} on the DS8000 storage system.".format(marray_id=self.params['id']))
+            return marray_by_id
+        elif self.params['id']:
             marray_by_id = self.verify_ds8000_object_exist(self.client.get_marray, marray_id=self.params['id'])
             return self.get_ds8000_objects_from_command_output(marray_by_id)
         else:
-            return self.get_ds8000_objects_from_command_output(self.client.get_marrays())
+            return self.get_marrays()
 
     def marray_info(self):
-        return self.delete_representation_keys(self.marray_info_collector(), key_list=KEYS_TO_DELETE)
+        marrays = self.delete_representation_keys(self.marray_info_collector(), key_list=KEYS_TO_DELETE)
+        if self.params['expand']:
+            pools_by_id = self._get_pools_by_ids(sorted(set(marray['pool'] for marray in marrays if marray.get('pool'))))
+            for marray in marrays:
+                marray['pool_details'] = pools_by_id.get(marray.get('pool'), {})
+        return marrays
+
+    def _get_pools_by_ids(self, pool_ids):
+        # A get per pool is cheaper while all of them fit in one concurrent round trip,
+        # beyond that, or when it is cached, a single listing of every pool costs less.
+        if len(pool_ids) <= self.max_workers and not self.static_cache_ttl:
+            pools = []
+            for pool_id, pool, error in self.run_concurrently(lambda pool_id: self.client.get_pool(pool_id=pool_id), pool_ids):
+                if error:
+                    self.failed = True
+                    self.module.fail_json(
+                        msg="Failed to get pool {pool_id} of the marrays on the DS8000 storage system. ERR: {error}".format(
+                            pool_id=pool_id, error=to_native(error)
+                        )
+                    )
+                pools.extend(self.get_ds8000_objects_from_command_output(pool))
+        else:
+            pools = self.get_pools()
+        pools = self.delete_representation_keys([dict(pool) for pool in pools], key_list=POOL_KEYS_TO_DELETE)
+        return dict((pool['id'], pool) for pool in pools if pool['id'] in pool_ids)
 
 
 def main():
     argument_spec = ds8000_argument_spec()
-    argument_spec.update(id=dict(type='str', aliases=['marray']))
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
+    argument_spec.update(
+        id=dict(type='str', aliases=['marray']),
+        expand=dict(type='bool', default=False),
+    )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
@@ -15,6 +15,11 @@ short_description: Return info on DS8000 pools
 description:
   - Return information pertaining to DS8000 pools.
   - If the optional parameters are not set, information on all pools on the DS8000 storage system will be returned.
+  - With I(history_mode=record), a compact capacity sample of each returned pool is appended to a local SQLite file.
+  - With I(history_mode=query), the recorded capacity samples are read back from the SQLite file and rolled up,
+    without connecting to the DS8000 storage system.
+  - With I(history_mode=forecast), the number of days until each pool is full is forecast from the recorded capacity history
+    or from I(capacity_series), and only the pools at risk are returned.
 version_added: "1.1.0"
 author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
 options:
@@ -23,10 +28,88 @@ options:
         - The pool id.
     type: str
     aliases: [ pool ]
+  history_mode:
+    description:
+      - C(record) returns the pools and appends their total, used, allocated and virtual capacity to I(history_db).
+      - C(query) returns the capacity history of the pools from I(history_db) instead of the pools.
+      - C(forecast) returns the pools that are forecast to be full within I(forecast_threshold_days) instead of the pools.
+    type: str
+    choices:
+      - record
+      - query
+      - forecast
+    version_added: "1.2.0"
+  history_db:
+    description:
+      - The path of the local SQLite file holding the pool capacity history.
+      - The samples of several DS8000 storage systems can share one file, they are kept apart by I(hostname).
+      - Required when I(history_mode) is C(record) or C(query), or C(forecast) without I(capacity_series).
+    type: path
+    version_added: "1.2.0"
+  rollup:
+    description:
+      - How the capacity history is rolled up when I(history_mode=query).
+      - C(samples) returns every recorded sample.
+      - C(daily_max) returns the maximum capacity values of each pool per day.
+      - C(growth_rate) returns the growth per day of each pool between its first and last samples.
+    type: str
+    default: daily_max
+    choices:
+      - samples
+      - daily_max
+      - growth_rate
+    version_added: "1.2.0"
+  history_days:
+    description:
+      - Only use the samples of the last I(history_days) days when I(history_mode) is C(query) or C(forecast).
+      - All the samples are used when not set.
+    type: int
+    version_added: "1.2.0"
+  forecast_model:
+    description:
+      - The fit used to project the used capacity of each pool when I(history_mode=forecast).
+    type: str
+    default: linear
+    choices:
+      - linear
+      - exponential
+    version_added: "1.2.0"
+  forecast_threshold_days:
+    description:
+      - A pool is at risk when it is forecast to be full within this number of days.
+    type: int
+    default: 30
+    version_added: "1.2.0"
+  capacity_series:
+    description:
+      - The capacity samples to forecast from when I(history_mode=forecast), instead of the samples recorded in I(history_db).
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    suboptions:
+      pool:
+        description: The pool ID.
+        type: str
+        required: true
+      ts:
+        description: The time of the sample, in seconds since the epoch.
+        type: int
+        required: true
+      total:
+        description: The total capacity of the pool, in the same unit as I(used), GiB for the recorded samples.
+        type: int
+        required: true
+      used:
+        description: The used capacity of the pool.
+        type: int
+        required: true
 notes:
-  - Supports C(check_mode).
+  - Supports C(check_mode). No sample is recorded in check mode.
+  - When I(static_cache_ttl) is set, the pool listing is cached and reused by the following runs.
+    With I(history_mode=record), the pools are always read from the DS8000 storage system.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -42,12 +125,50 @@ EXAMPLES = r'''
     hostname: "{{ ds8000_host }}"
     username: "{{ ds8000_username }}"
     password: "{{ ds8000_password }}"
+
+- name: get all the pools, from a listing cached for a day
+  ibm.ds8000.ds8000_pool_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    static_cache_ttl: 86400
+
+- name: record the capacity of all the pools, for example from a nightly job
+  ibm.ds8000.ds8000_pool_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    history_mode: record
+    history_db: /var/lib/ds8000/pool_capacity.db
+
+- name: get the capacity growth per day of pool P0 over the last 30 days
+  ibm.ds8000.ds8000_pool_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    id: P0
+    history_mode: query
+    history_db: /var/lib/ds8000/pool_capacity.db
+    rollup: growth_rate
+    history_days: 30
+
+- name: check for pools that are forecast to be full within two weeks
+  ibm.ds8000.ds8000_pool_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    history_mode: forecast
+    history_db: /var/lib/ds8000/pool_capacity.db
+    history_days: 60
+    forecast_threshold_days: 14
+  register: result
+  failed_when: result.at_risk_pools | length > 0
 '''
 
 RETURN = r'''
 pools:
   description: A list of dictionaries describing the pools.
-  returned: success
+  returned: success and I(history_mode) is not set or is C(record)
   type: list
   elements: dict
   contains:
@@ -171,10 +292,82 @@ pools:
               "virtual_cap": "17592186044416"
           }
       ]
+capacity_history:
+  description:
+    - The capacity history of the pools, rolled up as requested by I(rollup).
+    - The capacity values are in GiB. C(total) is the pool capacity C(cap), C(used) the capacity that is no longer available
+      (C(cap) - C(capavail)), C(allocated) the capacity allocated to volumes C(capalloc) and C(virtual) the virtual capacity
+      allocated to thin provisioned volumes C(virtual_capacity_allocated_on_ese).
+    - With I(rollup=growth_rate), each entry holds the last capacity values of the pool, the growth per day of each of them
+      in C(total_per_day), C(used_per_day), C(allocated_per_day) and C(virtual_per_day), and the C(days) between the first and last samples.
+  returned: I(history_mode=query)
+  type: list
+  elements: dict
+  version_added: "1.2.0"
+  sample: |
+    [
+        {
+            "pool": "P0",
+            "day": "2026-10-18",
+            "total": 16384,
+            "used": 4316,
+            "allocated": 4314,
+            "virtual": 8192
+        }
+    ]
+at_risk_pools:
+  description: The pools that are forecast to be full within I(forecast_threshold_days), the soonest first.
+  returned: I(history_mode=forecast)
+  type: list
+  elements: dict
+  version_added: "1.2.0"
+  contains:
+    pool:
+      description: The pool ID.
+      type: str
+      sample: 'P0'
+    total:
+      description: The total capacity of the pool, from the last sample.
+      type: int
+      sample: 16384
+    used:
+      description: The used capacity of the pool, from the last sample.
+      type: int
+      sample: 15360
+    used_per_day:
+      description: The forecast growth of the used capacity per day, at the time of the last sample.
+      type: int
+      sample: 102
+    days_to_full:
+      description: The number of days from the last sample until the pool is forecast to be full.
+      type: float
+      sample: 10.0
+recorded:
+  description: The number of capacity samples recorded.
+  returned: I(history_mode=record)
+  type: int
+  sample: 2
+  version_added: "1.2.0"
 '''
 
+import sqlite3
+from itertools import groupby
+
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ds8000_cache_argument_spec
+from ansible_collections.ibm.ds8000.plugins.module_utils.pool_capacity import (
+    PoolCapacityHistory,
+    forecast_days_to_full,
+    DAILY_MAX,
+    FORECAST_MODELS,
+    LINEAR,
+    ROLLUPS,
+)
+
+RECORD = 'record'
+QUERY = 'query'
+FORECAST = 'forecast'
 
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 KEYS_TO_DELETE = ['link', 'eserep', 'tserep', 'volumes']
@@ -184,29 +377,135 @@ class poolsInformer(Ds8000ManagerBase):
     def pool_info_collector(self):
         pool_by_id = []
 
-        if self.params['id']:
+        if self.params['history_mode'] == RECORD:
+            # A recorded sample must reflect the current capacity.
+            self.static_cache_ttl = 0
+        if self.params['id'] and self.static_cache_ttl:
+            pool_by_id = [pool for pool in self.get_pools() if pool['id'] == self.params['id']]
+            if not pool_by_id:
+                self.failed = True
+                self.module.fail_json(msg="Unable to find pool {pool_id} on the DS8000 storage system.".format(pool_id=self.params['id']))
+            return pool_by_id
+        elif self.params['id']:
             pool_by_id = self.verify_ds8000_object_exist(self.client.get_pool, pool_id=self.params['id'])
             return self.get_ds8000_objects_from_command_output(pool_by_id)
         else:
-            return self.get_ds8000_objects_from_command_output(self.client.get_pools())
+            return self.get_pools()
 
     def pool_info(self):
         return self.delete_representation_keys(self.pool_info_collector(), key_list=KEYS_TO_DELETE)
 
+    def record_pool_capacity(self, pools):
+        if self.module.check_mode:
+            return 0
+        history = self._open_pool_capacity_history()
+        try:
+            return history.record(self.hostname, pools)
+        except sqlite3.Error as generic_exc:
+            self.failed = True
+            self.module.fail_json(
+                msg="Failed to record the pool capacity in {db}. ERR: {error}".format(db=self.params['history_db'], error=to_native(generic_exc))
+            )
+        finally:
+            history.close()
+
+    def query_pool_capacity(self):
+        # The history is read from the local file only, the DS8000 storage system is not queried.
+        history = self._open_pool_capacity_history()
+        try:
+            pool_ids = [self.params['id']] if self.params['id'] else None
+            return history.query(self.hostname, self.params['rollup'], pool_ids=pool_ids, days=self.params['history_days'])
+        except sqlite3.Error as generic_exc:
+            self.failed = True
+            self.module.fail_json(
+                msg="Failed to query the pool capacity in {db}. ERR: {error}".format(db=self.params['history_db'], error=to_native(generic_exc))
+            )
+        finally:
+            history.close()
+
+    def forecast_pool_capacity(self):
+        if self.params['capacity_series'] is not None:
+            samples = sorted(
+                (sample for sample in self.params['capacity_series'] if not self.params['id'] or sample['pool'] == self.params['id']),
+                key=lambda sample: (sample['pool'], sample['ts']),
+            )
+        else:
+            history = self._open_pool_capacity_history()
+            try:
+                samples = history.samples(self.hostname, [self.params['id']] if self.params['id'] else None, days=self.params['history_days'])
+            except sqlite3.Error as generic_exc:
+                self.failed = True
+                self.module.fail_json(
+                    msg="Failed to query the pool capacity in {db}. ERR: {error}".format(db=self.params['history_db'], error=to_native(generic_exc))
+                )
+            finally:
+                history.close()
+
+        at_risk_pools = []
+        for pool_id, pool_samples in groupby(samples, key=lambda sample: sample['pool']):
+            pool_samples = list(pool_samples)
+            forecast = forecast_days_to_full(pool_samples, self.params['forecast_model'])
+            if forecast and forecast['days_to_full'] <= self.params['forecast_threshold_days']:
+                forecast.update(pool=pool_id, total=pool_samples[-1]['total'], used=pool_samples[-1]['used'])
+                at_risk_pools.append(forecast)
+        return sorted(at_risk_pools, key=lambda forecast: forecast['days_to_full'])
+
+    def _open_pool_capacity_history(self):
+        try:
+            return PoolCapacityHistory(self.params['history_db'])
+        except (sqlite3.Error, IOError, OSError) as generic_exc:
+            self.failed = True
+            self.module.fail_json(
+                msg="Failed to open the pool capacity history {db}. ERR: {error}".format(db=self.params['history_db'], error=to_native(generic_exc))
+            )
+
 
 def main():
     argument_spec = ds8000_argument_spec()
-    argument_spec.update(id=dict(type='str', aliases=['pool']))
+    argument_spec.update(ds8000_cache_argument_spec())
+    argument_spec.update(
+        id=dict(type='str', aliases=['pool']),
+        history_mode=dict(type='str', choices=[RECORD, QUERY, FORECAST]),
+        history_db=dict(type='path'),
+        rollup=dict(type='str', default=DAILY_MAX, choices=ROLLUPS),
+        history_days=dict(type='int'),
+        forecast_model=dict(type='str', default=LINEAR, choices=FORECAST_MODELS),
+        forecast_threshold_days=dict(type='int', default=30),
+        capacity_series=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                pool=dict(type='str', required=True),
+                ts=dict(type='int', required=True),
+                total=dict(type='int', required=True),
+                used=dict(type='int', required=True),
+            ),
+        ),
+    )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        required_if=[
+            ['history_mode', RECORD, ('history_db',)],
+            ['history_mode', QUERY, ('history_db',)],
+            ['history_mode', FORECAST, ('history_db', 'capacity_series'), True],
+        ],
         supports_check_mode=True,
     )
 
     pool_informer = poolsInformer(module)
 
+    if module.params['history_mode'] == FORECAST:
+        module.exit_json(changed=pool_informer.changed, at_risk_pools=pool_informer.forecast_pool_capacity())
+
+    if module.params['history_mode'] == QUERY:
+        module.exit_json(changed=pool_informer.changed, capacity_history=pool_informer.query_pool_capacity())
+
     pools = pool_informer.pool_info()
 
+    if module.params['history_mode'] == RECORD:
+        module.exit_json(changed=pool_informer.changed, pools=pools, recorded=pool_informer.record_pool_capacity(pools))
+
     module.exit_json(changed=pool_informer.changed, pools=pools)
 
 
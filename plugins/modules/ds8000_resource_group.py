@@ -14,6 +14,8 @@ module: ds8000_resource_group
 short_description: Manage DS8000 resource groups
 description:
   - Manage DS8000 resource groups.
+  - Use I(resource_groups) to manage many resource groups in one task. One listing of the resource groups drives
+    the create, change and delete decisions, and the changes are applied concurrently.
 version_added: "1.1.0"
 author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
 options:
@@ -22,6 +24,7 @@ options:
       - The resource group label is 1 to 32 characters and is limited to upper and lower case alphabetic and numeric characters,
         and the special characters (-), (_), and (.).
       - Required when I(state=present)
+      - Mutually exclusive with I(resource_groups).
     type: str
   state:
     description:
@@ -63,10 +66,62 @@ options:
       - A Session ID is a hexadecimal number in the 01 - FF range.
     type: list
     elements: str
+  resource_groups:
+    description:
+      - A list of resource groups to manage.
+      - Mutually exclusive with I(label), I(id), I(name), I(cs_global), I(pass_global), I(gm_masters) and I(gm_sessions).
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    suboptions:
+      label:
+        description:
+          - The resource group label.
+          - Required when the resource group is created.
+        type: str
+      id:
+        description:
+          - The resource group ID.
+          - The resource group is looked up by I(id) when it is set, and by I(label) otherwise.
+        type: str
+      state:
+        description:
+          - Specify the state the resource group should be in.
+          - Defaults to the top level I(state).
+        type: str
+        choices:
+          - present
+          - absent
+      name:
+        description:
+          - The nickname of the resource group.
+        type: str
+      cs_global:
+        description:
+          - The Copy Services Global Resource Scope of the resource group.
+        type: str
+      pass_global:
+        description:
+          - The Pass-thru Global Copy Services Resource Scope of the resource group.
+        type: str
+      gm_masters:
+        description:
+          - The Global Mirror session IDs that are allowed to be used as a master session.
+        type: list
+        elements: str
+      gm_sessions:
+        description:
+          - The Global Mirror session IDs that are allowed to be used.
+        type: list
+        elements: str
 notes:
   - Supports C(check_mode).
+  - Supports C(diff_mode).
+  - Only the parameters that are set and differ from the existing resource group are changed.
+    Nothing is sent to the DS8000 when the resource group is already in the requested state.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
 '''
 
 EXAMPLES = r'''
@@ -89,12 +144,27 @@ EXAMPLES = r'''
     password: "{{ ds8000_password }}"
     label: my_rg
     state: absent
+
+- name: Ensure that several resource groups are in the requested state
+  ibm.ds8000.ds8000_resource_group:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    resource_groups:
+      - label: my_rg_1
+        gm_sessions: ["01"]
+      - label: my_rg_2
+        name: rg_two
+      - label: my_old_rg
+        state: absent
 '''
 
 RETURN = r'''
 resource_groups:
-    description: A list of dictionaries describing the resource groups.
-    returned: I(state=present) changed
+    description:
+      - A list of dictionaries describing the resource groups.
+      - When I(resource_groups) is set, the list describes every requested resource group and the action taken on it.
+    returned: I(state=present) changed, or I(resource_groups) is set
     type: list
     elements: dict
     contains:
@@ -102,6 +172,18 @@ resource_groups:
         description: The Resource Group ID.
         type: str
         sample: "RG1"
+      label:
+        description: The resource group label.
+        type: str
+        returned: I(resource_groups) is set
+        sample: "my_rg"
+        version_added: "1.2.0"
+      action:
+        description: The action taken on the resource group, one of C(create), C(change), C(delete) or C(none).
+        type: str
+        returned: I(resource_groups) is set
+        sample: "create"
+        version_added: "1.2.0"
     sample: |
       [
         {
@@ -112,13 +194,29 @@ resource_groups:
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ABSENT, PRESENT
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_concurrency_argument_spec,
+    ABSENT,
+    PRESENT,
+)
 
 # The REST API returns links. pyds8k representation returns as links or with values containing empty strings.
 REPR_KEYS_TO_DELETE = ['link', 'name', 'label']
+CHANGE_FIELDS = ['cs_global', 'pass_global', 'gm_masters', 'gm_sessions']
+NO_ACTION = 'none'
+CREATE = 'create'
+CHANGE = 'change'
+DELETE = 'delete'
+RESOURCE_GROUP_RESOURCE_TYPE = 'resource_groups'
 
 
 class ResourceGroupManager(Ds8000ManagerBase):
+    def __init__(self, module):
+        super(ResourceGroupManager, self).__init__(module)
+        self.diff = None
+
     def resource_group_present(self):
         self.resource_group_info = []
         self._verify_resource_group()
@@ -133,36 +231,53 @@ class ResourceGroupManager(Ds8000ManagerBase):
         if not existing_resource_group_object:
             self._create_resource_group()
             # Create only accepts label and name.  If any of the other parameters are provided, run a change after the create to set them also.
-            change_params_dict = dict(
-                cs_global=self.params['cs_global'],
-                pass_global=self.params['pass_global'],
-                gm_masters=self.params['gm_masters'],
-                gm_sessions=self.params['gm_sessions'],
-            )
-            if any(change_params_dict.values()):
-                self._change_resource_group(change_params_dict)
+            change_params_dict = dict((field, self.params[field]) for field in CHANGE_FIELDS if self.params[field] is not None)
+            self._add_resource_group_diff(self.params['label'], {}, dict(label=self.params['label'], name=self.params['name'], **change_params_dict))
+            if change_params_dict:
+                self._change_resource_group(self.params['id'], change_params_dict)
         else:
-            # Create a dict of the existing object values to compare to specified parameters
-            existing_resource_group_dict = dict(
-                label=existing_resource_group_object.label,
-                name=existing_resource_group_object.name,
-                cs_global=existing_resource_group_object.name,
-                pass_global=existing_resource_group_object.pass_global,
-                gm_masters=existing_resource_group_object.gm_masters,
-                gm_sessions=existing_resource_group_object.gm_sessions,
-            )
+            param_args = self._get_resource_group_changes(existing_resource_group_object, self._get_requested_resource_group(self.params))
+            if param_args:
+                self._add_resource_group_diff(
+                    existing_resource_group_object.id,
+                    dict((field, getattr(existing_resource_group_object, field, None)) for field in param_args),
+                    param_args,
+                )
+                self._change_resource_group(existing_resource_group_object.id, param_args)
 
-            params_dict = dict(
-                label=self.params['label'],
-                name=self.params['name'],
-                cs_global=self.params['cs_global'],
-                pass_global=self.params['pass_global'],
-                gm_masters=self.params['gm_masters'],
-                gm_sessions=self.params['gm_sessions'],
-            )
+    def _get_requested_resource_group(self, params):
+        return dict(
+            label=params['label'],
+            name=params['name'],
+            cs_global=params['cs_global'],
+            pass_global=params['pass_global'],
+            gm_masters=params['gm_masters'],
+            gm_sessions=params['gm_sessions'],
+        )
 
-            if params_dict != existing_resource_group_dict:
-                self._change_resource_group(params_dict)
+    def _get_resource_group_changes(self, existing_resource_group_object, params_dict):
+        # Only the fields that are specified and differ from the existing resource group are returned.
+        changes = {}
+        for field, value in params_dict.items():
+            if value is None:
+                continue
+            existing_value = getattr(existing_resource_group_object, field, None)
+            if isinstance(value, list):
+                if sorted(value) != sorted(existing_value or []):
+                    changes[field] = value
+            elif value != (existing_value or ''):
+                changes[field] = value
+        return changes
+
+    def _add_resource_group_diff(self, key, before, after):
+        if self.diff is None:
+            self.diff = {'before': {'resource_groups': {}}, 'after': {'resource_groups': {}}}
+        self.diff['before']['resource_groups'][key] = before
+        self.diff['after']['resource_groups'][key] = after
+
+    def _update_resource_group(self, resource_group_id, changes):
+        # update_resource_group sends every field, unset ones as empty strings, so only the changed fields are sent to the resource group.
+        return self.client.one(RESOURCE_GROUP_RESOURCE_TYPE, resource_group_id, rebuild_url=True).update(changes)
 
     def _create_resource_group(self):
         if not self.params['label']:
@@ -182,6 +297,7 @@ class ResourceGroupManager(Ds8000ManagerBase):
                 # set id in the params dict to the created id in case a change needs to be run to update optional fields
                 # TODO is this ok, or should I save in a class variable?
                 self.params['id'] = resource_group[0].id
+                self.resource_group_index = None
                 self.resource_group_info = self.delete_representation_keys(
                     self.get_ds8000_objects_from_command_output(resource_group), key_list=REPR_KEYS_TO_DELETE
                 )
@@ -194,16 +310,17 @@ class ResourceGroupManager(Ds8000ManagerBase):
                 )
             )
 
-    def _change_resource_group(self, param_args):
+    def _change_resource_group(self, resource_group_id, param_args):
         try:
             if not self.module.check_mode:
-                self.client.update_resource_group(self.params['id'], **param_args)
+                self._update_resource_group(resource_group_id, param_args)
                 # change_resource_group only returns a success dict
                 # the module returns id on changed, so build the list
-                self.resource_group_info.append({'id': self.params['id']})
+                if {'id': resource_group_id} not in self.resource_group_info:
+                    self.resource_group_info.append({'id': resource_group_id})
                 # query the resource group to get the actual values
                 # self.resource_group_info = self.delete_representation_keys(
-                #     self.get_ds8000_objects_from_command_output(self.client.get_resource_group(self.params['id'])), key_list=REPR_KEYS_TO_DELETE
+                #     self.get_ds8000_objects_from_command_output(self.client.get_resource_group(resource_group_id)), key_list=REPR_KEYS_TO_DELETE
                 # )
             self.changed = True
         except Exception as generic_exc:
@@ -216,6 +333,7 @@ class ResourceGroupManager(Ds8000ManagerBase):
             try:
                 if not self.module.check_mode:
                     self.client.delete_resource_group(resource_group.id)
+                    self.resource_group_index = None
                 self.changed = True
             except Exception as generic_exc:
                 self.failed = True
@@ -227,13 +345,101 @@ class ResourceGroupManager(Ds8000ManagerBase):
 
     def _does_resource_group_exist(self):
         if self.params['id']:
-            return self.verify_ds8000_object_exist(self.client.get_resource_group, self.params['id'])
+            resource_group = self.get_resource_group_from_id(self.params['id'])
+            if not resource_group:
+                self.failed = True
+                self.module.fail_json(msg="Resource group {rg_id} returned no objects on the DS8000 storage system.".format(rg_id=self.params['id']))
+            return resource_group
 
         return self.get_resource_group_from_label(self.params['label'])
 
+    def resource_groups_state(self):
+        # One listing drives the decisions for every resource group.
+        plan = []
+        errors = []
+        for resource_group in self.params['resource_groups']:
+            state = resource_group['state'] or self.params['state']
+            if resource_group['id']:
+                existing_resource_group_object = self.get_resource_group_from_id(resource_group['id'])
+            else:
+                existing_resource_group_object = self.get_resource_group_from_label(resource_group['label'])
+
+            if state == ABSENT:
+                action = DELETE if existing_resource_group_object else NO_ACTION
+                changes = {}
+            elif not existing_resource_group_object:
+                if not resource_group['label']:
+                    errors.append("label is required when creating a resource group ({rg_id}).".format(rg_id=resource_group['id']))
+                    continue
+                action = CREATE
+                changes = dict((field, resource_group[field]) for field in CHANGE_FIELDS if resource_group[field] is not None)
+                self._add_resource_group_diff(resource_group['label'], {}, dict(label=resource_group['label'], name=resource_group['name'], **changes))
+            else:
+                changes = self._get_resource_group_changes(existing_resource_group_object, self._get_requested_resource_group(resource_group))
+                action = CHANGE if changes else NO_ACTION
+                if changes:
+                    self._add_resource_group_diff(
+                        existing_resource_group_object.id,
+                        dict((field, getattr(existing_resource_group_object, field, None)) for field in changes),
+                        changes,
+                    )
+            resource_group_id = existing_resource_group_object.id if existing_resource_group_object else resource_group['id']
+            plan.append(dict(label=resource_group['label'], name=resource_group['name'], id=resource_group_id, action=action, changes=changes))
+        if errors:
+            self.failed = True
+            self.module.fail_json(msg="Failed to create resource group on DS8000 storage. ERR: {error}".format(error=' '.join(errors)))
+
+        actions = [item for item in plan if item['action'] != NO_ACTION]
+        if actions:
+            self.changed = True
+            if not self.module.check_mode:
+                errors = self._apply_resource_group_plan(actions)
+                self.resource_group_index = None
+                if errors:
+                    self.failed = True
+                    self.module.fail_json(msg=' '.join(errors), changed=self.changed, resource_groups=self._format_resource_group_outcomes(plan))
+        return {'changed': self.changed, 'failed': self.failed, 'resource_groups': self._format_resource_group_outcomes(plan)}
+
+    def _apply_resource_group_plan(self, actions):
+        # Creates without an id compete for the next free id on the DS8000, so they run one after the other in a single work item.
+        work_items = [[item] for item in actions if item['action'] != CREATE or item['id']]
+        automatic_id_creates = [item for item in actions if item['action'] == CREATE and not item['id']]
+        if automatic_id_creates:
+            work_items.append(automatic_id_creates)
+
+        errors = []
+        for work_item, dummy, error in self.run_concurrently(self._apply_resource_group_actions, work_items):
+            if error:
+                errors.append(to_native(error))
+        return errors
+
+    def _apply_resource_group_actions(self, items):
+        for item in items:
+            try:
+                if item['action'] == CREATE:
+                    resource_group = self.client.create_resource_group(label=item['label'], name=item['name'], resource_group_id=item['id'])
+                    item['id'] = resource_group[0].id
+                    # Create only accepts label and name, the other fields are set with a change after the create.
+                    if item['changes']:
+                        self._update_resource_group(item['id'], item['changes'])
+                elif item['action'] == CHANGE:
+                    self._update_resource_group(item['id'], item['changes'])
+                else:
+                    self.client.delete_resource_group(item['id'])
+            except Exception as generic_exc:
+                raise Exception(
+                    "Failed to {action} the resource group {rg}. ERR: {error}".format(
+                        action=item['action'], rg=item['id'] or item['label'], error=to_native(generic_exc)
+                    )
+                )
+
+    def _format_resource_group_outcomes(self, plan):
+        return [{'label': item['label'], 'id': item['id'], 'action': item['action']} for item in plan]
+
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
     argument_spec.update(
         label=dict(type='str'),
         state=dict(type='str', default=PRESENT, choices=[ABSENT, PRESENT]),
@@ -243,20 +449,41 @@ def main():
         pass_global=dict(type='str', no_log=False),
         gm_masters=dict(type='list', elements='str'),
         gm_sessions=dict(type='list', elements='str'),
+        resource_groups=dict(
+            type='list',
+            elements='dict',
+            options=dict(
+                label=dict(type='str'),
+                id=dict(type='str'),
+                state=dict(type='str', choices=[ABSENT, PRESENT]),
+                name=dict(type='str'),
+                cs_global=dict(type='str'),
+                pass_global=dict(type='str', no_log=False),
+                gm_masters=dict(type='list', elements='str'),
+                gm_sessions=dict(type='list', elements='str'),
+            ),
+            required_one_of=[['label', 'id']],
+        ),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[['resource_groups', field] for field in ['label', 'id', 'name', 'cs_global', 'pass_global', 'gm_masters', 'gm_sessions']],
         supports_check_mode=True,
     )
 
     resource_group = ResourceGroupManager(module)
 
-    if module.params['state'] == PRESENT:
+    if module.params['resource_groups']:
+        result = resource_group.resource_groups_state()
+    elif module.params['state'] == PRESENT:
         result = resource_group.resource_group_present()
     elif module.params['state'] == ABSENT:
         result = resource_group.resource_group_absent()
 
+    if module._diff and resource_group.diff:
+        result['diff'] = resource_group.diff
+
     if result['failed']:
         module.fail_json(**result)
     else:
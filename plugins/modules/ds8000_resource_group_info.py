@@ -14,6 +14,7 @@ module: ds8000_resource_group_info
 short_description: Return info on DS8000 resource groups
 description:
   - Return info on DS8000 resource groups.
+  - Use I(with_membership) to count the volumes, hosts and lsses that belong to each resource group.
 version_added: "1.1.0"
 author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
 options:
@@ -25,10 +26,20 @@ options:
     description:
       - The resource group label.
     type: str
+  with_membership:
+    description:
+      - Return the number of volumes, hosts and lsses in each resource group, and the total capacity of its volumes.
+      - The volumes, hosts and lsses are listed once each, concurrently, and joined to the resource groups in a single pass.
+      - Objects with an empty resource group are counted in the default resource group C(RG0).
+      - Objects that do not report a resource group at all, on code levels that do not return it, are not counted and a warning is returned.
+    type: bool
+    default: false
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
 '''
 
 EXAMPLES = r'''
@@ -51,6 +62,13 @@ EXAMPLES = r'''
     username: "{{ ds8000_username }}"
     password: "{{ ds8000_password }}"
     id: RG1
+
+- name: get the volume capacity of every resource group for chargeback
+  ibm.ds8000.ds8000_resource_group_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    with_membership: true
 '''
 
 RETURN = r'''
@@ -102,6 +120,28 @@ resource_groups:
         type: list
         elements: str
         sample: ["BE", "FE"]
+      membership:
+        description: The objects that belong to the resource group.
+        returned: I(with_membership=true)
+        type: dict
+        version_added: "1.2.0"
+        contains:
+          volumes:
+            description: The number of volumes in the resource group.
+            type: int
+            sample: 120
+          hosts:
+            description: The number of hosts in the resource group.
+            type: int
+            sample: 4
+          lss:
+            description: The number of lsses in the resource group.
+            type: int
+            sample: 2
+          capacity:
+            description: The total capacity of the volumes in the resource group in bytes.
+            type: int
+            sample: 2199023255552
     sample: |
       [
         {
@@ -121,7 +161,13 @@ resource_groups:
 REPR_KEYS_TO_DELETE = ['link']
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_concurrency_argument_spec,
+    get_member_resource_group,
+)
 
 
 class ResourceGroupInformer(Ds8000ManagerBase):
@@ -131,20 +177,62 @@ class ResourceGroupInformer(Ds8000ManagerBase):
         if self.params['label']:
             return self.get_ds8000_objects_from_command_output(self.get_resource_group_from_label(self.params['label']))
 
-        return self.get_ds8000_objects_from_command_output(self.client.get_resource_groups())
+        return self.get_ds8000_objects_from_command_output(list(self.get_resource_group_index()['id'].values()))
 
     def resource_group_info(self):
         if not self.module.check_mode:
-            return self.delete_representation_keys(self.resource_group_info_collector(), key_list=REPR_KEYS_TO_DELETE)
+            resource_groups = self.delete_representation_keys(self.resource_group_info_collector(), key_list=REPR_KEYS_TO_DELETE)
+            if self.params['with_membership']:
+                self._add_membership(resource_groups)
+            return resource_groups
 
         return {}
 
+    def _add_membership(self, resource_groups):
+        membership = dict((resource_group['id'], dict(volumes=0, hosts=0, lss=0, capacity=0)) for resource_group in resource_groups)
+        unreported = dict(volumes=0, hosts=0, lss=0)
+        listings = [('volumes', self.client.get_volumes), ('hosts', self.client.get_hosts), ('lss', self.client.get_lss)]
+        for (member_type, dummy), members, error in self.run_concurrently(lambda listing: listing[1](), listings):
+            if error:
+                self.failed = True
+                self.module.fail_json(
+                    msg="Failed to get the {member_type} on the DS8000 storage system. ERR: {error}".format(member_type=member_type, error=to_native(error))
+                )
+            for member in members:
+                representation = member.representation
+                member_resource_group = get_member_resource_group(representation)
+                if member_resource_group is None:
+                    unreported[member_type] += 1
+                    continue
+                counters = membership.get(self._get_member_resource_group_id(member_resource_group))
+                if counters is None:
+                    continue
+                counters[member_type] += 1
+                if member_type == 'volumes':
+                    counters['capacity'] += int(representation.get('cap') or 0)
+
+        for resource_group in resource_groups:
+            resource_group['membership'] = membership[resource_group['id']]
+        for member_type in sorted(unreported):
+            if unreported[member_type]:
+                self.module.warn(
+                    "{count} {member_type} do not report a resource group on the DS8000 storage system and are not counted in the membership.".format(
+                        count=unreported[member_type], member_type=member_type
+                    )
+                )
+
+    def _get_member_resource_group_id(self, member_resource_group):
+        resource_group = self.get_resource_group_from_id(member_resource_group) or self.get_resource_group_from_label(member_resource_group)
+        return resource_group.id if resource_group else member_resource_group
+
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
     argument_spec.update(
         id=dict(type='str'),
         label=dict(type='str'),
+        with_membership=dict(type='bool', default=False),
     )
 
     module = AnsibleModule(
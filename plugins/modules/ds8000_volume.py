@@ -69,7 +69,7 @@ options:
   pool:
     description:
       - The pool id that the volume will be created on.
-      - Required when I(state=present)
+      - Required when I(state=present), unless I(placement) is set.
     type: str
   storage_allocation_method:
     description:
@@ -103,11 +103,47 @@ options:
       -  List of existing base CKD volume IDs to create aliases for.
     type: list
     elements: str
+  placement:
+    description:
+      - Spread the I(quantity) volumes across pools, and across lsses when I(placement_lss) is set, instead of creating them in I(pool).
+      - The pools are read once with their free capacity, and the lss occupancy is read once.
+      - C(round_robin) assigns the volumes to the pools in turn.
+      - C(most_free) assigns each volume to the pool with the most free capacity left.
+      - C(rank_even) assigns the volumes in proportion to the capacity of each pool, so that each rank receives a similar share.
+      - Each lss is on the server of its parity, so a volume only goes to an lss with the parity of its pool's server.
+        Among those, the lss with the most free volume slots is used.
+      - The volumes are created in one batch per pool and lss, the batches run concurrently.
+      - Mutually exclusive with I(pool), I(lss) and I(id).
+    choices:
+      - round_robin
+      - most_free
+      - rank_even
+    type: str
+    version_added: "1.2.0"
+  placement_pools:
+    description:
+      - The pool IDs that I(placement) can use.
+      - Defaults to all the pools of I(volume_type).
+    type: list
+    elements: str
+    version_added: "1.2.0"
+  placement_lss:
+    description:
+      - The lss IDs or lss ID ranges, such as C(10-1F), that I(placement) can use.
+      - The lsses of the other I(volume_type) are skipped.
+      - When not set, the DS8000 chooses the lss of each volume.
+    type: list
+    elements: str
+    version_added: "1.2.0"
 notes:
   - Does not support C(check_mode).
   - Is not idempotent.
+  - Creating or deleting volumes invalidates the cached volume and pool listings in I(cache_dir).
+    Deleting volumes also invalidates the cached volume mappings.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -131,6 +167,19 @@ EXAMPLES = r'''
     password: "{{ ds8000_password }}"
     id: "FFFF"
     state: absent
+
+- name: Spread 32 volumes across the pools and the lsses 10 - 17 by free capacity
+  ibm.ds8000.ds8000_volume:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    name: volume_name_test
+    state: present
+    capacity: "100"
+    quantity: 32
+    placement: most_free
+    placement_lss:
+      - 10-17
 '''
 
 RETURN = r'''
@@ -155,13 +204,57 @@ volumes:
           "name": "ansible"
         }
       ]
+placement:
+    description: The batches of volumes created by I(placement), one per pool and lss.
+    returned: I(placement) is set
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    contains:
+      pool:
+        description: The pool ID.
+        type: str
+        sample: "P0"
+      lss:
+        description: The lss ID, or null when the DS8000 chooses the lss.
+        type: str
+        sample: "10"
+      quantity:
+        description: The number of volumes created in the pool and lss.
+        type: int
+        sample: 4
+    sample: |
+      [
+        {
+          "pool": "P0",
+          "lss": "10",
+          "quantity": 4
+        }
+      ]
 '''
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ABSENT, PRESENT
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+    expand_hex_id_ranges,
+    ABSENT,
+    PRESENT,
+    ALL_VOLUMES_CACHE_KEY,
+    VOLUME_MAPPING_MATRIX_CACHE_KEY,
+    POOLS_CACHE_KEY,
+)
 
 REPR_KEYS_TO_DELETE = ['link', 'hosts', 'flashcopy', 'pprc']
+ROUND_ROBIN = 'round_robin'
+MOST_FREE = 'most_free'
+RANK_EVEN = 'rank_even'
+LSS_VOLUME_SLOTS = 256
+# A 3390 cylinder is 15 tracks of 56664 bytes, and a mod1 is 1113 cylinders.
+CAPACITY_TYPE_BYTES = {'gib': 1024**3, 'bytes': 1, 'cyl': 849960, 'mod1': 1113 * 849960}
 
 
 class VolumeManager(Ds8000ManagerBase):
@@ -171,6 +264,9 @@ class VolumeManager(Ds8000ManagerBase):
                 self.module.fail_json(msg="Only one id is allowed when creating alias volumes.")
 
             self._create_alias_volume(self.params['id'][0])
+        elif self.params['placement']:
+            self._create_placed_volumes()
+            return {'changed': self.changed, 'failed': self.failed, 'volumes': self.volume_facts, 'placement': self.placement}
         else:
             self._create_volume()
         return {'changed': self.changed, 'failed': self.failed, 'volumes': self.volume_facts}
@@ -202,11 +298,141 @@ class VolumeManager(Ds8000ManagerBase):
             volumes = self.client.create_volumes(**kwargs)
             self.check_multi_response_results(volumes, item_list=self.params['id'] if self.params['id'] else None, item_name='id')
             self.volume_facts = self.delete_representation_keys(self.get_ds8000_objects_from_command_output(volumes), key_list=REPR_KEYS_TO_DELETE)
+            self.cache.invalidate(ALL_VOLUMES_CACHE_KEY)
+            self.invalidate_static_cache(POOLS_CACHE_KEY)
             self.changed = True
         except Exception as generic_exc:
             self.failed = True
             self.module.fail_json(msg="Failed to create volume on the DS8000 storage system. ERR: {error}".format(error=to_native(generic_exc)))
 
+    def _create_placed_volumes(self):
+        pools = self._get_placement_pools()
+        pool_ids = self._place_volumes_in_pools(pools)
+        lss_ids = self._place_volumes_in_lsses(pools, pool_ids)
+
+        batches = {}
+        for pool_id, lss_id in zip(pool_ids, lss_ids):
+            batches[(pool_id, lss_id)] = batches.get((pool_id, lss_id), 0) + 1
+        self.placement = [dict(pool=pool_id, lss=lss_id, quantity=quantity) for (pool_id, lss_id), quantity in batches.items()]
+
+        results = []
+        errors = []
+        for batch, volumes, error in self.run_concurrently(self._create_volume_batch, self.placement):
+            if error:
+                errors.append(
+                    "Failed to create {quantity} volumes in pool {pool} lss {lss}. ERR: {error}".format(
+                        quantity=batch['quantity'], pool=batch['pool'], lss=batch['lss'], error=to_native(error)
+                    )
+                )
+                continue
+            results.extend(volumes)
+        self.cache.invalidate(ALL_VOLUMES_CACHE_KEY)
+        self.invalidate_static_cache(POOLS_CACHE_KEY)
+        if results:
+            self.changed = True
+        if errors:
+            self.failed = True
+            self.module.fail_json(msg="Failed to create volume on the DS8000 storage system. ERR: {error}".format(error=' '.join(errors)), changed=self.changed)
+        self.check_multi_response_results(results)
+        self.volume_facts = self.delete_representation_keys(self.get_ds8000_objects_from_command_output(results), key_list=REPR_KEYS_TO_DELETE)
+
+    def _create_volume_batch(self, batch):
+        return self.client.create_volumes(
+            name_col=None,  # create_volumes required arg, needs to be set to None to not use
+            name=self.params['name'],
+            cap=self.params['capacity'],
+            pool=batch['pool'],
+            stgtype=self.params['volume_type'],
+            tp=self.params['storage_allocation_method'],
+            captype=self.params['capacity_type'],
+            lss=batch['lss'],
+            quantity=batch['quantity'],
+        )
+
+    def _get_placement_pools(self):
+        pools = [pool for pool in self.get_pools() if pool.get('stgtype') == self.params['volume_type']]
+        if self.params['placement_pools']:
+            pools_by_id = dict((pool['id'], pool) for pool in pools)
+            missing_pool_ids = [pool_id for pool_id in self.params['placement_pools'] if pool_id not in pools_by_id]
+            if missing_pool_ids:
+                self.failed = True
+                self.module.fail_json(
+                    msg="Pools {pool_ids} are not {volume_type} pools on the DS8000 storage system.".format(
+                        pool_ids=', '.join(missing_pool_ids), volume_type=self.params['volume_type']
+                    )
+                )
+            pools = [pools_by_id[pool_id] for pool_id in self.params['placement_pools']]
+        if not pools:
+            self.failed = True
+            self.module.fail_json(msg="No {volume_type} pool found on the DS8000 storage system.".format(volume_type=self.params['volume_type']))
+        return pools
+
+    def _place_volumes_in_pools(self, pools):
+        # Returns the pool id of each of the requested volumes.
+        quantity = self.params['quantity']
+        if self.params['placement'] == ROUND_ROBIN:
+            return [pools[index % len(pools)]['id'] for index in range(quantity)]
+
+        if self.params['placement'] == MOST_FREE:
+            # The free capacity of a pool is in GiB.
+            volume_gib = float(self.params['capacity']) * CAPACITY_TYPE_BYTES[self.params['capacity_type']] / CAPACITY_TYPE_BYTES['gib']
+            free = dict((pool['id'], int(pool.get('capavail') or 0)) for pool in pools)
+            pool_ids = []
+            for dummy in range(quantity):
+                pool_id = max(pools, key=lambda pool: free[pool['id']])['id']
+                free[pool_id] -= volume_gib
+                pool_ids.append(pool_id)
+            return pool_ids
+
+        # rank_even: the pool capacity stands for the number of ranks, the shares are rounded by largest remainder.
+        weights = [int(pool.get('cap') or 0) for pool in pools]
+        if not sum(weights):
+            weights = [1] * len(pools)
+        exact_shares = [float(quantity * weight) / sum(weights) for weight in weights]
+        shares = [int(share) for share in exact_shares]
+        for index in sorted(range(len(pools)), key=lambda index: exact_shares[index] - shares[index], reverse=True)[: quantity - sum(shares)]:
+            shares[index] += 1
+        pool_ids = []
+        while len(pool_ids) < quantity:
+            for index, pool in enumerate(pools):
+                if shares[index]:
+                    shares[index] -= 1
+                    pool_ids.append(pool['id'])
+        return pool_ids
+
+    def _place_volumes_in_lsses(self, pools, pool_ids):
+        # Returns the lss id of each of the requested volumes, or None to let the DS8000 choose.
+        if not self.params['placement_lss']:
+            return [None] * len(pool_ids)
+        try:
+            candidate_lss_ids = expand_hex_id_ranges(self.params['placement_lss'])
+        except ValueError as generic_exc:
+            self.failed = True
+            self.module.fail_json(msg="Invalid lss ID range in placement_lss. ERR: {error}".format(error=to_native(generic_exc)))
+
+        # An lss holds volumes of one type, so the lsses of the other type are left out.
+        # An lss that does not exist yet is created with the type of its first volume.
+        lss_types = dict((lss['id'], lss.get('type')) for lss in self.get_ds8000_objects_from_command_output(self.client.get_lss()))
+        candidate_lss_ids = [lss_id for lss_id in candidate_lss_ids if lss_types.get(lss_id, self.params['volume_type']) == self.params['volume_type']]
+        if not candidate_lss_ids:
+            self.failed = True
+            self.module.fail_json(msg="No lss in placement_lss is a {volume_type} lss.".format(volume_type=self.params['volume_type']))
+
+        volumes_by_lss = self.get_volumes_by_lss_ids(candidate_lss_ids)
+        free_slots = dict((lss_id, LSS_VOLUME_SLOTS - len(volumes_by_lss.get(lss_id, []))) for lss_id in candidate_lss_ids)
+        pool_nodes = dict((pool['id'], pool.get('node')) for pool in pools)
+        lss_ids = []
+        for pool_id in pool_ids:
+            node = pool_nodes[pool_id]
+            candidates = [lss_id for lss_id in candidate_lss_ids if free_slots[lss_id] and (node in (None, '') or int(lss_id, 16) % 2 == int(node))]
+            if not candidates:
+                self.failed = True
+                self.module.fail_json(msg="No lss in placement_lss has a free volume slot for pool {pool_id}.".format(pool_id=pool_id))
+            lss_id = max(candidates, key=lambda lss_id: free_slots[lss_id])
+            free_slots[lss_id] -= 1
+            lss_ids.append(lss_id)
+        return lss_ids
+
     def _create_alias_volume(self, volume_id):
         try:
             kwargs = dict(
@@ -230,6 +456,8 @@ class VolumeManager(Ds8000ManagerBase):
 
             self.check_multi_response_results(volumes, item_list=alias_ids, item_name='id')
             self.volume_facts = self.delete_representation_keys(self.get_ds8000_objects_from_command_output(volumes), key_list=REPR_KEYS_TO_DELETE)
+            self.cache.invalidate(ALL_VOLUMES_CACHE_KEY)
+            self.invalidate_static_cache(POOLS_CACHE_KEY)
             self.changed = True
         except Exception as generic_exc:
             self.failed = True
@@ -238,6 +466,10 @@ class VolumeManager(Ds8000ManagerBase):
     def _delete_volume(self, volume_id):
         try:
             self.client.delete_volume(volume_id)
+            self.cache.invalidate(ALL_VOLUMES_CACHE_KEY)
+            # A deleted volume is unmapped from its hosts.
+            self.cache.invalidate(VOLUME_MAPPING_MATRIX_CACHE_KEY)
+            self.invalidate_static_cache(POOLS_CACHE_KEY)
             self.changed = True
         except Exception as generic_exc:
             self.failed = True
@@ -249,6 +481,8 @@ class VolumeManager(Ds8000ManagerBase):
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
     argument_spec.update(
         name=dict(type='str'),
         state=dict(type='str', default=PRESENT, choices=[ABSENT, PRESENT]),
@@ -263,6 +497,9 @@ def main():
         alias_order=dict(type='str', default='decrement', choices=['decrement', 'increment']),
         ckd_base_ids=dict(type='list', elements='str'),
         quantity=dict(type='int', default=1),
+        placement=dict(type='str', choices=[ROUND_ROBIN, MOST_FREE, RANK_EVEN]),
+        placement_pools=dict(type='list', elements='str'),
+        placement_lss=dict(type='list', elements='str'),
     )
 
     module = AnsibleModule(
@@ -271,7 +508,7 @@ def main():
             ['state', PRESENT, ('name', 'alias'), True],
             ['state', ABSENT, ('id',)],
         ],
-        required_by={'alias': ('ckd_base_ids', 'id'), 'name': ('capacity', 'pool')},
+        required_by={'alias': ('ckd_base_ids', 'id'), 'name': ('capacity',), 'placement_pools': ('placement',), 'placement_lss': ('placement',)},
         mutually_exclusive=[
             ['alias', 'name'],
             ['alias', 'volume_type'],
@@ -280,10 +517,17 @@ def main():
             ['alias', 'capacity_type'],
             ['alias', 'lss'],
             ['alias', 'storage_allocation_method'],
+            ['alias', 'placement'],
+            ['placement', 'pool'],
+            ['placement', 'lss'],
+            ['placement', 'id'],
         ],
         supports_check_mode=False,
     )
 
+    if module.params['name'] and not module.params['pool'] and not module.params['placement']:
+        module.fail_json(msg="missing parameter(s) required by 'name': pool or placement")
+
     volume_manager = VolumeManager(module)
 
     if module.params['state'] == PRESENT:
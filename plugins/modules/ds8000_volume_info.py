@@ -38,8 +38,12 @@ options:
     type: str
 notes:
   - Supports C(check_mode).
+  - When I(cache_ttl) is set and no filter is set, the listing of all the volumes is cached and reused by the following runs.
+    The cache is invalidated when M(ibm.ds8000.ds8000_volume) creates or deletes volumes.
+  - When I(static_cache_ttl) is set, the pool listing that all the volumes are listed by is cached.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -192,7 +196,7 @@ volumes:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec, ds8000_cache_argument_spec
 
 # The REST API returns links or even not the key. pyds8k representation returns as links or with values containing empty strings.
 REPR_KEYS_TO_DELETE = ['link', 'hosts', 'flashcopy', 'pprc']
@@ -248,6 +252,7 @@ class VolumesInformer(Ds8000ManagerBase):
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_cache_argument_spec())
     argument_spec.update(id=dict(type='list', elements='str', aliases=['volume_id']), host=dict(type='str'), pool=dict(type='str'), lss=dict(type='str'))
 
     module = AnsibleModule(
@@ -32,18 +32,36 @@ options:
       - absent
   volume_id:
     description:
-      - The volume ID of the volume that you want to map to a host.
-    type: str
+      - The volume IDs of the volumes that you want to map to a host.
+      - The mappings of the host are read once for all the volume IDs.
+    type: list
+    elements: str
   volume_name:
     description:
       - The volume name that you want to map to a host.
       - Notice that different volumes sometimes have the same volume name, so it will map all of them.
       - To use a specific volume, use I(volume_id)
     type: str
+  pool:
+    description:
+      - The pool id that the volume named I(volume_name) belongs to.
+      - Only the volumes of this pool are searched for I(volume_name).
+    type: str
+    version_added: "1.2.0"
+  lss:
+    description:
+      - The logical subsystem (lss) that the volume named I(volume_name) belongs to.
+      - Only the volumes of this lss are searched for I(volume_name).
+    type: str
+    version_added: "1.2.0"
 notes:
   - Supports C(check_mode).
+  - When I(volume_name) is set without I(pool) or I(lss), the volumes of all pools are listed concurrently.
+    Set I(cache_ttl) to reuse that listing across tasks.
 extends_documentation_fragment:
   - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
 '''
 
 EXAMPLES = r'''
@@ -64,16 +82,77 @@ EXAMPLES = r'''
     name: host_name_test
     state: absent
     volume_id: "0000"
+
+- name: Ensure that the volumes named my_volume in lss 10 are mapped to a host in the storage
+  ibm.ds8000.ds8000_volume_mapping:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    name: host_name_test
+    state: present
+    volume_name: my_volume
+    lss: "10"
+
+- name: Ensure that several volumes are mapped to a host in the storage
+  ibm.ds8000.ds8000_volume_mapping:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    name: host_name_test
+    state: present
+    volume_id:
+      - "0000"
+      - "0001"
 '''
 
-RETURN = r''' # '''
+RETURN = r'''
+volume_mappings:
+    description: A list of dictionaries describing the action taken on each volume.
+    returned: success
+    type: list
+    elements: dict
+    version_added: "1.2.0"
+    contains:
+      volume_id:
+        description: The volume ID.
+        type: str
+        sample: "0000"
+      action:
+        description:
+          - The action taken on the volume mapping.
+          - C(map) maps the volume to the host, C(unmap) unmaps it and C(none) means the volume is already in the requested state.
+        type: str
+        sample: "map"
+    sample: |
+      [
+        {
+          "volume_id": "0000",
+          "action": "map"
+        }
+      ]
+'''
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.common.text.converters import to_native
-from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import Ds8000ManagerBase, ds8000_argument_spec
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+    VOLUME_MAPPING_MATRIX_CACHE_KEY,
+)
+
+NO_ACTION = 'none'
+MAP = 'map'
+UNMAP = 'unmap'
 
 
 class VolumeMapper(Ds8000ManagerBase):
+    def __init__(self, module):
+        super(VolumeMapper, self).__init__(module)
+        self.volume_mappings = None
+        self.volume_mapping_info = []
+
     def ensure_volume_mapped_to_host(self, volume_id):
         result = self._verify_volume_mapping_state(volume_id, self._map_volume_to_host)
         return result
@@ -87,21 +166,23 @@ class VolumeMapper(Ds8000ManagerBase):
         volume_map = None
         for volume_map in volume_mapping_on_host:
             if volume_id == volume_map.volume:
-                volume_mapping_state(volume_id, volume_map)
+                self.volume_mapping_info.append({'volume_id': volume_id, 'action': volume_mapping_state(volume_id, volume_map)})
                 return {'changed': self.changed, 'failed': self.failed}
-        volume_mapping_state(volume_id, volume_map)
+        self.volume_mapping_info.append({'volume_id': volume_id, 'action': volume_mapping_state(volume_id, volume_map)})
 
         return {'changed': self.changed, 'failed': self.failed}
 
     def _map_volume_to_host(self, volume_id, volume_map_on_the_host):
         if volume_map_on_the_host:
             if volume_id == volume_map_on_the_host.volume:
-                return
+                return NO_ACTION
         name = self.params['name']
         try:
             if not self.module.check_mode:
                 self.client.map_volume_to_host(host_name=name, volume_id=volume_id)
+                self.cache.invalidate(VOLUME_MAPPING_MATRIX_CACHE_KEY)
             self.changed = True
+            return MAP
         except Exception as generic_exc:
             self.failed = True
             self.module.fail_json(
@@ -110,24 +191,28 @@ class VolumeMapper(Ds8000ManagerBase):
             )
 
     def _get_volumes_mapping_on_specific_host(self):
-        name = self.params['name']
-        volume_mappings = []
-        volume_mappings_by_host = self.client.get_mappings_by_host(host_name=name)
-        for volume_map in volume_mappings_by_host:
-            volume_mappings.append(volume_map)
-        return volume_mappings
+        # The mappings are read once per run, every requested volume ID is checked against the same listing.
+        if self.volume_mappings is None:
+            name = self.params['name']
+            self.volume_mappings = []
+            volume_mappings_by_host = self.client.get_mappings_by_host(host_name=name)
+            for volume_map in volume_mappings_by_host:
+                self.volume_mappings.append(volume_map)
+        return self.volume_mappings
 
     def _unmap_volume_from_host(self, volume_id_on_the_host, volume_map):
         if not volume_map:
-            return
+            return NO_ACTION
         if volume_id_on_the_host != volume_map.volume:
-            return
+            return NO_ACTION
         name = self.params['name']
         lun_id = volume_map.lunid
         try:
             if not self.module.check_mode:
                 self.client.unmap_volume_from_host(host_name=name, lunid=lun_id)
+                self.cache.invalidate(VOLUME_MAPPING_MATRIX_CACHE_KEY)
             self.changed = True
+            return UNMAP
         except Exception as generic_exc:
             self.failed = True
             self.module.fail_json(
@@ -146,11 +231,15 @@ def ensure_volume_mapping_state(volume_id, module, volume_mapper):
 
 def main():
     argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
     argument_spec.update(
         name=dict(type='str', required=True),
         state=dict(type='str', default='present', choices=['absent', 'present']),
-        volume_id=dict(type='str'),
+        volume_id=dict(type='list', elements='str'),
         volume_name=dict(type='str'),
+        pool=dict(type='str'),
+        lss=dict(type='str'),
     )
 
     module = AnsibleModule(
@@ -158,6 +247,7 @@ def main():
         required_one_of=[
             ['volume_name', 'volume_id'],
         ],
+        required_by={'pool': 'volume_name', 'lss': 'volume_name'},
         supports_check_mode=True,
     )
 
@@ -165,11 +255,15 @@ def main():
 
     if volume_mapper.verify_ds8000_object_exist(volume_mapper.client.get_host, host_name=module.params['name']):
         if module.params.get('volume_name'):
-            volume_ids = volume_mapper.get_volume_ids_from_name(module.params['volume_name'])
-            for volume_id in volume_ids:
-                result = ensure_volume_mapping_state(volume_id, module, volume_mapper)
+            volume_ids = volume_mapper.get_volume_ids_from_name(module.params['volume_name'], pool=module.params['pool'], lss=module.params['lss'])
         else:
-            result = ensure_volume_mapping_state(module.params['volume_id'], module, volume_mapper)
+            volume_ids = []
+            for volume_id in module.params['volume_id']:
+                if volume_id not in volume_ids:
+                    volume_ids.append(volume_id)
+        for volume_id in volume_ids:
+            ensure_volume_mapping_state(volume_id, module, volume_mapper)
+        result = {'changed': volume_mapper.changed, 'failed': volume_mapper.failed, 'volume_mappings': volume_mapper.volume_mapping_info}
     else:
         volume_mapper.failed = True
         result = {'changed': volume_mapper.changed, 'failed': volume_mapper.failed}
@@ -0,0 +1,231 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: ds8000_volume_mapping_info
+short_description: Return info on DS8000 volume mappings
+description:
+  - Return the volume mappings of DS8000 hosts, indexed by host and by volume.
+  - The volume mappings of all the selected hosts are fetched concurrently.
+  - If the optional parameters are not set, the volume mappings of all hosts on the DS8000 storage system will be returned.
+version_added: "1.2.0"
+author: NjM3MjY5NzAgNzA3MzA3 (@NjM3MjY5NzAgNzA3MzA3)
+options:
+  host:
+    description:
+      - List of DS8000 host names to query.
+    type: list
+    elements: str
+  volume_id:
+    description:
+      - List of volume IDs to query.
+    type: list
+    elements: str
+  pool:
+    description:
+      - The pool id that the mapped volumes belong to.
+    type: str
+notes:
+  - Supports C(check_mode).
+  - When I(cache_ttl) is set, the mapping matrix of all hosts is cached and reused by the following runs.
+    The cache is invalidated when M(ibm.ds8000.ds8000_volume_mapping) changes a volume mapping, when M(ibm.ds8000.ds8000_host)
+    creates or deletes a host and when M(ibm.ds8000.ds8000_volume) deletes a volume.
+  - The mappings of a requested I(host) that is not in the cached matrix are read from the DS8000 storage system.
+extends_documentation_fragment:
+  - ibm.ds8000.ds8000.documentation
+  - ibm.ds8000.ds8000.concurrency
+  - ibm.ds8000.ds8000.cache
+'''
+
+EXAMPLES = r'''
+- name: get the hosts that a volume is mapped to
+  ibm.ds8000.ds8000_volume_mapping_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    volume_id: "1000"
+  register: result
+- debug:
+    var: result.hosts_by_volume['1000']
+
+- name: get the volume mappings of some hosts
+  ibm.ds8000.ds8000_volume_mapping_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    host:
+      - host_name_test
+      - host_name_test_2
+
+- name: get all the volume mappings of a pool and cache the mapping matrix for 10 minutes
+  ibm.ds8000.ds8000_volume_mapping_info:
+    hostname: "{{ ds8000_host }}"
+    username: "{{ ds8000_username }}"
+    password: "{{ ds8000_password }}"
+    pool: P0
+    cache_ttl: 600
+'''
+
+RETURN = r'''
+mappings:
+  description: A list of dictionaries describing the volume mappings.
+  returned: success
+  type: list
+  elements: dict
+  contains:
+    host:
+      description: The host name.
+      type: str
+      sample: 'ansible'
+    volume_id:
+      description: The volume ID.
+      type: str
+      sample: '1000'
+    lunid:
+      description: The LUN ID.
+      type: str
+      sample: '40104000'
+  sample: |
+    [
+        {
+            "host": "ansible",
+            "lunid": "40104000",
+            "volume_id": "1000"
+        }
+    ]
+volumes_by_host:
+  description: A dictionary of the volume mappings, keyed by host name.
+  returned: success
+  type: dict
+  sample: |
+    {
+        "ansible": [
+            {
+                "lunid": "40104000",
+                "volume_id": "1000"
+            }
+        ]
+    }
+hosts_by_volume:
+  description: A dictionary of the volume mappings, keyed by volume ID.
+  returned: success
+  type: dict
+  sample: |
+    {
+        "1000": [
+            {
+                "host": "ansible",
+                "lunid": "40104000"
+            }
+        ]
+    }
+'''
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+from ansible_collections.ibm.ds8000.plugins.module_utils.ds8000 import (
+    Ds8000ManagerBase,
+    ds8000_argument_spec,
+    ds8000_cache_argument_spec,
+    ds8000_concurrency_argument_spec,
+    VOLUME_MAPPING_MATRIX_CACHE_KEY,
+)
+
+
+class VolumeMappingInformer(Ds8000ManagerBase):
+    def volume_mapping_info(self):
+        mapping_matrix = self._get_mapping_matrix()
+        volume_ids = self._get_volume_ids_filter()
+
+        mappings = []
+        volumes_by_host = {}
+        hosts_by_volume = {}
+        for host_name in sorted(mapping_matrix):
+            for volume_map in mapping_matrix[host_name]:
+                if volume_ids is not None and volume_map['volume_id'] not in volume_ids:
+                    continue
+                mappings.append(dict(host=host_name, volume_id=volume_map['volume_id'], lunid=volume_map['lunid']))
+                volumes_by_host.setdefault(host_name, []).append(dict(volume_id=volume_map['volume_id'], lunid=volume_map['lunid']))
+                hosts_by_volume.setdefault(volume_map['volume_id'], []).append(dict(host=host_name, lunid=volume_map['lunid']))
+
+        return {'mappings': mappings, 'volumes_by_host': volumes_by_host, 'hosts_by_volume': hosts_by_volume}
+
+    def _get_mapping_matrix(self):
+        # The cached matrix always holds every host, so it can answer any host filter.
+        mapping_matrix = self.cache.get(VOLUME_MAPPING_MATRIX_CACHE_KEY)
+        if mapping_matrix is None:
+            if self.params['host']:
+                return self._collect_mapping_matrix(self.params['host'])
+            mapping_matrix = self._collect_mapping_matrix([host.name for host in self.client.get_hosts()])
+            self.cache.set(VOLUME_MAPPING_MATRIX_CACHE_KEY, mapping_matrix)
+
+        if self.params['host']:
+            # A host created after the matrix was cached is read live, a host that does not exist fails as without the cache.
+            missing_hosts = [host_name for host_name in self.params['host'] if host_name not in mapping_matrix]
+            if missing_hosts:
+                mapping_matrix = dict(mapping_matrix)
+                mapping_matrix.update(self._collect_mapping_matrix(missing_hosts))
+            return dict((host_name, mapping_matrix[host_name]) for host_name in self.params['host'])
+        return mapping_matrix
+
+    def _collect_mapping_matrix(self, host_names):
+        mapping_matrix = {}
+        errors = []
+        for host_name, volume_mappings, error in self.run_concurrently(self._get_mappings_by_host, host_names):
+            if error:
+                errors.append("{host_name}: {error}".format(host_name=host_name, error=to_native(error)))
+                continue
+            mapping_matrix[host_name] = volume_mappings
+        if errors:
+            self.failed = True
+            self.module.fail_json(
+                msg="Failed to get the volume mappings of the hosts on the DS8000 storage system. ERR: {errors}".format(errors='; '.join(errors))
+            )
+        return mapping_matrix
+
+    def _get_mappings_by_host(self, host_name):
+        return [dict(volume_id=volume_map.volume, lunid=volume_map.lunid) for volume_map in self.client.get_mappings_by_host(host_name=host_name)]
+
+    def _get_volume_ids_filter(self):
+        volume_ids = None
+        if self.params['volume_id']:
+            volume_ids = set(self.params['volume_id'])
+        if self.params['pool']:
+            if self.verify_ds8000_object_exist(self.client.get_pool, pool_id=self.params['pool']):
+                pool_volume_ids = set(volume.id for volume in self.client.get_volumes_by_pool(pool_id=self.params['pool']))
+                volume_ids = pool_volume_ids if volume_ids is None else volume_ids & pool_volume_ids
+        return volume_ids
+
+
+def main():
+    argument_spec = ds8000_argument_spec()
+    argument_spec.update(ds8000_concurrency_argument_spec())
+    argument_spec.update(ds8000_cache_argument_spec())
+    argument_spec.update(
+        host=dict(type='list', elements='str'),
+        volume_id=dict(type='list', elements='str'),
+        pool=dict(type='str'),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+    )
+
+    volume_mapping_informer = VolumeMappingInformer(module)
+
+    result = volume_mapping_informer.volume_mapping_info()
+
+    module.exit_json(changed=volume_mapping_informer.changed, **result)
+
+
+if __name__ == '__main__':
+    main()
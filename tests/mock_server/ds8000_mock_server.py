@@ -0,0 +1,1045 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+'''A local stand-in for the DS8000 REST API, for running the collection without a storage system.
+
+Implements the /api/v1 endpoints that pyds8k calls for the objects this collection manages, over an in-memory
+object graph that is loaded from a dataset file and changed by the requests it serves.
+See README.md in this directory for the usage.
+'''
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import copy
+import json
+import math
+import random
+import re
+import ssl
+import sys
+import threading
+import time
+import uuid
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, unquote, urlsplit
+except ImportError:
+    pass
+
+API_PREFIX = '/api/v1'
+MOCK_PREFIX = '/mock'
+DEFAULT_PORT = 8452
+DEFAULT_USERNAME = 'admin'
+DEFAULT_PASSWORD = 'admin'
+DEFAULT_TOKEN_TTL = 3600
+DEFAULT_ERROR_STATUS = 503
+
+GIB = 1024**3
+CYLINDER_BYTES = 849960
+MOD1_CYLINDERS = 1113
+BLOCK_BYTES = 512
+LSS_VOLUME_SLOTS = 256
+# LSS FF is reserved on the storage system.
+MAX_LSS_ID = 0xFE
+DEFAULT_RESOURCE_GROUP_ID = 'RG0'
+DEFAULT_RESOURCE_GROUP_LABEL = 'PUBLIC'
+
+SUCCESS_MESSAGE = 'Operation done successfully.'
+BAD_REQUEST = (400, 'BadRequest')
+UNAUTHORIZED = (401, 'Unauthorized')
+NOT_FOUND = (404, 'NotFound')
+CONFLICT = (409, 'Conflict')
+# The collections of the dataset, in the order they are loaded.
+COLLECTIONS = ['system', 'resource_groups', 'pools', 'marrays', 'lss', 'volumes', 'hosts', 'host_ports', 'mappings']
+
+
+class MockError(Exception):
+    '''An error returned to the client, with the HTTP status and the server code and message of the DS8000 REST API.'''
+
+    def __init__(self, error, message):
+        super(MockError, self).__init__(message)
+        self.status, self.code = error
+        self.message = message
+
+
+class Ds8000State(object):
+    '''The object graph of a mock storage system.
+
+    Related objects are referenced by id, the links of the REST API are added when the objects are rendered.
+    All the methods must be called with the lock held.
+    '''
+
+    def __init__(self, dataset):
+        self.lock = threading.RLock()
+        self.dataset = copy.deepcopy(dataset)
+        self.reset()
+
+    def reset(self):
+        dataset = copy.deepcopy(self.dataset)
+        self.system = dataset.get('system') or default_system()
+        self.resource_groups = index_by(dataset.get('resource_groups') or [default_resource_group()], 'id')
+        self.pools = index_by(dataset.get('pools', []), 'id')
+        self.marrays = index_by(dataset.get('marrays', []), 'id')
+        self.lss = index_by(dataset.get('lss', []), 'id')
+        self.volumes = {}
+        self.volumes_by_lss = {}
+        self.volumes_by_pool = {}
+        for volume in dataset.get('volumes', []):
+            self._add_volume(volume)
+        self.hosts = index_by(dataset.get('hosts', []), 'name')
+        self.host_ports = index_by(dataset.get('host_ports', []), 'wwpn')
+        self.mappings = dict((name, {}) for name in self.hosts)
+        for host_name, volume_maps in dataset.get('mappings', {}).items():
+            for volume_map in volume_maps:
+                self.mappings.setdefault(host_name, {})[volume_map['lunid']] = volume_map['volume']
+
+    def export(self):
+        return dict(
+            system=self.system,
+            resource_groups=list(self.resource_groups.values()),
+            pools=list(self.pools.values()),
+            marrays=list(self.marrays.values()),
+            lss=sorted_values(self.lss),
+            volumes=sorted_values(self.volumes),
+            hosts=list(self.hosts.values()),
+            host_ports=list(self.host_ports.values()),
+            mappings=dict(
+                (host_name, [dict(lunid=lunid, volume=volume_id) for lunid, volume_id in sorted(volume_maps.items())])
+                for host_name, volume_maps in self.mappings.items()
+            ),
+        )
+
+    # Lookups
+
+    def get(self, collection, object_id, description):
+        try:
+            return getattr(self, collection)[object_id]
+        except KeyError:
+            raise MockError(NOT_FOUND, "The {description} {object_id} does not exist.".format(description=description, object_id=object_id))
+
+    def get_host_ports_by_host(self):
+        host_ports_by_host = {}
+        for host_port in self.host_ports.values():
+            host_ports_by_host.setdefault(host_port.get('host'), []).append(host_port)
+        return host_ports_by_host
+
+    def get_volume_ids_by_host(self, host_name):
+        self.get('hosts', host_name, 'host')
+        return [volume_id for lunid, volume_id in sorted(self.mappings.get(host_name, {}).items())]
+
+    # Volumes
+
+    def create_volumes(self, params):
+        if params.get('alias') in ('true', True):
+            return self._create_alias_volumes(params)
+
+        pool = self.get('pools', params.get('pool', ''), 'pool')
+        stgtype = params.get('stgtype', 'fb').lower()
+        if pool['stgtype'].lower() != stgtype:
+            raise MockError(BAD_REQUEST, "The pool {pool} does not hold {stgtype} volumes.".format(pool=pool['id'], stgtype=stgtype))
+        cap_bytes = get_capacity_bytes(params.get('cap'), params.get('captype', 'gib'), stgtype)
+
+        names = params.get('namecol') or []
+        ids = params.get('ids') or []
+        quantity = len(ids) or int(params.get('quantity') or 0) or len(names) or 1
+        names = names or [params.get('name', '')] * quantity
+        if ids and len(ids) != quantity or len(names) != quantity:
+            raise MockError(BAD_REQUEST, "The number of volume names and IDs must match the quantity {quantity}.".format(quantity=quantity))
+
+        outcomes = []
+        allocated_ids = set()
+        for index in range(quantity):
+            try:
+                volume_id = ids[index].upper() if ids else self._allocate_volume_id(pool, stgtype, params.get('lss'), allocated_ids)
+                allocated_ids.add(volume_id)
+                outcomes.append(self._create_volume(volume_id, names[index], cap_bytes, pool, stgtype, params.get('tp') or 'none'))
+            except MockError as error:
+                outcomes.append(error)
+        return outcomes
+
+    def _create_volume(self, volume_id, name, cap_bytes, pool, stgtype, tp):
+        if not re.match(r'^[0-9A-F]{4}$', volume_id):
+            raise MockError(BAD_REQUEST, "The volume ID {volume_id} is not valid.".format(volume_id=volume_id))
+        if volume_id in self.volumes:
+            raise MockError(CONFLICT, "The volume {volume_id} already exists.".format(volume_id=volume_id))
+        lss = self._get_volume_lss(volume_id[:2], pool, stgtype)
+        extents = int(math.ceil(float(cap_bytes) / GIB))
+        if tp == 'ese':
+            pool['virtual_capacity_allocated_on_ese'] = str(int(pool.get('virtual_capacity_allocated_on_ese') or 0) + extents)
+        else:
+            if int(pool.get('capavail') or 0) < extents:
+                raise MockError(BAD_REQUEST, "The pool {pool} does not have enough available capacity.".format(pool=pool['id']))
+            pool['capalloc'] = str(int(pool.get('capalloc') or 0) + extents)
+            pool['capavail'] = str(int(pool.get('capavail') or 0) - extents)
+        volume = dict(
+            id=volume_id,
+            name=name,
+            state='normal',
+            cap=str(cap_bytes),
+            stgtype=stgtype.upper() if stgtype == 'fb' else stgtype,
+            VOLSER='',
+            lss=lss['id'],
+            allocmethod='rotateexts',
+            tp=tp,
+            MTM='2107-900' if stgtype == 'fb' else '3390-A',
+            datatype='FB 512' if stgtype == 'fb' else '3390-A',
+            easytier=pool.get('easytier', 'managed'),
+            tieralloc=[dict(tier=pool_tier.get('tier', 'ENT'), allocated=str(cap_bytes)) for pool_tier in (pool.get('tieralloc') or [{}])[:1]],
+            pool=pool['id'],
+            resource_group=lss.get('resource_group', DEFAULT_RESOURCE_GROUP_ID),
+        )
+        if stgtype == 'ckd':
+            volume['capcyl'] = str(int(cap_bytes // CYLINDER_BYTES))
+        self._add_volume(volume)
+        return volume
+
+    def _create_alias_volumes(self, params):
+        base_ids = [base_id.upper() for base_id in params.get('ckd_base_ids') or []]
+        quantity = int(params.get('quantity') or 1)
+        step = 1 if params.get('alias_create_order') == 'increment' else -1
+        next_id = int(params.get('id', '0'), 16)
+        outcomes = []
+        for base_id in base_ids:
+            base = self.get('volumes', base_id, 'base volume')
+            if base['stgtype'] != 'ckd' or base.get('basevolume', base_id) != base_id:
+                raise MockError(BAD_REQUEST, "The volume {base_id} is not a CKD base volume.".format(base_id=base_id))
+            for dummy in range(quantity):
+                alias_id = '%04X' % next_id
+                next_id += step
+                if alias_id[:2] != base['lss']:
+                    outcomes.append(MockError(BAD_REQUEST, "The alias {alias_id} is not in the LSS of {base_id}.".format(alias_id=alias_id, base_id=base_id)))
+                elif alias_id in self.volumes:
+                    outcomes.append(MockError(CONFLICT, "The volume {alias_id} already exists.".format(alias_id=alias_id)))
+                else:
+                    alias = dict(base, id=alias_id, name='', cap='0', capcyl='0', basevolume=base_id, tieralloc=[])
+                    self._add_volume(alias)
+                    outcomes.append(alias)
+        return outcomes
+
+    def _allocate_volume_id(self, pool, stgtype, lss_id, allocated_ids):
+        # Without an LSS, fill the LSSes that already hold volumes of the pool, then the other LSSes of the pool node,
+        # then the next free LSS of that node.
+        if lss_id:
+            lss_ids = [lss_id.upper()]
+        else:
+            node = int(pool.get('node') or 0)
+            lss_ids = [lss['id'] for lss in sorted_values(self.lss) if lss['type'] == stgtype and int(lss['id'], 16) % 2 == node]
+            pool_lss_ids = set(volume['lss'] for volume in self.volumes_by_pool.get(pool['id'], {}).values())
+            lss_ids.sort(key=lambda candidate_lss_id: candidate_lss_id not in pool_lss_ids)
+            if stgtype == 'fb':
+                lss_ids += ['%02X' % lss_number for lss_number in range(node, MAX_LSS_ID + 1, 2) if '%02X' % lss_number not in self.lss]
+        for candidate_lss_id in lss_ids:
+            used_ids = self.volumes_by_lss.get(candidate_lss_id, {})
+            for slot in range(LSS_VOLUME_SLOTS):
+                volume_id = '{lss}{slot:02X}'.format(lss=candidate_lss_id, slot=slot)
+                if volume_id not in used_ids and volume_id not in allocated_ids:
+                    return volume_id
+        raise MockError(BAD_REQUEST, "There is no free volume ID for pool {pool}.".format(pool=pool['id']))
+
+    def _get_volume_lss(self, lss_id, pool, stgtype):
+        # FB LSSes are created with their first volume, CKD LSSes must be created first.
+        lss = self.lss.get(lss_id)
+        if int(lss_id, 16) > MAX_LSS_ID:
+            raise MockError(BAD_REQUEST, "The LSS {lss_id} is reserved.".format(lss_id=lss_id))
+        if int(lss_id, 16) % 2 != int(pool.get('node') or 0):
+            raise MockError(BAD_REQUEST, "The LSS {lss_id} does not belong to the node of pool {pool}.".format(lss_id=lss_id, pool=pool['id']))
+        if lss is None:
+            if stgtype != 'fb':
+                raise MockError(NOT_FOUND, "The LSS {lss_id} does not exist.".format(lss_id=lss_id))
+            lss = dict(id=lss_id, group=str(int(lss_id, 16) % 2), addrgrp=lss_id[0], type='fb', resource_group=DEFAULT_RESOURCE_GROUP_ID)
+            self.lss[lss_id] = lss
+        elif lss['type'] != stgtype:
+            raise MockError(BAD_REQUEST, "The LSS {lss_id} does not hold {stgtype} volumes.".format(lss_id=lss_id, stgtype=stgtype))
+        return lss
+
+    def update_volume(self, volume_id, params):
+        volume = self.get('volumes', volume_id, 'volume')
+        if 'name' in params:
+            volume['name'] = params['name']
+        return volume
+
+    def delete_volume(self, volume_id):
+        volume = self.get('volumes', volume_id, 'volume')
+        aliases = [alias_id for alias_id, alias in self.volumes_by_lss.get(volume['lss'], {}).items() if alias.get('basevolume') == volume_id != alias_id]
+        if aliases:
+            raise MockError(CONFLICT, "The volume {volume_id} has alias volumes.".format(volume_id=volume_id))
+        for volume_maps in self.mappings.values():
+            for lunid in [lunid for lunid, mapped_volume_id in volume_maps.items() if mapped_volume_id == volume_id]:
+                del volume_maps[lunid]
+        pool = self.pools.get(volume['pool'])
+        if pool and volume.get('basevolume', volume_id) == volume_id:
+            extents = int(math.ceil(float(volume['cap']) / GIB))
+            if volume.get('tp') == 'ese':
+                pool['virtual_capacity_allocated_on_ese'] = str(max(int(pool.get('virtual_capacity_allocated_on_ese') or 0) - extents, 0))
+            else:
+                pool['capalloc'] = str(max(int(pool.get('capalloc') or 0) - extents, 0))
+                pool['capavail'] = str(int(pool.get('capavail') or 0) + extents)
+        self._remove_volume(volume)
+
+    def _add_volume(self, volume):
+        self.volumes[volume['id']] = volume
+        self.volumes_by_lss.setdefault(volume['lss'], {})[volume['id']] = volume
+        self.volumes_by_pool.setdefault(volume['pool'], {})[volume['id']] = volume
+
+    def _remove_volume(self, volume):
+        del self.volumes[volume['id']]
+        del self.volumes_by_lss[volume['lss']][volume['id']]
+        del self.volumes_by_pool[volume['pool']][volume['id']]
+
+    # Hosts, host ports and mappings
+
+    def create_host(self, params):
+        name = params.get('name', '')
+        if not name:
+            raise MockError(BAD_REQUEST, "The host name is required.")
+        if name in self.hosts:
+            raise MockError(CONFLICT, "The host {name} already exists.".format(name=name))
+        host = dict(
+            name=name,
+            state='offline',
+            hosttype=params.get('hosttype', ''),
+            addrmode='SCSI mask',
+            addrdiscovery='reportlun',
+            lbs='512',
+            resource_group=DEFAULT_RESOURCE_GROUP_ID,
+        )
+        self.hosts[name] = host
+        self.mappings[name] = {}
+        return host
+
+    def delete_host(self, name):
+        self.get('hosts', name, 'host')
+        for wwpn in [wwpn for wwpn, host_port in self.host_ports.items() if host_port.get('host') == name]:
+            del self.host_ports[wwpn]
+        del self.hosts[name]
+        self.mappings.pop(name, None)
+
+    def create_host_port(self, params):
+        wwpn = params.get('wwpn', '').upper()
+        if not re.match(r'^[0-9A-F]{16}$', wwpn):
+            raise MockError(BAD_REQUEST, "The WWPN {wwpn} is not valid.".format(wwpn=wwpn))
+        if wwpn in self.host_ports:
+            raise MockError(CONFLICT, "The host port {wwpn} already exists.".format(wwpn=wwpn))
+        self.get('hosts', params.get('host', ''), 'host')
+        host_port = dict(wwpn=wwpn, state='logged out', host=params['host'])
+        self.host_ports[wwpn] = host_port
+        return host_port
+
+    def update_host_port(self, wwpn, params):
+        host_port = self.get('host_ports', wwpn, 'host port')
+        if 'host' in params:
+            self.get('hosts', params['host'], 'host')
+            host_port['host'] = params['host']
+        return host_port
+
+    def map_volumes(self, host_name, params):
+        self.get('hosts', host_name, 'host')
+        requested = [(None, volume_id) for volume_id in params.get('volumes') or []]
+        for volume_map in params.get('mappings') or []:
+            requested.extend(volume_map.items())
+        volume_maps = self.mappings.setdefault(host_name, {})
+        outcomes = []
+        for lunid, volume_id in requested:
+            volume_id = volume_id.upper()
+            try:
+                self.get('volumes', volume_id, 'volume')
+                if volume_id in volume_maps.values():
+                    raise MockError(CONFLICT, "The volume {volume_id} is already mapped to host {host}.".format(volume_id=volume_id, host=host_name))
+                lunid = (lunid or get_default_lunid(volume_id, volume_maps)).upper()
+                if lunid in volume_maps:
+                    raise MockError(CONFLICT, "The LUN ID {lunid} is already used on host {host}.".format(lunid=lunid, host=host_name))
+                volume_maps[lunid] = volume_id
+                outcomes.append(dict(lunid=lunid, volume=volume_id))
+            except MockError as error:
+                outcomes.append(error)
+        return outcomes
+
+    def unmap_volume(self, host_name, lunid):
+        self.get('hosts', host_name, 'host')
+        if self.mappings.get(host_name, {}).pop(lunid.upper(), None) is None:
+            raise MockError(NOT_FOUND, "The LUN ID {lunid} is not mapped to host {host}.".format(lunid=lunid, host=host_name))
+
+    # LSSes
+
+    def create_lss(self, params):
+        lss_id = params.get('id', '').upper()
+        if not re.match(r'^[0-9A-F]{2}$', lss_id) or int(lss_id, 16) > MAX_LSS_ID:
+            raise MockError(BAD_REQUEST, "The LSS ID {lss_id} is not valid.".format(lss_id=lss_id))
+        if lss_id in self.lss:
+            raise MockError(CONFLICT, "The LSS {lss_id} already exists.".format(lss_id=lss_id))
+        ssid = params.get('sub_system_identifier', '').upper()
+        self._check_ssid(ssid)
+        lss = dict(
+            id=lss_id,
+            group=str(int(lss_id, 16) % 2),
+            addrgrp=lss_id[0],
+            type=params.get('type', 'ckd'),
+            sub_system_identifier=ssid,
+            ckd_base_cu_type=params.get('ckd_base_cu_type', '3990-6'),
+            resource_group=DEFAULT_RESOURCE_GROUP_ID,
+        )
+        self.lss[lss_id] = lss
+        return lss
+
+    def update_lss(self, lss_id, params):
+        lss = self.get('lss', lss_id, 'LSS')
+        if params.get('sub_system_identifier'):
+            ssid = params['sub_system_identifier'].upper()
+            if ssid != lss.get('sub_system_identifier'):
+                self._check_ssid(ssid)
+            lss['sub_system_identifier'] = ssid
+        if params.get('ckd_base_cu_type'):
+            lss['ckd_base_cu_type'] = params['ckd_base_cu_type']
+        return lss
+
+    def delete_lss(self, lss_id):
+        self.get('lss', lss_id, 'LSS')
+        if self.volumes_by_lss.get(lss_id):
+            raise MockError(CONFLICT, "The LSS {lss_id} has volumes.".format(lss_id=lss_id))
+        del self.lss[lss_id]
+
+    def _check_ssid(self, ssid):
+        if not re.match(r'^[0-9A-F]{4}$', ssid):
+            raise MockError(BAD_REQUEST, "The subsystem identifier {ssid} is not valid.".format(ssid=ssid))
+        if any(lss.get('sub_system_identifier') == ssid for lss in self.lss.values()):
+            raise MockError(CONFLICT, "The subsystem identifier {ssid} is already used.".format(ssid=ssid))
+
+    # Resource groups
+
+    def create_resource_group(self, params):
+        label = params.get('label', '')
+        if not label:
+            raise MockError(BAD_REQUEST, "The resource group label is required.")
+        if any(resource_group['label'] == label for resource_group in self.resource_groups.values()):
+            raise MockError(CONFLICT, "The resource group label {label} is already used.".format(label=label))
+        resource_group_id = params.get('id', '').upper()
+        if not resource_group_id:
+            numbers = [int(existing_id[2:]) for existing_id in self.resource_groups if existing_id[2:].isdigit()]
+            resource_group_id = 'RG{number}'.format(number=max(numbers + [0]) + 1)
+        elif resource_group_id in self.resource_groups:
+            raise MockError(CONFLICT, "The resource group {rg} already exists.".format(rg=resource_group_id))
+        resource_group = dict(
+            id=resource_group_id,
+            name=params.get('name', ''),
+            state='normal',
+            label=label,
+            cs_global=label,
+            pass_global=label,
+            gm_masters=[],
+            gm_sessions=[],
+        )
+        self.resource_groups[resource_group_id] = resource_group
+        return resource_group
+
+    def update_resource_group(self, resource_group_id, params):
+        resource_group = self.get('resource_groups', resource_group_id, 'resource group')
+        for key in ('label', 'name', 'cs_global', 'pass_global', 'gm_masters', 'gm_sessions'):
+            if params.get(key) not in (None, ''):
+                resource_group[key] = params[key]
+        return resource_group
+
+    def delete_resource_group(self, resource_group_id):
+        self.get('resource_groups', resource_group_id, 'resource group')
+        if resource_group_id == DEFAULT_RESOURCE_GROUP_ID:
+            raise MockError(BAD_REQUEST, "The default resource group can not be deleted.")
+        del self.resource_groups[resource_group_id]
+
+
+class Renderer(object):
+    '''Renders the objects of the state as the representations of the REST API, with the links of the mock server.'''
+
+    def __init__(self, state, base_url):
+        self.state = state
+        self.base_url = base_url
+        self._host_ports_by_host = None
+
+    def link(self, *path):
+        return {'rel': 'self', 'href': '/'.join([self.base_url] + list(path))}
+
+    def related(self, collection, object_id, id_field='id'):
+        if not object_id:
+            return ''
+        return {id_field: object_id, 'link': self.link(collection, object_id)}
+
+    def system(self, system):
+        return dict(system, link=self.link('systems', system['id']))
+
+    def pool(self, pool):
+        return dict(pool, link=self.link('pools', pool['id']), eserep='', tserep='', volumes={'link': self.link('pools', pool['id'], 'volumes')})
+
+    def marray(self, marray):
+        return dict(marray, link=self.link('marrays', marray['id']), pool=self.related('pools', marray.get('pool')))
+
+    def volume(self, volume):
+        rendered = dict(volume, link=self.link('volumes', volume['id']), pool=self.related('pools', volume['pool']), lss=self.related('lss', volume['lss']))
+        if volume.get('basevolume'):
+            rendered['basevolume'] = self.related('volumes', volume['basevolume'])
+        return rendered
+
+    def host(self, host):
+        volume_maps = sorted(self.state.mappings.get(host['name'], {}).items())
+        return dict(
+            host,
+            link=self.link('hosts', host['name']),
+            host_ports_briefs=[dict(wwpn=host_port['wwpn']) for host_port in self.host_ports_by_host.get(host['name'], [])],
+            mappings_briefs=[dict(lunid=lunid, volume_id=volume_id) for lunid, volume_id in volume_maps],
+            host_ports={'link': self.link('hosts', host['name'], 'host_ports')},
+            volumes={'link': self.link('hosts', host['name'], 'volumes')},
+            mappings={'link': self.link('hosts', host['name'], 'mappings')},
+            ioports={'link': self.link('hosts', host['name'], 'ioports')},
+        )
+
+    @property
+    def host_ports_by_host(self):
+        # Built once per request, a host listing would otherwise walk every host port for each host.
+        if self._host_ports_by_host is None:
+            self._host_ports_by_host = self.state.get_host_ports_by_host()
+        return self._host_ports_by_host
+
+    def host_port(self, host_port):
+        host = self.state.hosts.get(host_port.get('host'), {})
+        return dict(
+            host_port,
+            link=self.link('host_ports', host_port['wwpn']),
+            host=self.related('hosts', host_port.get('host'), id_field='name'),
+            hosttype=host.get('hosttype', ''),
+            addrdiscovery=host.get('addrdiscovery', ''),
+            lbs=host.get('lbs', ''),
+            login_ports=[],
+        )
+
+    def mapping(self, host_name, lunid, volume_id):
+        return dict(lunid=lunid, volume=self.related('volumes', volume_id), link=self.link('hosts', host_name, 'mappings', lunid))
+
+    def lss(self, lss):
+        return dict(
+            lss,
+            link=self.link('lss', lss['id']),
+            configvols=str(len(self.state.volumes_by_lss.get(lss['id'], {}))),
+            volumes={'link': self.link('lss', lss['id'], 'volumes')},
+        )
+
+    def resource_group(self, resource_group):
+        return dict(resource_group, link=self.link('resource_groups', resource_group['id']))
+
+
+class MockServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, state, options):
+        HTTPServer.__init__(self, address, RequestHandler)
+        self.state = state
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.faults = [parse_fault(fault) for fault in options.fault or []]
+        self.tokens = {}
+        self.stats = {}
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'DS8000MockHMC/1.0'
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def do_PUT(self):
+        self.handle_request('PUT')
+
+    def do_PATCH(self):
+        self.handle_request('PUT')
+
+    def do_DELETE(self):
+        self.handle_request('DELETE')
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def handle_request(self, method):
+        url = urlsplit(self.path)
+        path = unquote(url.path).rstrip('/')
+        query = dict((key, values[-1]) for key, values in parse_qs(url.query).items())
+        params = self.read_params()
+        try:
+            if path.startswith(MOCK_PREFIX):
+                status, body = self.handle_control(method, path[len(MOCK_PREFIX) :], params)
+            elif path.startswith(API_PREFIX):
+                status, body = self.handle_api(method, path[len(API_PREFIX) :], query, params)
+            else:
+                raise MockError(NOT_FOUND, "The URL {path} does not exist.".format(path=path))
+        except MockError as error:
+            status, body = error.status, failed_body(error)
+        self.send_json(status, body)
+
+    def read_params(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            return {}
+        if isinstance(body, dict) and isinstance(body.get('request'), dict):
+            return body['request'].get('params') or {}
+        return body
+
+    def send_json(self, status, body):
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def handle_control(self, method, path, params):
+        # The endpoints of the mock itself: the request counters, the current state, a reset and the runtime settings.
+        server = self.server
+        with server.state.lock:
+            if path == '/stats' and method == 'GET':
+                return 200, dict(requests=server.stats, total=sum(server.stats.values()))
+            if path == '/stats' and method == 'DELETE':
+                server.stats.clear()
+                return 200, ok_body()
+            if path == '/state' and method == 'GET':
+                return 200, server.state.export()
+            if path == '/reset' and method == 'POST':
+                server.state.reset()
+                server.stats.clear()
+                return 200, ok_body()
+            if path == '/config' and method == 'GET':
+                return 200, dict(
+                    latency=server.options.latency, jitter=server.options.jitter, error_rate=server.options.error_rate, faults=server.options.fault or []
+                )
+            if path == '/config' and method == 'PUT':
+                for key in ('latency', 'jitter', 'error_rate'):
+                    if key in params:
+                        setattr(server.options, key, float(params[key]))
+                if 'faults' in params:
+                    server.options.fault = list(params['faults'])
+                    server.faults = [parse_fault(fault) for fault in server.options.fault]
+                return 200, ok_body()
+        raise MockError(NOT_FOUND, "The URL {path} does not exist.".format(path=MOCK_PREFIX + path))
+
+    def handle_api(self, method, path, query, params):
+        segments = path.strip('/').split('/') if path.strip('/') else []
+        if segments == ['tokens'] and method == 'POST':
+            return 200, self.create_token(params)
+
+        server = self.server
+        with server.state.lock:
+            # The request counters are keyed by the URL with the object ids replaced, such as GET /api/v1/hosts/{id}/mappings.
+            template = '/'.join('{id}' if index % 2 else segment for index, segment in enumerate(segments))
+            stat_key = '{method} {path}'.format(method=method, path=API_PREFIX + '/' + template)
+            server.stats[stat_key] = server.stats.get(stat_key, 0) + 1
+            self.check_token()
+            delay = server.options.latency + server.random.uniform(0, server.options.jitter)
+            fault = self.get_fault(method, path)
+        if delay:
+            time.sleep(delay / 1000.0)
+        if fault:
+            raise MockError(fault, "Injected fault for {method} {path}.".format(method=method, path=API_PREFIX + path))
+
+        host_header = self.headers.get('Host') or '{host}:{port}'.format(host=server.server_address[0], port=server.server_address[1])
+        scheme = 'https' if server.options.certfile else 'http'
+        with server.state.lock:
+            renderer = Renderer(server.state, '{scheme}://{host}{prefix}'.format(scheme=scheme, host=host_header, prefix=API_PREFIX))
+            return route(server.state, renderer, method, segments, query, params)
+
+    def create_token(self, params):
+        options = self.server.options
+        if params.get('username') != options.username or params.get('password') != options.password:
+            raise MockError(UNAUTHORIZED, "The user name or password is not valid.")
+        token = uuid.uuid4().hex
+        expiry = time.time() + options.token_ttl
+        with self.server.state.lock:
+            self.server.tokens[token] = expiry
+        return dict(
+            ok_body(),
+            token=dict(token=token, expired_time=time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(expiry)), max_idle_interval=str(options.token_ttl * 1000)),
+        )
+
+    def check_token(self):
+        expiry = self.server.tokens.get(self.headers.get('X-Auth-Token'))
+        if expiry is None or expiry < time.time():
+            raise MockError(UNAUTHORIZED, "The token is missing or expired.")
+
+    def get_fault(self, method, path):
+        # The faults given on the command line come first, in order, then the random errors.
+        for fault in self.server.faults:
+            if fault['method'] in ('*', method) and fault['pattern'].search(API_PREFIX + path) and fault['count'] != 0:
+                fault['count'] -= 1
+                return (fault['status'], 'InjectedFault')
+        if self.server.options.error_rate and self.server.random.random() < self.server.options.error_rate:
+            return (self.server.options.error_status, 'InjectedFault')
+        return None
+
+
+def route(state, renderer, method, segments, query, params):  # noqa: C901
+    collection = segments[0] if segments else ''
+    object_id = segments[1] if len(segments) > 1 else None
+    sub_collection = segments[2] if len(segments) > 2 else None
+    sub_id = segments[3] if len(segments) > 3 else None
+
+    if collection == 'systems' and method == 'GET':
+        return 200, listing('systems', [renderer.system(state.system)])
+
+    if collection == 'pools' and method == 'GET':
+        if object_id is None:
+            return 200, listing('pools', [renderer.pool(pool) for pool in state.pools.values()])
+        pool = state.get('pools', object_id, 'pool')
+        if sub_collection == 'volumes':
+            return 200, listing('volumes', [renderer.volume(volume) for volume in sorted_values(state.volumes_by_pool.get(pool['id'], {}))])
+        return 200, listing('pools', [renderer.pool(pool)])
+
+    if collection == 'marrays' and method == 'GET':
+        if object_id is None:
+            return 200, listing('marrays', [renderer.marray(marray) for marray in state.marrays.values()])
+        return 200, listing('marrays', [renderer.marray(state.get('marrays', object_id, 'marray'))])
+
+    if collection == 'volumes':
+        if method == 'GET':
+            if object_id is None:
+                return 200, listing('volumes', [renderer.volume(volume) for volume in sorted_values(state.volumes)])
+            return 200, listing('volumes', [renderer.volume(state.get('volumes', object_id.upper(), 'volume'))])
+        if method == 'POST' and object_id is None:
+            return created('volumes', [outcome if isinstance(outcome, MockError) else renderer.volume(outcome) for outcome in state.create_volumes(params)])
+        if method == 'PUT' and object_id:
+            state.update_volume(object_id.upper(), params)
+            return 200, ok_body()
+        if method == 'DELETE' and object_id:
+            state.delete_volume(object_id.upper())
+            return 200, ok_body()
+
+    if collection == 'hosts':
+        if object_id is not None:
+            host = state.get('hosts', object_id, 'host')
+        if method == 'GET':
+            if object_id is None:
+                return 200, listing('hosts', [renderer.host(host) for host in state.hosts.values()])
+            if sub_collection == 'volumes':
+                return 200, listing('volumes', [renderer.volume(state.volumes[volume_id]) for volume_id in state.get_volume_ids_by_host(object_id)])
+            if sub_collection == 'host_ports':
+                return 200, listing('host_ports', [renderer.host_port(host_port) for host_port in renderer.host_ports_by_host.get(object_id, [])])
+            if sub_collection == 'ioports':
+                return 200, listing('ioports', [])
+            if sub_collection == 'mappings':
+                volume_maps = state.mappings.get(object_id, {})
+                if sub_id is not None:
+                    if sub_id.upper() not in volume_maps:
+                        raise MockError(NOT_FOUND, "The LUN ID {lunid} is not mapped to host {host}.".format(lunid=sub_id, host=object_id))
+                    volume_maps = {sub_id.upper(): volume_maps[sub_id.upper()]}
+                return 200, listing('mappings', [renderer.mapping(object_id, lunid, volume_id) for lunid, volume_id in sorted(volume_maps.items())])
+            return 200, listing('hosts', [renderer.host(host)])
+        if method == 'POST' and object_id is None:
+            return created('hosts', [renderer.host(state.create_host(params))])
+        if method == 'POST' and sub_collection == 'mappings':
+            outcomes = state.map_volumes(object_id, params)
+            return created(
+                'mappings',
+                [outcome if isinstance(outcome, MockError) else renderer.mapping(object_id, outcome['lunid'], outcome['volume']) for outcome in outcomes],
+            )
+        if method == 'PUT' and sub_collection is None:
+            return 200, ok_body()
+        if method == 'DELETE' and sub_collection == 'mappings' and sub_id:
+            state.unmap_volume(object_id, sub_id)
+            return 200, ok_body()
+        if method == 'DELETE' and sub_collection is None:
+            state.delete_host(host['name'])
+            return 200, ok_body()
+
+    if collection == 'host_ports':
+        if method == 'GET':
+            if object_id is None:
+                return 200, listing('host_ports', [renderer.host_port(host_port) for host_port in state.host_ports.values()])
+            return 200, listing('host_ports', [renderer.host_port(state.get('host_ports', object_id.upper(), 'host port'))])
+        if method == 'POST' and object_id is None:
+            return created('host_ports', [renderer.host_port(state.create_host_port(params))])
+        if method == 'PUT' and object_id:
+            state.update_host_port(object_id.upper(), params)
+            return 200, ok_body()
+        if method == 'DELETE' and object_id:
+            state.get('host_ports', object_id.upper(), 'host port')
+            del state.host_ports[object_id.upper()]
+            return 200, ok_body()
+
+    if collection == 'lss':
+        if method == 'GET':
+            if object_id is None:
+                lss_type = query.get('type')
+                return 200, listing('lss', [renderer.lss(lss) for lss in sorted_values(state.lss) if not lss_type or lss['type'] == lss_type])
+            lss = state.get('lss', object_id.upper(), 'LSS')
+            if sub_collection == 'volumes':
+                return 200, listing('volumes', [renderer.volume(volume) for volume in sorted_values(state.volumes_by_lss.get(lss['id'], {}))])
+            return 200, listing('lss', [renderer.lss(lss)])
+        if method == 'POST' and object_id is None:
+            return created('lss', [renderer.lss(state.create_lss(params))])
+        if method == 'PUT' and object_id:
+            state.update_lss(object_id.upper(), params)
+            return 200, ok_body()
+        if method == 'DELETE' and object_id:
+            state.delete_lss(object_id.upper())
+            return 200, ok_body()
+
+    if collection == 'resource_groups':
+        if method == 'GET':
+            if object_id is None:
+                return 200, listing('resource_groups', [renderer.resource_group(resource_group) for resource_group in state.resource_groups.values()])
+            return 200, listing('resource_groups', [renderer.resource_group(state.get('resource_groups', object_id.upper(), 'resource group'))])
+        if method == 'POST' and object_id is None:
+            return created('resource_groups', [renderer.resource_group(state.create_resource_group(params))])
+        if method == 'PUT' and object_id:
+            state.update_resource_group(object_id.upper(), params)
+            return 200, ok_body()
+        if method == 'DELETE' and object_id:
+            state.delete_resource_group(object_id.upper())
+            return 200, ok_body()
+
+    raise MockError(NOT_FOUND, "The URL {method} {path} is not supported by the mock server.".format(method=method, path=API_PREFIX + '/' + '/'.join(segments)))
+
+
+def ok_body():
+    return {'server': {'status': 'ok', 'code': '', 'message': SUCCESS_MESSAGE}}
+
+
+def failed_body(error):
+    return {'server': {'status': 'failed', 'code': error.code, 'message': error.message}}
+
+
+def listing(resource_type, representations):
+    return dict(ok_body(), counts={'data_counts': len(representations), 'total_counts': len(representations)}, data={resource_type: representations})
+
+
+def created(resource_type, outcomes):
+    # A single object is returned as is, several objects as one response each, which holds the error of the failed ones.
+    responses = []
+    for outcome in outcomes:
+        if isinstance(outcome, MockError):
+            responses.append(failed_body(outcome))
+        else:
+            responses.append(dict(ok_body(), data={resource_type: [outcome]}, link=outcome['link']))
+    if len(responses) == 1:
+        if isinstance(outcomes[0], MockError):
+            raise outcomes[0]
+        return 201, responses[0]
+    return 201, {'responses': responses}
+
+
+def index_by(objects, key):
+    return dict((ds8000_object[key], ds8000_object) for ds8000_object in objects)
+
+
+def sorted_values(objects_by_id):
+    return [objects_by_id[object_id] for object_id in sorted(objects_by_id)]
+
+
+def get_capacity_bytes(capacity, captype, stgtype):
+    try:
+        capacity = int(capacity)
+    except (TypeError, ValueError):
+        raise MockError(BAD_REQUEST, "The capacity {capacity} is not valid.".format(capacity=capacity))
+    if captype == 'bytes':
+        return capacity
+    if captype == 'cyl' and stgtype == 'ckd':
+        return capacity * CYLINDER_BYTES
+    if captype == 'mod1' and stgtype == 'ckd':
+        return capacity * MOD1_CYLINDERS * CYLINDER_BYTES
+    if captype == 'blocks':
+        return capacity * BLOCK_BYTES
+    if captype == 'gib':
+        return capacity * GIB
+    raise MockError(BAD_REQUEST, "The capacity type {captype} is not valid for {stgtype} volumes.".format(captype=captype, stgtype=stgtype))
+
+
+def get_default_lunid(volume_id, volume_maps):
+    # The storage system derives the LUN ID from the volume ID, as 40LL40VV for volume LLVV.
+    lunid = '40{lss}40{volume}'.format(lss=volume_id[:2], volume=volume_id[2:])
+    if lunid not in volume_maps:
+        return lunid
+    return next('%08X' % number for number in range(len(volume_maps) + 1) if '%08X' % number not in volume_maps)
+
+
+def parse_fault(fault):
+    # METHOD:PATH_REGEX:STATUS[:COUNT], for example DELETE:/volumes/:500:1 fails the first volume deletion with a 500.
+    parts = fault.split(':')
+    if len(parts) not in (3, 4):
+        raise ValueError("The fault {fault} is not METHOD:PATH_REGEX:STATUS[:COUNT].".format(fault=fault))
+    return dict(method=parts[0].upper() or '*', pattern=re.compile(parts[1]), status=int(parts[2]), count=int(parts[3]) if len(parts) == 4 else -1)
+
+
+def default_system():
+    return dict(
+        id='2107-75MOCK1',
+        name='ds8000_mock',
+        state='online',
+        release='9.3',
+        bundle='89.30.100.0',
+        MTM='5341-996',
+        sn='75MOCK1',
+        wwnn='5005076309FFC5D5',
+        cap='6000',
+        capalloc='0',
+        capavail='6000',
+        capraw='7516192768000',
+    )
+
+
+def default_resource_group():
+    return dict(
+        id=DEFAULT_RESOURCE_GROUP_ID,
+        name='Default_Resource_Group',
+        state='normal',
+        label=DEFAULT_RESOURCE_GROUP_LABEL,
+        cs_global=DEFAULT_RESOURCE_GROUP_LABEL,
+        pass_global=DEFAULT_RESOURCE_GROUP_LABEL,
+        gm_masters=['%02X' % number for number in range(256)],
+        gm_sessions=['%02X' % number for number in range(256)],
+    )
+
+
+def default_dataset():
+    # A small storage system with the objects that the integration tests expect to exist.
+    def pool(pool_id, name, node, stgtype, cap):
+        return dict(
+            id=pool_id,
+            name=name,
+            node=node,
+            stgtype=stgtype,
+            cap=str(cap),
+            capalloc='0',
+            capavail=str(cap),
+            overprovisioned='0.0',
+            real_capacity_allocated_on_ese='0',
+            virtual_capacity_allocated_on_ese='0',
+            easytier='managed',
+            tieralloc=[dict(tier='ENT', assigned='0', cap=str(cap * GIB), allocated='0')],
+            threshold='15',
+        )
+
+    def volume(volume_id, name, pool_id, stgtype='fb', cap=GIB):
+        return dict(
+            id=volume_id,
+            name=name,
+            state='normal',
+            cap=str(cap),
+            stgtype='FB' if stgtype == 'fb' else stgtype,
+            VOLSER='',
+            lss=volume_id[:2],
+            allocmethod='rotateexts',
+            tp='none',
+            MTM='2107-900' if stgtype == 'fb' else '3390-A',
+            datatype='FB 512' if stgtype == 'fb' else '3390-A',
+            easytier='managed',
+            tieralloc=[dict(tier='ENT', allocated=str(cap))],
+            pool=pool_id,
+            resource_group=DEFAULT_RESOURCE_GROUP_ID,
+        )
+
+    def lss(lss_id, lss_type, ssid=''):
+        entry = dict(id=lss_id, group=str(int(lss_id, 16) % 2), addrgrp=lss_id[0], type=lss_type, resource_group=DEFAULT_RESOURCE_GROUP_ID)
+        if lss_type == 'ckd':
+            entry.update(sub_system_identifier=ssid, ckd_base_cu_type='3990-6')
+        return entry
+
+    ckd_cap = MOD1_CYLINDERS * CYLINDER_BYTES
+    volumes = [
+        volume('A000', 'janus_a000', 'P0'),
+        volume('B000', 'janus_b000', 'P0'),
+        volume('B001', 'janus_b001', 'P0'),
+        volume('B100', 'janus_b100', 'P1'),
+        volume('B101', 'janus_b101', 'P1'),
+        volume('0000', 'ckd_0000', 'P3', stgtype='ckd', cap=ckd_cap),
+        volume('2000', 'ckd_2000', 'P2', stgtype='ckd', cap=ckd_cap),
+    ]
+    dataset = dict(
+        system=default_system(),
+        resource_groups=[default_resource_group()],
+        pools=[
+            pool('P0', 'fb_pool_0', '0', 'fb', 2000),
+            pool('P1', 'fb_pool_1', '1', 'fb', 2000),
+            pool('P2', 'ckd_pool_0', '0', 'ckd', 1000),
+            pool('P3', 'ckd_pool_2', '0', 'ckd', 1000),
+        ],
+        marrays=[
+            dict(id='MA1', disk_class='enterprise', state='assigned', datastate='normal', raidtype='6', pool='P0'),
+            dict(id='MA2', disk_class='enterprise', state='assigned', datastate='normal', raidtype='6', pool='P1'),
+            dict(id='MA3', disk_class='enterprise', state='assigned', datastate='normal', raidtype='6', pool='P2'),
+            dict(id='MA4', disk_class='enterprise', state='assigned', datastate='normal', raidtype='6', pool='P3'),
+            dict(id='MA5', disk_class='enterprise', state='unassigned', datastate='normal', raidtype='unassigned', pool=''),
+        ],
+        lss=[lss('00', 'ckd', '5031'), lss('20', 'ckd', '5020'), lss('A0', 'fb'), lss('B0', 'fb'), lss('B1', 'fb')],
+        volumes=volumes,
+        hosts=[dict(name='janus', state='online', hosttype='pSeries', addrmode='SCSI mask', addrdiscovery='reportlun', lbs='512', resource_group='RG0')],
+        host_ports=[dict(wwpn='10000090FA8E52DE', state='logged in', host='janus'), dict(wwpn='10000090FA8E52DF', state='logged in', host='janus')],
+        mappings=dict(janus=[dict(lunid=get_default_lunid(volume_id, {}), volume=volume_id) for volume_id in ('A000', 'B000', 'B001', 'B100', 'B101')]),
+    )
+    for pool_entry in dataset['pools']:
+        used = sum(int(math.ceil(float(entry['cap']) / GIB)) for entry in volumes if entry['pool'] == pool_entry['id'])
+        pool_entry.update(capalloc=str(used), capavail=str(int(pool_entry['cap']) - used))
+    return dataset
+
+
+def load_dataset(path):
+    with open(path) as dataset_file:
+        dataset = json.load(dataset_file)
+    unknown = set(dataset) - set(COLLECTIONS)
+    if unknown:
+        raise ValueError("Unknown collections in {path}: {unknown}.".format(path=path, unknown=', '.join(sorted(unknown))))
+    return dataset
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Serve a mock DS8000 REST API for the ibm.ds8000 collection.')
+    parser.add_argument('--host', default='127.0.0.1', help='The address to listen on.')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='The port to listen on, the default is the port of the modules.')
+    parser.add_argument('--dataset', help='A JSON file with the objects of the storage system, instead of the built-in small storage system.')
+    parser.add_argument('--seed', type=int, default=0, help='The seed of the latency jitter and of the random errors.')
+    parser.add_argument('--latency', type=float, default=0.0, help='The delay added to every REST call, in milliseconds.')
+    parser.add_argument('--jitter', type=float, default=0.0, help='A random delay of up to this many milliseconds added to the latency.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='The fraction of the REST calls that fail with --error-status.')
+    parser.add_argument('--error-status', type=int, default=DEFAULT_ERROR_STATUS, help='The HTTP status of the random errors.')
+    parser.add_argument('--fault', action='append', help='METHOD:PATH_REGEX:STATUS[:COUNT], fail the matching REST calls. Can be repeated.')
+    parser.add_argument('--username', default=DEFAULT_USERNAME)
+    parser.add_argument('--password', default=DEFAULT_PASSWORD)
+    parser.add_argument('--token-ttl', type=int, default=DEFAULT_TOKEN_TTL, help='The number of seconds a token is valid for.')
+    parser.add_argument('--certfile', help='Serve HTTPS with this certificate, the default is HTTP.')
+    parser.add_argument('--keyfile', help='The private key of --certfile.')
+    parser.add_argument('--verbose', action='store_true', help='Log every request.')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    state = Ds8000State(load_dataset(options.dataset) if options.dataset else default_dataset())
+    server = MockServer((options.host, options.port), state, options)
+    if options.certfile:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(options.certfile, options.keyfile)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    print(
+        "DS8000 mock server listening on {scheme}://{host}:{port}{prefix}".format(
+            scheme='https' if options.certfile else 'http', host=options.host, port=server.server_address[1], prefix=API_PREFIX
+        )
+    )
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 IBM CORPORATION
+# Apache License, Version 2.0 (see https://opensource.org/licenses/Apache-2.0)
+
+'''Generate a synthetic DS8000 storage system for scale tests.
+
+The dataset is the same for a given seed and set of options. It is written in the --dataset format of ds8000_mock_server.py,
+or as the recorded responses of the REST API GET calls. See README.md in this directory for the usage.
+'''
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+
+from ds8000_mock_server import (
+    API_PREFIX,
+    GIB,
+    LSS_VOLUME_SLOTS,
+    MAX_LSS_ID,
+    MOD1_CYLINDERS,
+    CYLINDER_BYTES,
+    Ds8000State,
+    Renderer,
+    default_resource_group,
+    default_system,
+    get_default_lunid,
+    route,
+)
+
+LSS_PER_ADDRESS_GROUP = 16
+# The capacities of the FB volumes in GiB, with their weights.
+FB_VOLUME_SIZES = [(16, 10), (32, 10), (64, 20), (100, 15), (128, 15), (256, 15), (512, 8), (1024, 5), (2048, 2)]
+# The CKD volumes are 3390 models, in units of mod1.
+CKD_VOLUME_MODELS = [(3, 20), (9, 40), (27, 25), (54, 15)]
+POOL_TIERS = [['FlashTier0', 'FlashTier1'], ['FlashTier0', 'FlashTier2'], ['FlashTier1'], ['ENT', 'NL'], ['SSD', 'ENT', 'NL']]
+# The host types with their weights, the number of hosts that share their volumes and the first bytes of their WWPNs.
+HOST_TYPES = [
+    dict(hosttype='VMware', weight=50, cluster_size=(4, 8), prefix='VMW', wwpn_prefix='2100F4E9D4'),
+    dict(hosttype='pSeries', weight=25, cluster_size=(1, 2), prefix='AIX', wwpn_prefix='C050760A'),
+    dict(hosttype='Linux', weight=15, cluster_size=(1, 3), prefix='LNX', wwpn_prefix='10000090FA'),
+    dict(hosttype='Win2012', weight=10, cluster_size=(1, 2), prefix='WIN', wwpn_prefix='2100000E1E'),
+]
+DEFAULT_BASE_URL = 'https://localhost:8452' + API_PREFIX
+
+
+class DatasetGenerator(object):
+    '''Builds the object graph from a seeded random generator, walking the objects in a fixed order.'''
+
+    def __init__(self, options):
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.system = default_system()
+        self.resource_groups = [default_resource_group()]
+        self.pools = []
+        self.marrays = []
+        self.lss = []
+        self.volumes = []
+        self.hosts = []
+        self.host_ports = []
+        self.mappings = {}
+
+    def generate(self):
+        self._check_options()
+        self._generate_resource_groups()
+        self._generate_pools()
+        self._generate_lss()
+        self._generate_volumes()
+        self._generate_hosts()
+        self._generate_mappings()
+        self._update_pool_capacity()
+        self._generate_marrays()
+        return dict(
+            system=self.system,
+            resource_groups=self.resource_groups,
+            pools=self.pools,
+            marrays=self.marrays,
+            lss=self.lss,
+            volumes=self.volumes,
+            hosts=self.hosts,
+            host_ports=self.host_ports,
+            mappings=self.mappings,
+        )
+
+    def _check_options(self):
+        options = self.options
+        ckd_address_groups = int(math.ceil(float(options.ckd_lss) / LSS_PER_ADDRESS_GROUP))
+        if ckd_address_groups * LSS_PER_ADDRESS_GROUP + options.fb_lss > MAX_LSS_ID + 1:
+            raise ValueError(
+                "{fb_lss} FB LSSes do not fit after the address groups of {ckd_lss} CKD LSSes.".format(fb_lss=options.fb_lss, ckd_lss=options.ckd_lss)
+            )
+        if options.volumes > options.fb_lss * LSS_VOLUME_SLOTS or options.ckd_volumes > options.ckd_lss * LSS_VOLUME_SLOTS:
+            raise ValueError("There are more volumes than volume IDs in the LSSes.")
+        if options.ckd_volumes and not options.ckd_lss:
+            raise ValueError("CKD volumes need CKD LSSes.")
+        if options.volumes and not options.fb_lss or options.fb_lss and options.pools < 2:
+            raise ValueError("FB volumes need FB LSSes and at least 2 FB pools, one per node.")
+
+    def _generate_resource_groups(self):
+        for number in range(1, self.options.resource_groups):
+            label = 'TENANT{number:02d}'.format(number=number)
+            self.resource_groups.append(
+                dict(
+                    id='RG{number}'.format(number=number),
+                    name='tenant_{number:02d}'.format(number=number),
+                    state='normal',
+                    label=label,
+                    cs_global=label,
+                    pass_global=label,
+                    gm_masters=[],
+                    gm_sessions=[],
+                )
+            )
+
+    def _generate_pools(self):
+        # The pools alternate between the two nodes, the CKD pools come after the FB pools.
+        pool_types = ['fb'] * self.options.pools + ['ckd'] * (2 if self.options.ckd_lss else 0)
+        for number, stgtype in enumerate(pool_types):
+            tiers = self.random.choice(POOL_TIERS)
+            self.pools.append(
+                dict(
+                    id='P{number}'.format(number=number),
+                    name='{stgtype}_pool_{number}'.format(stgtype=stgtype, number=number),
+                    node=str(number % 2),
+                    stgtype=stgtype,
+                    cap='0',
+                    capalloc='0',
+                    capavail='0',
+                    overprovisioned='0.0',
+                    real_capacity_allocated_on_ese='0',
+                    virtual_capacity_allocated_on_ese='0',
+                    easytier='managed' if len(tiers) > 1 else 'none',
+                    tieralloc=[dict(tier=tier, assigned='0', cap='0', allocated='0') for tier in tiers],
+                    threshold='15',
+                )
+            )
+
+    def _generate_lss(self):
+        # An address group of 16 LSSes is either CKD or FB: the CKD LSSes fill the first address groups, the FB LSSes follow.
+        ckd_address_groups = int(math.ceil(float(self.options.ckd_lss) / LSS_PER_ADDRESS_GROUP))
+        lss_numbers = [('ckd', number) for number in range(self.options.ckd_lss)]
+        lss_numbers += [('fb', ckd_address_groups * LSS_PER_ADDRESS_GROUP + number) for number in range(self.options.fb_lss)]
+        pools_by_node = {}
+        for pool in self.pools:
+            pools_by_node.setdefault((pool['stgtype'], int(pool['node'])), []).append(pool)
+        for stgtype, number in lss_numbers:
+            lss_id = '%02X' % number
+            # The LSSes of a node are spread over the pools of that node, an even LSS belongs to node 0.
+            node_pools = pools_by_node[(stgtype, number % 2)]
+            lss = dict(
+                id=lss_id,
+                group=str(number % 2),
+                addrgrp=lss_id[0],
+                type=stgtype,
+                resource_group=self.resource_groups[number // LSS_PER_ADDRESS_GROUP % len(self.resource_groups)]['id'],
+                pool=node_pools[(number // 2) % len(node_pools)]['id'],
+            )
+            if stgtype == 'ckd':
+                lss.update(sub_system_identifier='%04X' % (0x1000 + number), ckd_base_cu_type='3990-6')
+            self.lss.append(lss)
+
+    def _generate_volumes(self):
+        pools_by_id = dict((pool['id'], pool) for pool in self.pools)
+        for stgtype, quantity in (('ckd', self.options.ckd_volumes), ('fb', self.options.volumes)):
+            lsses = [lss for lss in self.lss if lss['type'] == stgtype]
+            if not quantity:
+                continue
+            # The volumes are spread evenly over the LSSes, each LSS fills its volume IDs from 00.
+            for index, lss in enumerate(lsses):
+                count = quantity // len(lsses) + (1 if index < quantity % len(lsses) else 0)
+                for slot in range(count):
+                    self.volumes.append(self._generate_volume('{lss}{slot:02X}'.format(lss=lss['id'], slot=slot), lss, pools_by_id[lss['pool']]))
+        for lss in self.lss:
+            # The pool of an LSS is only a placement hint for the volumes, the REST API does not return it.
+            del lss['pool']
+
+    def _generate_volume(self, volume_id, lss, pool):
+        if lss['type'] == 'ckd':
+            cap_bytes = weighted_choice(self.random, CKD_VOLUME_MODELS) * MOD1_CYLINDERS * CYLINDER_BYTES
+            tp = 'none'
+        else:
+            cap_bytes = weighted_choice(self.random, FB_VOLUME_SIZES) * GIB
+            tp = 'ese' if self.random.random() < self.options.ese_fraction else 'none'
+        # A thin provisioned volume has only written part of its capacity, in whole extents.
+        extents = int(math.ceil(float(cap_bytes) / GIB))
+        allocated_extents = max(1, int(extents * self.random.uniform(0.05, 0.95))) if tp == 'ese' else extents
+        volume = dict(
+            id=volume_id,
+            name='',
+            state='normal',
+            cap=str(cap_bytes),
+            capalloc=str(allocated_extents * GIB),
+            real_cap=str(allocated_extents * GIB),
+            virtual_cap=str(cap_bytes),
+            stgtype='FB' if lss['type'] == 'fb' else lss['type'],
+            VOLSER='' if lss['type'] == 'fb' else 'V{volume_id}'.format(volume_id=volume_id),
+            lss=lss['id'],
+            allocmethod='managed',
+            tp=tp,
+            MTM='2107-900' if lss['type'] == 'fb' else '3390-A',
+            datatype='FB 512' if lss['type'] == 'fb' else '3390-A',
+            easytier=pool['easytier'],
+            tieralloc=self._split_over_tiers(allocated_extents, pool),
+            pool=pool['id'],
+            resource_group=lss['resource_group'],
+        )
+        if lss['type'] == 'ckd':
+            volume['name'] = 'ckd_{volume_id}'.format(volume_id=volume_id)
+            volume['capcyl'] = str(cap_bytes // CYLINDER_BYTES)
+        return volume
+
+    def _split_over_tiers(self, extents, pool):
+        # Easy Tier keeps most of the extents of a volume in the fastest tier.
+        tiers = [entry['tier'] for entry in pool['tieralloc']]
+        weights = [self.random.random() * (len(tiers) - index) ** 2 for index in range(len(tiers))]
+        tier_extents = [int(extents * weight / sum(weights)) for weight in weights]
+        tier_extents[0] += extents - sum(tier_extents)
+        return [dict(tier=tier, allocated=str(count * GIB)) for tier, count in zip(tiers, tier_extents) if count]
+
+    def _generate_hosts(self):
+        # The hosts are generated by cluster, the hosts of a cluster share their volumes.
+        self.clusters = []
+        counters = dict((host_type['prefix'], 0) for host_type in HOST_TYPES)
+        wwpn_numbers = dict((host_type['prefix'], 0) for host_type in HOST_TYPES)
+        while len(self.hosts) < self.options.hosts:
+            host_type = weighted_choice(self.random, [(entry, entry['weight']) for entry in HOST_TYPES])
+            cluster_size = min(self.random.randint(*host_type['cluster_size']), self.options.hosts - len(self.hosts))
+            counters[host_type['prefix']] += 1
+            cluster_name = '{prefix}{number:03d}'.format(prefix=host_type['prefix'].lower(), number=counters[host_type['prefix']])
+            cluster = dict(name=cluster_name, hosts=[])
+            for node in range(cluster_size):
+                host = dict(
+                    name='{cluster}_n{node}'.format(cluster=cluster_name, node=node + 1) if cluster_size > 1 else cluster_name,
+                    state='online',
+                    hosttype=host_type['hosttype'],
+                    addrmode='SCSI mask',
+                    addrdiscovery='reportlun' if host_type['hosttype'] == 'pSeries' else 'lunpolling',
+                    lbs='512',
+                    resource_group=self.resource_groups[len(self.clusters) % len(self.resource_groups)]['id'],
+                )
+                self.hosts.append(host)
+                cluster['hosts'].append(host['name'])
+            self.clusters.append(cluster)
+
+        # The WWPNs are spread over the hosts, a WWPN is the vendor prefix of the host type followed by a per type counter.
+        host_types = dict((entry['hosttype'], entry) for entry in HOST_TYPES)
+        for index in range(self.options.wwpns):
+            host = self.hosts[index % len(self.hosts)]
+            host_type = host_types[host['hosttype']]
+            wwpn_numbers[host_type['prefix']] += 1
+            wwpn = '{prefix}{number:0{width}X}'.format(
+                prefix=host_type['wwpn_prefix'], number=wwpn_numbers[host_type['prefix']], width=16 - len(host_type['wwpn_prefix'])
+            )
+            state = 'logged in' if self.random.random() < 0.95 else 'logged out'
+            self.host_ports.append(dict(wwpn=wwpn, state=state, host=host['name']))
+
+    def _generate_mappings(self):
+        # Each mapped FB volume belongs to one cluster and is mapped to all its hosts, the volume name tells the cluster.
+        self.mappings = dict((host['name'], []) for host in self.hosts)
+        fb_volumes = [volume for volume in self.volumes if volume['stgtype'] == 'FB']
+        volume_numbers = {}
+        for volume in fb_volumes:
+            if not self.clusters or self.random.random() >= self.options.mapped_fraction:
+                volume['name'] = 'unmapped_{volume_id}'.format(volume_id=volume['id'])
+                continue
+            cluster = self.random.choice(self.clusters)
+            volume_numbers[cluster['name']] = volume_numbers.get(cluster['name'], 0) + 1
+            volume['name'] = '{cluster}_vol{number:03d}'.format(cluster=cluster['name'], number=volume_numbers[cluster['name']])
+            for host_name in cluster['hosts']:
+                self.mappings[host_name].append(dict(lunid=get_default_lunid(volume['id'], {}), volume=volume['id']))
+
+    def _update_pool_capacity(self):
+        # Each pool is sized so that its allocated extents fill it to a random level.
+        for pool in self.pools:
+            volumes = [volume for volume in self.volumes if volume['pool'] == pool['id']]
+            standard_extents = sum(int(volume['cap']) // GIB for volume in volumes if volume['tp'] != 'ese')
+            ese_extents = sum(int(volume['capalloc']) // GIB for volume in volumes if volume['tp'] == 'ese')
+            ese_virtual_extents = sum(int(volume['cap']) // GIB for volume in volumes if volume['tp'] == 'ese')
+            allocated = standard_extents + ese_extents
+            cap = max(int(math.ceil(allocated / self.random.uniform(0.55, 0.9))), 1024)
+            pool.update(
+                cap=str(cap),
+                capalloc=str(allocated),
+                capavail=str(cap - allocated),
+                real_capacity_allocated_on_ese=str(ese_extents),
+                virtual_capacity_allocated_on_ese=str(ese_virtual_extents),
+                overprovisioned=str(round(float(standard_extents + ese_virtual_extents) / cap, 2)),
+            )
+            # The capacity of the tiers is in bytes, each tier is filled to the level of the pool.
+            tier_allocated = dict((entry['tier'], 0) for entry in pool['tieralloc'])
+            for volume in volumes:
+                for entry in volume['tieralloc']:
+                    tier_allocated[entry['tier']] += int(entry['allocated'])
+            for index, entry in enumerate(pool['tieralloc']):
+                if allocated:
+                    tier_cap = tier_allocated[entry['tier']] * cap // allocated
+                else:
+                    tier_cap = split_evenly(cap * GIB, len(pool['tieralloc']))[index]
+                entry.update(cap=str(tier_cap), allocated=str(tier_allocated[entry['tier']]))
+        self.system.update(
+            cap=str(sum(int(pool['cap']) for pool in self.pools)),
+            capalloc=str(sum(int(pool['capalloc']) for pool in self.pools)),
+            capavail=str(sum(int(pool['capavail']) for pool in self.pools)),
+            capraw=str(sum(int(pool['cap']) for pool in self.pools) * GIB),
+        )
+
+    def _generate_marrays(self):
+        # One array per tier of a pool and per 64 TiB of the pool, plus some spare unassigned arrays.
+        for pool in self.pools:
+            for entry in pool['tieralloc']:
+                for dummy in range(max(1, int(entry['cap']) // (64 * 1024 * GIB))):
+                    self.marrays.append(self._marray(entry['tier'], pool['id']))
+        for dummy in range(self.options.spare_marrays):
+            self.marrays.append(self._marray(self.random.choice(self.random.choice(POOL_TIERS)), ''))
+
+    def _marray(self, tier, pool_id):
+        return dict(
+            id='MA{number}'.format(number=len(self.marrays) + 1),
+            disk_class=tier.lower(),
+            state='assigned' if pool_id else 'unassigned',
+            datastate='normal',
+            raidtype='6' if pool_id else 'unassigned',
+            pool=pool_id,
+        )
+
+
+def weighted_choice(generator, choices):
+    total = sum(weight for dummy, weight in choices)
+    point = generator.uniform(0, total)
+    for value, weight in choices:
+        point -= weight
+        if point <= 0:
+            return value
+    return choices[-1][0]
+
+
+def split_evenly(total, parts):
+    return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
+
+
+def write_responses(dataset, directory, base_url):
+    # Record the GET responses of the mock server for the dataset, one file per URL, such as pools/P0/volumes.json.
+    state = Ds8000State(dataset)
+    renderer = Renderer(state, base_url)
+    urls = ['systems', 'pools', 'marrays', 'volumes', 'lss', 'hosts', 'host_ports', 'resource_groups']
+    urls += ['pools/{pool_id}/volumes'.format(pool_id=pool_id) for pool_id in sorted(state.pools)]
+    urls += ['lss/{lss_id}/volumes'.format(lss_id=lss_id) for lss_id in sorted(state.lss)]
+    for host_name in sorted(state.hosts):
+        urls += ['hosts/{host}/{related}'.format(host=host_name, related=related) for related in ('mappings', 'volumes', 'host_ports')]
+    for url in urls:
+        dummy, body = route(state, renderer, 'GET', url.split('/'), {}, {})
+        path = os.path.join(directory, *url.split('/')) + '.json'
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as response_file:
+            json.dump(body, response_file)
+    return len(urls)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic DS8000 storage system for scale tests.')
+    parser.add_argument('--seed', type=int, default=0, help='The seed of the generator, the same seed and options give the same dataset.')
+    parser.add_argument('--volumes', type=int, default=40000, help='The number of FB volumes.')
+    parser.add_argument('--ckd-volumes', type=int, default=0, help='The number of CKD volumes.')
+    parser.add_argument('--hosts', type=int, default=2000, help='The number of hosts.')
+    parser.add_argument('--wwpns', type=int, default=8000, help='The number of host ports, spread over the hosts.')
+    parser.add_argument('--fb-lss', type=int, default=255, help='The number of FB LSSes.')
+    parser.add_argument('--ckd-lss', type=int, default=0, help='The number of CKD LSSes, which take the first address groups.')
+    parser.add_argument('--pools', type=int, default=8, help='The number of FB pools, half on each node. 2 CKD pools are added with --ckd-lss.')
+    parser.add_argument('--resource-groups', type=int, default=4, help='The number of resource groups, including RG0.')
+    parser.add_argument('--ese-fraction', type=float, default=0.7, help='The fraction of the FB volumes that are thin provisioned.')
+    parser.add_argument('--mapped-fraction', type=float, default=0.9, help='The fraction of the FB volumes that are mapped to a host cluster.')
+    parser.add_argument('--spare-marrays', type=int, default=2, help='The number of unassigned arrays.')
+    parser.add_argument('--output', '-o', help='The dataset file to write, the default is the standard output.')
+    parser.add_argument('--responses', help='Also write the recorded GET responses of the dataset to this directory.')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='The REST API URL of the links in the recorded responses.')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    try:
+        dataset = DatasetGenerator(options).generate()
+    except ValueError as error:
+        sys.exit("Error: {error}".format(error=error))
+    if options.output:
+        with open(options.output, 'w') as dataset_file:
+            json.dump(dataset, dataset_file)
+    else:
+        json.dump(dataset, sys.stdout)
+    if options.responses:
+        count = write_responses(dataset, options.responses, options.base_url)
+        sys.stderr.write("Wrote {count} responses to {directory}\n".format(count=count, directory=options.responses))
+    sys.stderr.write(
+        "{volumes} volumes, {lss} LSSes, {pools} pools, {hosts} hosts, {host_ports} host ports, {mappings} mappings\n".format(
+            volumes=len(dataset['volumes']),
+            lss=len(dataset['lss']),
+            pools=len(dataset['pools']),
+            hosts=len(dataset['hosts']),
+            host_ports=len(dataset['host_ports']),
+            mappings=sum(len(volume_maps) for volume_maps in dataset['mappings'].values()),
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()